@@ -0,0 +1,29 @@
+"""Add (status, updated_at, slug) covering indexes for the sitemap endpoint
+
+Revision ID: h6i7j8k9l0m1
+Revises: g5h6i7j8k9l0
+Create Date: 2026-10-17
+
+GET /api/v1/sitemap selects slug and updated_at of published rows, optionally
+filtered by updated_at > since. These indexes answer it without reading rows.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'h6i7j8k9l0m1'
+down_revision = 'g5h6i7j8k9l0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_treks_status_updated_at_slug', 'treks', ['status', 'updated_at', 'slug'])
+    op.create_index('ix_expeditions_status_updated_at_slug', 'expeditions', ['status', 'updated_at', 'slug'])
+    op.create_index('ix_blog_posts_status_updated_at_slug', 'blog_posts', ['status', 'updated_at', 'slug'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blog_posts_status_updated_at_slug', table_name='blog_posts')
+    op.drop_index('ix_expeditions_status_updated_at_slug', table_name='expeditions')
+    op.drop_index('ix_treks_status_updated_at_slug', table_name='treks')
@@ -0,0 +1,91 @@
+"""Add the blog_posts_fts full-text search index
+
+Revision ID: i7j8k9l0m1n2
+Revises: h6i7j8k9l0m1
+Create Date: 2026-10-17
+
+FTS5 virtual table on SQLite, InnoDB table with a FULLTEXT key on MySQL (other
+backends keep the ILIKE search and get nothing here). Backfilled from blog_posts;
+afterwards the ORM mapper events in app.crud.blog_search keep it in sync.
+"""
+import html
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i7j8k9l0m1n2'
+down_revision = 'h6i7j8k9l0m1'
+branch_labels = None
+depends_on = None
+
+FTS_TABLE = 'blog_posts_fts'
+BATCH_SIZE = 500
+
+CREATE_INDEX_SQL = {
+    'sqlite': (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, excerpt, body, tokenize = 'porter unicode61')"
+    ),
+    'mysql': (
+        f"CREATE TABLE IF NOT EXISTS {FTS_TABLE} ("
+        "post_id INT NOT NULL PRIMARY KEY, "
+        "title VARCHAR(255) NOT NULL, "
+        "excerpt TEXT NULL, "
+        "body LONGTEXT NOT NULL, "
+        "FULLTEXT KEY ft_blog_posts_fts (title, excerpt, body)"
+        ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+    ),
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _html_to_text(value):
+    if not value:
+        return ''
+    return _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', value))).strip()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    statement = CREATE_INDEX_SQL.get(conn.dialect.name)
+    if statement is None:
+        return
+    op.execute(statement)
+
+    id_column = 'rowid' if conn.dialect.name == 'sqlite' else 'post_id'
+    fts = sa.table(
+        FTS_TABLE, sa.column(id_column, sa.Integer), sa.column('title'), sa.column('excerpt'), sa.column('body')
+    )
+    posts = sa.table(
+        'blog_posts', sa.column('id', sa.Integer), sa.column('title'), sa.column('excerpt'), sa.column('content')
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(posts.c.id, posts.c.title, posts.c.excerpt, posts.c.content)
+            .where(posts.c.id > last_id)
+            .order_by(posts.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        op.bulk_insert(fts, [
+            {
+                id_column: row.id,
+                'title': row.title or '',
+                'excerpt': _html_to_text(row.excerpt),
+                'body': _html_to_text(row.content),
+            }
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name in CREATE_INDEX_SQL:
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
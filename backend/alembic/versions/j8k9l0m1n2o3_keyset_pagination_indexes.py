@@ -0,0 +1,39 @@
+"""Add (sort key, id) indexes for keyset pagination of list endpoints
+
+Revision ID: j8k9l0m1n2o3
+Revises: i7j8k9l0m1n2
+Create Date: 2026-10-17
+
+Each list is ordered by its default sort key plus id as the tie-breaker; with
+?cursor= the next page is a seek on this index (key < :last OR key = :last AND
+id < :last_id) instead of an OFFSET scan. Media is already covered by
+ix_media_created_at.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'j8k9l0m1n2o3'
+down_revision = 'i7j8k9l0m1n2'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_leads_created_at_id', 'leads', ['created_at', 'id']),
+    ('ix_email_logs_sent_at_id', 'email_logs', ['sent_at', 'id']),
+    ('ix_contact_messages_created_at_id', 'contact_messages', ['created_at', 'id']),
+    ('ix_bookings_created_at_id', 'bookings', ['created_at', 'id']),
+    ('ix_treks_created_at_id', 'treks', ['created_at', 'id']),
+    ('ix_expeditions_updated_at_id', 'expeditions', ['updated_at', 'id']),
+    ('ix_blog_posts_created_at_id', 'blog_posts', ['created_at', 'id']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
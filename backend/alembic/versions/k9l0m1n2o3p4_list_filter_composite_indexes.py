@@ -0,0 +1,75 @@
+"""Add composite (filter, sort key, id) indexes for the hot list queries
+
+Revision ID: k9l0m1n2o3p4
+Revises: j8k9l0m1n2o3
+Create Date: 2026-10-17
+
+The public and admin lists filter on an equality column (status, featured,
+category, type, folder) and sort newest first or by a sort= key, with id as the
+tie-breaker. Leading with the filter and following with the sort key lets one
+index range return a page already in order, instead of reading every matching
+row into a temporary sort. tests/test_query_plans.py keeps these paths off full
+table scans.
+
+trek_batches is created by create_all() rather than a migration, so its
+(trek_id, start_date) index - which replaces the single-column trek_id index
+behind Trek.batches - is only touched when the table exists.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'k9l0m1n2o3p4'
+down_revision = 'j8k9l0m1n2o3'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_treks_status_created_at_id', 'treks', ['status', 'created_at', 'id']),
+    ('ix_treks_status_featured_created_at_id', 'treks', ['status', 'featured', 'created_at', 'id']),
+    ('ix_treks_status_price_id', 'treks', ['status', 'price', 'id']),
+    ('ix_treks_status_rating_id', 'treks', ['status', 'rating', 'id']),
+    ('ix_treks_status_review_count_rating_id', 'treks', ['status', 'review_count', 'rating', 'id']),
+    ('ix_blog_posts_status_created_at_id', 'blog_posts', ['status', 'created_at', 'id']),
+    (
+        'ix_blog_posts_category_id_status_created_at_id', 'blog_posts',
+        ['category_id', 'status', 'created_at', 'id'],
+    ),
+    ('ix_blog_post_tags_tag_id_post_id', 'blog_post_tags', ['tag_id', 'post_id']),
+    ('ix_leads_status_created_at_id', 'leads', ['status', 'created_at', 'id']),
+    ('ix_bookings_status_created_at_id', 'bookings', ['status', 'created_at', 'id']),
+    ('ix_contact_messages_status_created_at_id', 'contact_messages', ['status', 'created_at', 'id']),
+    ('ix_email_logs_email_type_sent_at_id', 'email_logs', ['email_type', 'sent_at', 'id']),
+    ('ix_email_logs_status_sent_at_id', 'email_logs', ['status', 'sent_at', 'id']),
+    ('ix_media_folder_created_at_id', 'media', ['folder', 'created_at', 'id']),
+)
+
+
+def _trek_batch_indexes():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('trek_batches'):
+        return None
+    return {index['name'] for index in inspector.get_indexes('trek_batches')}
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+    existing = _trek_batch_indexes()
+    if existing is not None:
+        # Create the composite first: on MySQL it takes over the foreign key's index
+        op.create_index('ix_trek_batches_trek_id_start_date', 'trek_batches', ['trek_id', 'start_date'])
+        if 'ix_trek_batches_trek_id' in existing:
+            op.drop_index('ix_trek_batches_trek_id', table_name='trek_batches')
+
+
+def downgrade() -> None:
+    existing = _trek_batch_indexes()
+    if existing is not None:
+        op.create_index('ix_trek_batches_trek_id', 'trek_batches', ['trek_id'])
+        op.drop_index('ix_trek_batches_trek_id_start_date', table_name='trek_batches')
+
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
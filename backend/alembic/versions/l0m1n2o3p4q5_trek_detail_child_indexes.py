@@ -0,0 +1,52 @@
+"""Index the trek and expedition detail collections by parent id
+
+Revision ID: l0m1n2o3p4q5
+Revises: k9l0m1n2o3p4
+Create Date: 2026-10-17
+
+Detail pages now load each collection with its own
+``WHERE <parent>_id IN (...) ORDER BY ...`` query (selectin loading) instead of
+one joined statement. Without an index on the parent id every such query scans
+the whole child table; (parent id, order column) serves both the lookup and
+the relationship's order_by.
+
+These tables are created by create_all() rather than a migration, so each
+index is only touched when its table exists.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'l0m1n2o3p4q5'
+down_revision = 'k9l0m1n2o3p4'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_trek_images_trek_id_display_order', 'trek_images', ['trek_id', 'display_order']),
+    ('ix_itinerary_days_trek_id_day', 'itinerary_days', ['trek_id', 'day']),
+    ('ix_trek_faqs_trek_id_display_order', 'trek_faqs', ['trek_id', 'display_order']),
+    ('ix_expedition_days_expedition_id_day', 'expedition_days', ['expedition_id', 'day']),
+)
+
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        existing = _existing_indexes(table)
+        if existing is not None and name in existing:
+            op.drop_index(name, table_name=table)
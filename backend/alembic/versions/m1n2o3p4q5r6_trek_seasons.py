@@ -0,0 +1,62 @@
+"""Add trek_seasons, the normalized best_season entries behind the season filter
+
+Revision ID: m1n2o3p4q5r6
+Revises: l0m1n2o3p4q5
+Create Date: 2026-10-17
+
+The season list filter matched a quoted month inside the serialized
+best_season JSON, a substring scan no index can serve. trek_seasons holds one
+(trek_id, month) row per best_season entry, kept in sync by the mapper events
+in app/crud/trek_seasons.py; the (month, trek_id) index turns the filter into
+a range lookup. Existing treks are backfilled here.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'm1n2o3p4q5r6'
+down_revision = 'l0m1n2o3p4q5'
+branch_labels = None
+depends_on = None
+
+MAX_MONTH_LENGTH = 50
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    seasons = op.create_table(
+        'trek_seasons',
+        sa.Column('trek_id', sa.Integer(), sa.ForeignKey('treks.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('month', sa.String(MAX_MONTH_LENGTH), nullable=False),
+        sa.PrimaryKeyConstraint('trek_id', 'month'),
+    )
+    op.create_index('ix_trek_seasons_month_trek_id', 'trek_seasons', ['month', 'trek_id'])
+
+    treks = sa.table('treks', sa.column('id', sa.Integer), sa.column('best_season', sa.JSON))
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(treks.c.id, treks.c.best_season)
+            .where(treks.c.id > last_id)
+            .order_by(treks.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        entries = []
+        for trek_id, best_season in rows:
+            months = []
+            for value in best_season or ():
+                if isinstance(value, str) and value and len(value) <= MAX_MONTH_LENGTH and value not in months:
+                    months.append(value)
+            entries.extend({'trek_id': trek_id, 'month': month} for month in months)
+        if entries:
+            op.bulk_insert(seasons, entries)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trek_seasons_month_trek_id', table_name='trek_seasons')
+    op.drop_table('trek_seasons')
@@ -0,0 +1,85 @@
+"""Add media_tag_names and media_tags, the normalized media tags
+
+Revision ID: n2o3p4q5r6s7
+Revises: m1n2o3p4q5r6
+Create Date: 2026-10-17
+
+Tag filtering matched JSON containment on media.tags and the tag list counted
+tags by loading every media row. media_tag_names is the tag dictionary (one
+row per distinct name) and media_tags the (media_id, tag_id) association,
+indexed both ways, kept in sync by app/crud/media_tags.py. Existing tags are
+backfilled here; media.tags stays as the copy returned by the API. Names use a
+binary collation so tags differing only in case or accents stay distinct, and
+are stripped because MySQL still ignores trailing spaces under it.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = 'n2o3p4q5r6s7'
+down_revision = 'm1n2o3p4q5r6'
+branch_labels = None
+depends_on = None
+
+MAX_TAG_LENGTH = 100
+BATCH_SIZE = 500
+
+
+def _names(tags):
+    seen = []
+    for value in tags or ():
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if value and len(value) <= MAX_TAG_LENGTH and value not in seen:
+            seen.append(value)
+    return seen
+
+
+def upgrade() -> None:
+    tag_names = op.create_table(
+        'media_tag_names',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column(
+            'name',
+            sa.String(MAX_TAG_LENGTH).with_variant(mysql.VARCHAR(MAX_TAG_LENGTH, collation='utf8mb4_bin'), 'mysql'),
+            nullable=False,
+            unique=True,
+        ),
+    )
+    media_tags = op.create_table(
+        'media_tags',
+        sa.Column('media_id', sa.Integer(), sa.ForeignKey('media.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('tag_id', sa.Integer(), sa.ForeignKey('media_tag_names.id', ondelete='CASCADE'), primary_key=True),
+    )
+    op.create_index('ix_media_tags_tag_id_media_id', 'media_tags', ['tag_id', 'media_id'])
+
+    media = sa.table('media', sa.column('id', sa.Integer), sa.column('tags', sa.JSON))
+    conn = op.get_bind()
+    ids = {}
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(media.c.id, media.c.tags).where(media.c.id > last_id).order_by(media.c.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        new_names = [name for row in rows for name in _names(row.tags) if name not in ids]
+        new_names = list(dict.fromkeys(new_names))
+        if new_names:
+            op.bulk_insert(tag_names, [{'name': name} for name in new_names])
+            ids.update(conn.execute(
+                sa.select(tag_names.c.name, tag_names.c.id).where(tag_names.c.name.in_(new_names))
+            ).all())
+        pairs = [{'media_id': row.id, 'tag_id': ids[name]} for row in rows for name in _names(row.tags)]
+        if pairs:
+            op.bulk_insert(media_tags, pairs)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_media_tags_tag_id_media_id', table_name='media_tags')
+    op.drop_table('media_tags')
+    op.drop_table('media_tag_names')
@@ -0,0 +1,50 @@
+"""Add materialized post_count to blog categories and tags
+
+Revision ID: o3p4q5r6s7t8
+Revises: n2o3p4q5r6s7
+Create Date: 2026-10-17
+
+The category tree and tag list aggregated blog_posts and blog_post_tags with
+GROUP BY on every request. post_count is now stored on each category and tag,
+adjusted in the same transaction as post writes (app/crud/blog_counts.py), and
+backfilled here. `reconcile-blog-counts` recounts after out-of-band writes.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'o3p4q5r6s7t8'
+down_revision = 'n2o3p4q5r6s7'
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    return column in [c["name"] for c in inspect(conn).get_columns(table)]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not _column_exists(conn, 'blog_categories', 'post_count'):
+        op.add_column('blog_categories', sa.Column('post_count', sa.Integer(), nullable=False, server_default='0'))
+    if not _column_exists(conn, 'blog_tags', 'post_count'):
+        op.add_column('blog_tags', sa.Column('post_count', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        "UPDATE blog_categories SET post_count = "
+        "(SELECT COUNT(*) FROM blog_posts WHERE blog_posts.category_id = blog_categories.id)"
+    )
+    op.execute(
+        "UPDATE blog_tags SET post_count = "
+        "(SELECT COUNT(*) FROM blog_post_tags WHERE blog_post_tags.tag_id = blog_tags.id)"
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if _column_exists(conn, 'blog_tags', 'post_count'):
+        op.drop_column('blog_tags', 'post_count')
+    if _column_exists(conn, 'blog_categories', 'post_count'):
+        op.drop_column('blog_categories', 'post_count')
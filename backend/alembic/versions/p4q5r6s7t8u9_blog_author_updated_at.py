@@ -0,0 +1,43 @@
+"""Add updated_at to blog authors
+
+Revision ID: p4q5r6s7t8u9
+Revises: o3p4q5r6s7t8
+Create Date: 2026-10-17
+
+Blog posts render their author, but renaming an author did not touch any
+timestamp the post list and detail ETags are computed from, so clients kept
+revalidating to a stale author. Existing authors start at the migration time.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'p4q5r6s7t8u9'
+down_revision = 'o3p4q5r6s7t8'
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(conn, table: str, column: str) -> bool:
+    return column in [c["name"] for c in inspect(conn).get_columns(table)]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if _column_exists(conn, 'blog_authors', 'updated_at'):
+        return
+    # SQLite cannot add a column with a CURRENT_TIMESTAMP default: add it
+    # nullable, backfill, then tighten it
+    op.add_column('blog_authors', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE blog_authors SET updated_at = CURRENT_TIMESTAMP")
+    with op.batch_alter_table('blog_authors') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if _column_exists(conn, 'blog_authors', 'updated_at'):
+        with op.batch_alter_table('blog_authors') as batch_op:
+            batch_op.drop_column('updated_at')
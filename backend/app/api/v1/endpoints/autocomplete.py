@@ -0,0 +1,38 @@
+"""
+Typeahead autocomplete endpoint.
+"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.core.responses import FastJSONResponse
+from app.models.autocomplete import AutocompleteResponse
+from app.services.autocomplete import AUTOCOMPLETE_TYPES, autocomplete
+
+router = APIRouter()
+
+
+@router.get("", response_model=AutocompleteResponse)
+def get_suggestions(
+    q: str = Query("", max_length=100),
+    types: Optional[str] = Query(None, description="Comma-separated subset of: trek, expedition, blog"),
+    limit: int = Query(10, ge=1, le=100),
+):
+    """
+    Suggest published treks, expeditions and blog posts whose name, location or
+    region has a word starting with `q`, most popular first (review count, then
+    rating). Served from memory.
+
+    Prefix lookups return at most 20 suggestions; an empty `q` lists every
+    item by popularity (up to `limit`), e.g. for pickers.
+    """
+    selected = None
+    if types:
+        selected = {t.strip() for t in types.split(",") if t.strip()}
+        unknown = selected - set(AUTOCOMPLETE_TYPES)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown type(s): {', '.join(sorted(unknown))}. "
+                f"Allowed: {', '.join(AUTOCOMPLETE_TYPES)}",
+            )
+    suggestions = autocomplete.suggest(q, types=selected or None, limit=limit)
+    return FastJSONResponse({"query": q, "items": [s.as_dict() for s in suggestions]})
@@ -3,13 +3,24 @@ Blog API endpoints.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_db
+from app.core.fields import SparseFields
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.core.config import settings
-from app.crud.blog import blog_crud, blog_author_crud, blog_category_crud, blog_tag_crud
+from app.core.http_cache import CACHE_DETAIL, CACHE_LIST, ConditionalGet, conditional_get
+from app.core.responses import rows_response
+from app.crud import blog_search
+from app.crud.base import load_strategy
+from app.crud.blog import (
+    blog_crud, blog_author_crud, blog_category_crud, blog_category_cache, blog_tag_crud,
+    blog_async_crud, blog_category_async_crud, blog_tag_async_crud,
+)
+from app.db.models.blog import BlogPost
 from app.models.blog import (
     BlogPostCreate, BlogPostUpdate, 
-    BlogPostResponse, BlogPostListResponse,
+    BlogPostResponse, BlogPostListResponse, BlogPostSearchResponse,
     BlogAuthorCreate, BlogAuthorUpdate, BlogAuthorResponse,
     BlogCategoryCreate, BlogCategoryUpdate, BlogCategoryResponse, BlogCategoryTreeResponse,
     BlogTagCreate, BlogTagUpdate, BlogTagResponse
@@ -18,67 +29,46 @@ from app.models.common import PaginatedResponse
 
 router = APIRouter()
 
+# List schema uses camelCase names for these columns
+BLOG_POST_LIST_FIELDS = SparseFields(
+    BlogPostListResponse,
+    BlogPost,
+    renames={
+        "publishDate": "publish_date",
+        "featuredImage": "featured_image",
+        "readTime": "read_time",
+        "contentType": "content_type",
+        "createdAt": "created_at",
+    },
+)
+
 
 # ============================================
 # Blog Category Endpoints
 # ============================================
 
 @router.get("/categories", response_model=List[BlogCategoryResponse])
-def list_categories(
+async def list_categories(
     active_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get flat list of all categories."""
-    categories = blog_category_crud.get_multi(db, limit=1000)
+    categories = await blog_category_async_crud.get_multi(db, limit=1000)
     if active_only:
         categories = [c for c in categories if c.is_active]
     return [BlogCategoryResponse.model_validate(c) for c in categories]
 
 
 @router.get("/categories/tree", response_model=List[BlogCategoryTreeResponse])
-def get_category_tree(
+async def get_category_tree(
     active_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get hierarchical category tree."""
-    categories_with_counts = blog_category_crud.get_all_with_counts(db, active_only=active_only)
-    
-    # Build tree structure
-    category_map = {}
-    for item in categories_with_counts:
-        cat = item["category"]
-        category_map[cat.id] = {
-            "category": cat,
-            "post_count": item["post_count"],
-            "children": []
-        }
-    
-    # Build the tree
-    root_categories = []
-    for cat_id, data in category_map.items():
-        cat = data["category"]
-        if cat.parent_id is None:
-            root_categories.append(data)
-        elif cat.parent_id in category_map:
-            category_map[cat.parent_id]["children"].append(data)
-    
-    def build_response(data) -> BlogCategoryTreeResponse:
-        cat = data["category"]
-        return BlogCategoryTreeResponse(
-            id=cat.id,
-            name=cat.name,
-            slug=cat.slug,
-            description=cat.description,
-            parent_id=cat.parent_id,
-            display_order=cat.display_order,
-            is_active=cat.is_active,
-            created_at=cat.created_at,
-            updated_at=cat.updated_at,
-            post_count=data["post_count"],
-            children=[build_response(child) for child in data["children"]]
-        )
-    
-    return [build_response(data) for data in sorted(root_categories, key=lambda x: (x["category"].display_order, x["category"].name))]
+    """Get hierarchical category tree (precomputed and cached until a post or category changes)."""
+    return await blog_category_cache.respond_async(
+        blog_category_cache.make_key("tree", active_only=active_only),
+        lambda: blog_category_async_crud.get_count_tree(db, active_only=active_only),
+    )
 
 
 @router.post("/categories", response_model=BlogCategoryResponse, status_code=201)
@@ -166,11 +156,11 @@ def delete_category(
 # ============================================
 
 @router.get("/tags", response_model=List[BlogTagResponse])
-def list_tags(
-    db: Session = Depends(get_db),
+async def list_tags(
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all tags with post counts."""
-    tags_with_counts = blog_tag_crud.get_all_with_counts(db)
+    tags_with_counts = await blog_tag_async_crud.get_all_with_counts(db)
     return [
         BlogTagResponse(
             id=item["tag"].id,
@@ -226,7 +216,7 @@ def update_tag(
         id=tag.id,
         name=tag.name,
         slug=tag.slug,
-        post_count=0,
+        post_count=tag.post_count,
         created_at=tag.created_at,
     )
 
@@ -250,7 +240,7 @@ def delete_tag(
 # ============================================
 
 @router.get("/posts", response_model=PaginatedResponse[BlogPostListResponse])
-def list_blog_posts(
+async def list_blog_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     category: Optional[str] = None,
@@ -258,14 +248,28 @@ def list_blog_posts(
     featured: Optional[bool] = None,
     status: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_LIST)),
 ):
-    """Get list of blog posts with optional filters."""
+    """
+    Get list of blog posts with optional filters.
+    
+    - **fields**: Only return these fields, e.g. `fields=slug,title` (only the matching columns
+      are queried; author/categoryName are not selectable)
+    - **cursor**: Keyset pagination (newest first); with `search`, results stay in date order
+    """
+    selected = BLOG_POST_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*await blog_async_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
     
-    posts = blog_crud.get_multi_with_author(
+    posts, total = await blog_async_crud.get_page_with_author(
         db, 
         skip=skip, 
         limit=limit,
@@ -273,95 +277,116 @@ def list_blog_posts(
         category_id=category_id,
         featured=featured,
         status=status,
-        search=search
+        search=search,
+        fields=selected and selected.attributes,
+        cursor=cursor,
     )
     
-    # Count total
-    filters = {}
-    if category:
-        filters["category"] = category
-    if category_id:
-        filters["category_id"] = category_id
-    if featured is not None:
-        filters["featured"] = featured
-    if status:
-        filters["status"] = status
-    if search:
-        filters["search"] = search
-    total = blog_crud.get_count(db, filters=filters)
-    
-    return PaginatedResponse(
-        items=[BlogPostListResponse.from_orm_model(p) for p in posts],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return cond.apply(rows_response(
+        posts, BlogPostListResponse.from_orm_model,
+        total=total, skip=0 if cursor is not None else skip, limit=limit, fields=selected,
+        next_cursor=blog_crud.next_cursor(posts, limit),
+    ))
+
+
+@router.get("/posts/search", response_model=PaginatedResponse[BlogPostSearchResponse])
+async def search_blog_posts(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(None),
+    status: Optional[str] = "published",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Full-text search over post titles, excerpts and bodies, best matches first.
+
+    Each hit carries `highlightedTitle` and a body `snippet` with the matched
+    terms wrapped in `<mark>` (the rest of the text is HTML-escaped). Without a
+    search index (e.g. PostgreSQL) results come from a substring scan and carry
+    no highlights.
+    """
+    if limit is None:
+        limit = settings.DEFAULT_PAGE_SIZE
+    limit = min(limit, settings.MAX_PAGE_SIZE)
+
+    posts, total = await blog_async_crud.get_page_with_author(db, skip=skip, limit=limit, status=status, search=q)
+    marks = await blog_async_crud.run(db, blog_search.highlights, q, [p.id for p in posts])
+
+    return rows_response(
+        posts, lambda p: BlogPostSearchResponse.from_orm_model(p, marks.get(p.id)),
+        total=total, skip=skip, limit=limit,
     )
 
 
 @router.get("/posts/featured", response_model=List[BlogPostListResponse])
-def list_featured_posts(
+async def list_featured_posts(
     limit: int = Query(4, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get featured blog posts."""
-    posts = blog_crud.get_multi_with_author(db, featured=True, status="published", limit=limit)
-    return [BlogPostListResponse.from_orm_model(p) for p in posts]
+    posts = await blog_async_crud.get_multi_with_author(db, featured=True, status="published", limit=limit)
+    return rows_response(posts, BlogPostListResponse.from_orm_model)
 
 
 @router.get("/posts/recent", response_model=List[BlogPostListResponse])
-def list_recent_posts(
+async def list_recent_posts(
     limit: int = Query(5, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get most recent blog posts."""
-    posts = blog_crud.get_recent(db, limit=limit)
-    return [BlogPostListResponse.from_orm_model(p) for p in posts]
+    posts = await blog_async_crud.get_recent(db, limit=limit)
+    return rows_response(posts, BlogPostListResponse.from_orm_model)
 
 
 @router.get("/posts/category/{category}", response_model=List[BlogPostListResponse])
-def list_posts_by_category(
+async def list_posts_by_category(
     category: str,
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get blog posts by category."""
-    posts = blog_crud.get_by_category(db, category, limit=limit)
-    return [BlogPostListResponse.from_orm_model(p) for p in posts]
+    posts = await blog_async_crud.get_by_category(db, category, limit=limit)
+    return rows_response(posts, BlogPostListResponse.from_orm_model)
 
 
 @router.get("/posts/{slug}", response_model=BlogPostResponse)
-def get_blog_post(
+async def get_blog_post(
     slug: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_DETAIL)),
 ):
     """Get a blog post by slug."""
-    post = blog_crud.get_by_slug_with_author(db, slug)
+    not_modified = cond.evaluate(*await blog_async_crud.get_detail_validators(db, slug))
+    if not_modified:
+        return not_modified
+
+    post = await blog_async_crud.get_by_slug_with_author(db, slug, strategy=load_strategy("get_blog_post"))
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
     return BlogPostResponse.from_orm_model(post)
 
 
 @router.get("/posts/id/{post_id}", response_model=BlogPostResponse)
-def get_blog_post_by_id(
+async def get_blog_post_by_id(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a blog post by ID."""
-    post = blog_crud.get_with_author(db, post_id)
+    post = await blog_async_crud.get_with_author(db, post_id, strategy=load_strategy("get_blog_post_by_id"))
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
     return BlogPostResponse.from_orm_model(post)
 
 
 @router.get("/posts/{slug}/related", response_model=List[BlogPostListResponse])
-def get_related_posts(
+async def get_related_posts(
     slug: str,
     limit: int = Query(3, ge=1, le=10),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get related blog posts."""
-    posts = blog_crud.get_related(db, current_slug=slug, limit=limit)
-    return [BlogPostListResponse.from_orm_model(p) for p in posts]
+    posts = await blog_async_crud.get_related(db, current_slug=slug, limit=limit)
+    return rows_response(posts, BlogPostListResponse.from_orm_model)
 
 
 @router.post("/posts", response_model=BlogPostResponse, status_code=201)
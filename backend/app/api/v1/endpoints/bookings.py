@@ -5,23 +5,39 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
+from app.core.fields import SparseFields
+from app.core.pagination import APPROX_TOTAL_DESCRIPTION, CURSOR_DESCRIPTION
 from app.core.config import settings
+from app.core.http_cache import CACHE_PRIVATE, ConditionalGet, conditional_get
+from app.core.responses import rows_response
 from app.crud.booking import booking_crud
+from app.db.models.booking import Booking
 from app.crud.trek import trek_crud
 from app.models.booking import BookingCreate, BookingUpdate, BookingResponse, BookingListResponse
 from app.models.common import PaginatedResponse, MessageResponse
 
 router = APIRouter()
 
+BOOKING_LIST_FIELDS = SparseFields(BookingListResponse, Booking)
+
 
 @router.get("", response_model=PaginatedResponse[BookingListResponse])
 def list_bookings(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     status: Optional[str] = Query(None, pattern="^(pending|confirmed|cancelled)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    approx_total: bool = Query(False, description=APPROX_TOTAL_DESCRIPTION),
     db: Session = Depends(get_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_PRIVATE)),
 ):
-    """Get list of bookings with optional status filter."""
+    """Get list of bookings with optional status filter and sparse ``fields``."""
+    selected = BOOKING_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*booking_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
@@ -30,15 +46,15 @@ def list_bookings(
     if status:
         filters["status"] = status
     
-    bookings = booking_crud.get_multi(db, skip=skip, limit=limit, filters=filters)
-    total = booking_crud.get_count(db, filters=filters)
-    
-    return PaginatedResponse(
-        items=[BookingListResponse.model_validate(b) for b in bookings],
-        total=total,
-        skip=skip,
-        limit=limit,
+    bookings, total = booking_crud.get_page(
+        db, skip=skip, limit=limit, filters=filters, fields=selected and selected.attributes, cursor=cursor,
+        approx_total=approx_total,
     )
+    
+    return cond.apply(rows_response(
+        bookings, BookingListResponse, total=total, skip=0 if cursor is not None else skip, limit=limit,
+        fields=selected, next_cursor=booking_crud.next_cursor(bookings, limit),
+    ))
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
@@ -5,8 +5,13 @@ from typing import List, Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
+from app.core.fields import SparseFields
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.core.config import settings
+from app.core.http_cache import CACHE_PRIVATE, ConditionalGet, conditional_get
+from app.core.responses import rows_response
 from app.crud.contact import contact_crud
+from app.db.models.contact import ContactMessage
 from app.crud.trek import trek_crud
 from app.crud.expedition import expedition_crud
 from app.models.contact import (
@@ -18,6 +23,8 @@ from app.services.email import send_contact_notification, send_itinerary_to_user
 
 router = APIRouter()
 
+CONTACT_LIST_FIELDS = SparseFields(ContactMessageListResponse, ContactMessage)
+
 
 def _run_contact_automation(
     contact_id: int,
@@ -74,9 +81,17 @@ def list_contact_messages(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     status: Optional[str] = Query(None, pattern="^(unread|read|replied|archived)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_PRIVATE)),
 ):
-    """Get list of contact messages with optional status filter."""
+    """Get list of contact messages with optional status filter and sparse ``fields``."""
+    selected = CONTACT_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*contact_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
@@ -85,15 +100,15 @@ def list_contact_messages(
     if status:
         filters["status"] = status
     
-    messages = contact_crud.get_multi(db, skip=skip, limit=limit, filters=filters)
+    messages = contact_crud.get_multi(
+        db, skip=skip, limit=limit, filters=filters, fields=selected and selected.attributes, cursor=cursor
+    )
     total = contact_crud.get_count(db, filters=filters)
     
-    return PaginatedResponse(
-        items=[ContactMessageListResponse.model_validate(m) for m in messages],
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+    return cond.apply(rows_response(
+        messages, ContactMessageListResponse, total=total, skip=0 if cursor is not None else skip, limit=limit,
+        fields=selected, next_cursor=contact_crud.next_cursor(messages, limit),
+    ))
 
 
 @router.get("/unread", response_model=List[ContactMessageListResponse])
@@ -9,7 +9,8 @@ from sqlalchemy import and_
 
 from app.core.deps import get_db
 from app.core.config import settings
-from app.db.models.email_log import EmailLog
+from app.core.pagination import CURSOR_DESCRIPTION
+from app.crud.email_log import email_log_crud
 from app.models.email_log import EmailLogResponse
 from app.models.common import PaginatedResponse
 
@@ -22,6 +23,7 @@ def list_email_logs(
     limit: int = Query(None),
     email_type: Optional[str] = Query(None, pattern="^(lead_notification|itinerary|contact_notification)$"),
     status: Optional[str] = Query(None, pattern="^(sent|delivered|opened|bounced|error)$"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get email logs with optional filters."""
@@ -29,18 +31,14 @@ def list_email_logs(
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
 
-    query = db.query(EmailLog)
-    if email_type:
-        query = query.filter(EmailLog.email_type == email_type)
-    if status:
-        query = query.filter(EmailLog.status == status)
-
-    total = query.count()
-    logs = query.order_by(EmailLog.sent_at.desc()).offset(skip).limit(limit).all()
+    filters = {"email_type": email_type, "status": status}
+    total = email_log_crud.get_count(db, filters=filters)
+    logs = email_log_crud.get_multi(db, skip=skip, limit=limit, filters=filters, cursor=cursor)
 
     return PaginatedResponse(
         items=[EmailLogResponse.model_validate(l) for l in logs],
         total=total,
-        skip=skip,
+        skip=0 if cursor is not None else skip,
         limit=limit,
+        next_cursor=email_log_crud.next_cursor(logs, limit),
     )
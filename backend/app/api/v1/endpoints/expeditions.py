@@ -3,10 +3,17 @@ Expedition API endpoints.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_db
+from app.core.fields import SparseFields
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.core.config import settings
-from app.crud.expedition import expedition_crud
+from app.core.http_cache import CACHE_LIST, ConditionalGet, conditional_get
+from app.core.responses import rows_response
+from app.crud.base import load_strategy
+from app.crud.expedition import expedition_async_crud, expedition_crud
+from app.db.models.expedition import Expedition
 from app.models.expedition import (
     ExpeditionCreate,
     ExpeditionUpdate,
@@ -18,9 +25,21 @@ from app.models.common import PaginatedResponse
 
 router = APIRouter()
 
+EXPEDITION_LIST_FIELDS = SparseFields(
+    ExpeditionListResponse,
+    Expedition,
+    renames={
+        "summitAltitude": "summit_altitude",
+        "shortDescription": "short_description",
+        "successRate": "success_rate",
+        "reviewCount": "review_count",
+        "itineraryPdfUrl": "itinerary_pdf_url",
+    },
+)
+
 
 @router.get("", response_model=PaginatedResponse[ExpeditionListResponse])
-def list_expeditions(
+async def list_expeditions(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     difficulty: Optional[str] = Query(None, pattern="^(advanced|expert|extreme)$"),
@@ -30,16 +49,27 @@ def list_expeditions(
     region: Optional[str] = None,
     status: Optional[str] = Query(None, pattern="^(draft|published|archived)$"),
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_LIST)),
 ):
     """
     Get list of expeditions with optional filters.
+    
+    - **fields**: Only return these fields, e.g. `fields=slug,name` (only the matching columns
+      are queried; groupSize is not selectable)
     """
+    selected = EXPEDITION_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*await expedition_async_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
     
-    expeditions = expedition_crud.get_multi_with_filters(
+    expeditions, total = await expedition_async_crud.get_page_with_filters(
         db,
         skip=skip,
         limit=limit,
@@ -50,55 +80,50 @@ def list_expeditions(
         region=region,
         status=status,
         search=search,
-    )
-    total = expedition_crud.get_count_with_filters(
-        db,
-        difficulty=difficulty,
-        min_price=min_price,
-        max_price=max_price,
-        featured=featured,
-        region=region,
-        status=status,
-        search=search,
+        fields=selected and selected.attributes,
+        cursor=cursor,
     )
     
-    return PaginatedResponse(
-        items=[ExpeditionListResponse.from_orm_model(e) for e in expeditions],
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+    return cond.apply(rows_response(
+        expeditions, ExpeditionListResponse.from_orm_model,
+        total=total, skip=0 if cursor is not None else skip, limit=limit, fields=selected,
+        next_cursor=expedition_crud.next_cursor(expeditions, limit),
+    ))
 
 
 @router.get("/featured", response_model=List[ExpeditionListResponse])
-def list_featured_expeditions(
+async def list_featured_expeditions(
     limit: int = Query(4, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get featured expeditions."""
-    expeditions = expedition_crud.get_featured(db, limit=limit)
-    return [ExpeditionListResponse.from_orm_model(e) for e in expeditions]
+    expeditions = await expedition_async_crud.get_featured(db, limit=limit)
+    return rows_response(expeditions, ExpeditionListResponse.from_orm_model)
 
 
 @router.get("/{slug}", response_model=ExpeditionDetailResponse)
-def get_expedition(
+async def get_expedition(
     slug: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get an expedition by slug with full details."""
-    expedition = expedition_crud.get_by_slug_with_details(db, slug)
+    expedition = await expedition_async_crud.get_by_slug_with_details(
+        db, slug, strategy=load_strategy("get_expedition")
+    )
     if not expedition:
         raise HTTPException(status_code=404, detail="Expedition not found")
     return ExpeditionDetailResponse.from_orm_model(expedition)
 
 
 @router.get("/id/{expedition_id}", response_model=ExpeditionDetailResponse)
-def get_expedition_by_id(
+async def get_expedition_by_id(
     expedition_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get an expedition by ID with full details."""
-    expedition = expedition_crud.get_with_details(db, expedition_id)
+    expedition = await expedition_async_crud.get_with_details(
+        db, expedition_id, strategy=load_strategy("get_expedition_by_id")
+    )
     if not expedition:
         raise HTTPException(status_code=404, detail="Expedition not found")
     return ExpeditionDetailResponse.from_orm_model(expedition)
@@ -2,10 +2,18 @@
 Health check endpoint.
 """
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from app.core.deps import get_db
+from app.core.deps import get_primary_db
 from app.core.config import settings
+from app.core.cache import cache_stats
+from app.core.snapshot import snapshot_stats
+from app.db import pools, sqlite
+from app.db.session import read_replicas
+from app.services import warmup
+from app.services.autocomplete import autocomplete
+from app.services.search import site_search
 
 router = APIRouter()
 
@@ -21,14 +29,16 @@ def health_check():
 
 
 @router.get("/db")
-def health_check_db(db: Session = Depends(get_db)):
-    """Health check with database connectivity test."""
+def health_check_db(db: Session = Depends(get_primary_db)):
+    """Health check with database connectivity test (primary), connection pools and read replica state."""
     try:
         # Test database connection
         db.execute(text("SELECT 1"))
         db_status = "connected"
+        pragmas = sqlite.current(db.connection()) if settings.is_sqlite else None
     except Exception as e:
         db_status = f"error: {str(e)}"
+        pragmas = None
     
     return {
         "status": "healthy" if db_status == "connected" else "unhealthy",
@@ -36,5 +46,26 @@ def health_check_db(db: Session = Depends(get_db)):
         "version": settings.APP_VERSION,
         "database": db_status,
         "database_type": "sqlite" if settings.is_sqlite else "mysql",
+        "sqlite_pragmas": pragmas,
+        "pools": pools.pool_stats(),
+        "replicas": read_replicas.stats() if read_replicas else None,
     }
 
+
+@router.get("/metrics")
+def health_metrics():
+    """Connection pool metrics in the Prometheus text format (per worker)."""
+    return PlainTextResponse(pools.prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/cache")
+def health_check_cache():
+    """In-process response cache, snapshot and search index counters (per worker)."""
+    return {
+        "enabled": settings.RESPONSE_CACHE_ENABLED,
+        "caches": cache_stats(),
+        "snapshots": snapshot_stats(),
+        "warmup": warmup.last_report,
+        "search": site_search.stats(),
+        "autocomplete": autocomplete.stats(),
+    }
@@ -5,8 +5,13 @@ from typing import List, Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
+from app.core.fields import SparseFields
+from app.core.pagination import APPROX_TOTAL_DESCRIPTION, CURSOR_DESCRIPTION
 from app.core.config import settings
+from app.core.http_cache import CACHE_PRIVATE, ConditionalGet, conditional_get
+from app.core.responses import rows_response
 from app.crud.lead import lead_crud
+from app.db.models.lead import Lead
 from app.crud.trek import trek_crud
 from app.crud.expedition import expedition_crud
 from app.models.lead import LeadCreate, LeadUpdate, LeadResponse, LeadListResponse
@@ -16,15 +21,26 @@ from app.crud.email_log import email_log_crud
 
 router = APIRouter()
 
+LEAD_LIST_FIELDS = SparseFields(LeadListResponse, Lead)
+
 
 @router.get("", response_model=PaginatedResponse[LeadListResponse])
 def list_leads(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     status: Optional[str] = Query(None, pattern="^(new|contacted|converted|lost)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    approx_total: bool = Query(False, description=APPROX_TOTAL_DESCRIPTION),
     db: Session = Depends(get_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_PRIVATE)),
 ):
-    """Get list of leads with optional status filter."""
+    """Get list of leads with optional status filter and sparse ``fields``."""
+    selected = LEAD_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*lead_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
@@ -33,15 +49,15 @@ def list_leads(
     if status:
         filters["status"] = status
     
-    leads = lead_crud.get_multi(db, skip=skip, limit=limit, filters=filters)
-    total = lead_crud.get_count(db, filters=filters)
-    
-    return PaginatedResponse(
-        items=[LeadListResponse.model_validate(l) for l in leads],
-        total=total,
-        skip=skip,
-        limit=limit,
+    leads, total = lead_crud.get_page(
+        db, skip=skip, limit=limit, filters=filters, fields=selected and selected.attributes, cursor=cursor,
+        approx_total=approx_total,
     )
+    
+    return cond.apply(rows_response(
+        leads, LeadListResponse, total=total, skip=0 if cursor is not None else skip, limit=limit,
+        fields=selected, next_cursor=lead_crud.next_cursor(leads, limit),
+    ))
 
 
 @router.get("/new", response_model=List[LeadListResponse])
@@ -9,6 +9,8 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.deps import get_db
+from app.core.pagination import CURSOR_DESCRIPTION
+from app.core.responses import rows_response
 from app.crud.media import media as media_crud
 from app.services.storage import get_storage, StorageBackend
 from app.models.media import (
@@ -178,6 +180,7 @@ async def list_media(
     mime_type: Optional[str] = Query(None, description="Filter by mime type (e.g., 'image/*')"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
@@ -200,13 +203,12 @@ async def list_media(
         mime_type=mime_type,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
     
-    return MediaListResponse(
-        items=[MediaResponse.model_validate(m) for m in media_list],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return rows_response(
+        media_list, MediaResponse, total=total, skip=0 if cursor is not None else skip, limit=limit,
+        next_cursor=media_crud.next_cursor(media_list, limit),
     )
 
 
@@ -5,6 +5,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
+from app.core.http_cache import CACHE_DETAIL, ConditionalGet, conditional_get
 from app.crud.page_content import page_section_crud
 from app.models.page_content import (
     PageSectionCreate,
@@ -25,8 +26,14 @@ def list_page_sections(
     page: str,
     active_only: bool = Query(True),
     db: Session = Depends(get_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_DETAIL)),
 ):
     """Get all sections for a given page."""
+    # Validators cover the whole page so toggling is_active is always noticed
+    not_modified = cond.evaluate(*page_section_crud.get_validators(db, filters={"page": page}))
+    if not_modified:
+        return not_modified
+
     sections = page_section_crud.list_by_page(
         db,
         page=page,
@@ -0,0 +1,50 @@
+"""
+Page bundle API endpoints.
+
+Each route returns everything one frontend page needs in a single response,
+so SSR renders cost one API round-trip instead of one per section.
+"""
+from datetime import date
+from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
+from app.core.compression import encoded_response
+from app.core.http_cache import CACHE_LIST
+from app.models.pages import HomePageResponse, TrekPageResponse
+from app.services.pages import build_trek_page, home_snapshot, page_response_cache
+
+router = APIRouter()
+
+
+@router.get("/home", response_model=HomePageResponse)
+async def get_home_page():
+    """
+    Get the homepage bundle: featured and budget treks, published expeditions,
+    testimonials, recent blog posts, home page sections, reviews and site settings.
+
+    Served from a precomputed snapshot that is rebuilt in the background whenever
+    one of its source tables changes (and every HOME_SNAPSHOT_REFRESH_SECONDS).
+    """
+    body = home_snapshot.body
+    if body is None:
+        # Refresher not running yet (or data changed with no refresher) - build inline
+        body = await run_in_threadpool(home_snapshot.get)
+    return encoded_response(body, headers={"Cache-Control": CACHE_LIST})
+
+
+@router.get("/trek/{slug}", response_model=TrekPageResponse)
+async def get_trek_page(slug: str):
+    """
+    Get the trek detail page bundle: trek with itinerary/FAQs/batches, related treks,
+    upcoming public batches, Google reviews and site settings.
+    """
+    async def build() -> TrekPageResponse:
+        bundle = await build_trek_page(slug)
+        if bundle is None:
+            raise HTTPException(status_code=404, detail="Trek not found")
+        return bundle
+
+    key = page_response_cache.make_key("trek", slug=slug, today=date.today().isoformat())
+    body, hit = await page_response_cache.get_or_build_async(key, build)
+    response = page_response_cache.to_response(body, hit)
+    response.headers["Cache-Control"] = CACHE_LIST
+    return response
@@ -0,0 +1,55 @@
+"""
+Site-wide search endpoint.
+"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.core.responses import FastJSONResponse
+from app.models.search import SearchResponse
+from app.services.search import SEARCH_TYPES, site_search
+
+router = APIRouter()
+
+
+def parse_types(types: Optional[str]) -> Optional[set]:
+    """Parse a comma-separated ``types=`` value; None means every type. Unknown types are a 400."""
+    if not types:
+        return None
+    names = {t.strip() for t in types.split(",") if t.strip()}
+    unknown = names - set(SEARCH_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown type(s): {', '.join(sorted(unknown))}. Allowed: {', '.join(SEARCH_TYPES)}",
+        )
+    return names or None
+
+
+@router.get("", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[str] = Query(None, description="Comma-separated subset of: trek, expedition, blog, page"),
+    limit: int = Query(20, ge=1, le=50),
+):
+    """
+    Search published treks, expeditions, blog posts and active page sections.
+
+    Served from an in-memory index (no database query); every term must match
+    and the last one also matches as a prefix, so it works for search-as-you-type.
+    """
+    hits, total = site_search.search(q, types=parse_types(types), limit=limit)
+    return FastJSONResponse({
+        "query": q,
+        "total": total,
+        "items": [
+            {
+                "type": doc.type,
+                "id": doc.id,
+                "slug": doc.slug,
+                "title": doc.title,
+                "summary": doc.summary,
+                "url": doc.url,
+                "score": round(score, 4),
+            }
+            for doc, score in hits
+        ],
+    })
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
 from app.core.auth import get_current_admin_user
+from app.core.http_cache import CACHE_DETAIL, ConditionalGet, conditional_get
 from app.db.models.user import User
 from app.crud import site_settings as crud_site_settings
 from app.models.site_settings import SiteSettingsUpdate, SiteSettingsResponse
@@ -13,8 +14,14 @@ router = APIRouter()
 
 
 @router.get("", response_model=SiteSettingsResponse)
-def get_site_settings(db: Session = Depends(get_db)):
+def get_site_settings(
+    db: Session = Depends(get_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_DETAIL)),
+):
     """Get current site settings (public). Returns defaults when no row exists."""
+    not_modified = cond.evaluate(*crud_site_settings.get_validators(db))
+    if not_modified:
+        return not_modified
     row = crud_site_settings.get(db)
     if not row:
         return crud_site_settings.get_defaults()
@@ -0,0 +1,47 @@
+"""
+Sitemap slug index endpoint.
+"""
+from datetime import datetime
+from typing import Iterator, Optional
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from app.core.http_cache import CACHE_LIST
+from app.core.responses import dumps
+from app.crud import sitemap as crud_sitemap
+from app.db.session import SessionLocal
+
+router = APIRouter()
+
+
+def _stream(since: Optional[datetime]) -> Iterator[bytes]:
+    # Own session: the request-scoped one is closed before the body is streamed
+    db = SessionLocal()
+    try:
+        yield b"["
+        first = True
+        for content_type, slug, updated_at in crud_sitemap.iter_entries(db, since=since):
+            item = dumps({"type": content_type, "slug": slug, "updated_at": updated_at})
+            yield item if first else b"," + item
+            first = False
+        yield b"]"
+    finally:
+        db.close()
+
+
+@router.get("")
+def get_sitemap(
+    since: Optional[datetime] = Query(
+        None, description="Only return items updated after this timestamp (incremental rebuilds)"
+    ),
+):
+    """
+    Stream `{type, slug, updated_at}` for all published treks, expeditions and blog posts.
+
+    Unpaginated and uncapped, as a JSON array; each table is read with a single
+    index-only query.
+    """
+    return StreamingResponse(
+        _stream(since),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_LIST},
+    )
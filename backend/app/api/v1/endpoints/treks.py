@@ -4,11 +4,17 @@ Trek API endpoints.
 from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_db
+from app.core.fields import SparseFields
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.core.config import settings
-from app.crud.trek import trek_crud
-from app.db.models.trek import TrekBatch
+from app.core.http_cache import CACHE_DETAIL, CACHE_LIST, ConditionalGet, conditional_get
+from app.core.responses import serialize_page, serialize_rows
+from app.crud.base import load_strategy
+from app.crud.trek import TREK_SORTS, trek_async_crud, trek_crud, trek_response_cache
+from app.db.models.trek import Trek, TrekBatch
 from app.models.trek import (
     TrekCreate, TrekUpdate, TrekResponse, TrekDetailResponse, TrekListResponse
 )
@@ -17,9 +23,11 @@ from app.models.common import PaginatedResponse
 
 router = APIRouter()
 
+TREK_LIST_FIELDS = SparseFields(TrekListResponse, Trek)
+
 
 @router.get("", response_model=PaginatedResponse[TrekListResponse])
-def list_treks(
+async def list_treks(
     skip: int = Query(0, ge=0),
     limit: int = Query(None),
     difficulty: Optional[str] = Query(None, pattern="^(easy|moderate|difficult|challenging|extreme)$"),
@@ -35,7 +43,10 @@ def list_treks(
         description="Sort order: popularity, price_asc, price_desc, rating, newest",
         pattern="^(popularity|price_asc|price_desc|rating|newest)$",
     ),
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (sparse fieldset)"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_LIST)),
 ):
     """
     Get list of treks with optional filters.
@@ -49,27 +60,18 @@ def list_treks(
     - **status**: Filter by status (draft, published, archived, seasonal)
     - **location**: Filter by location (partial match)
     - **search**: Search in name, short_description, location
+    - **fields**: Only return these fields, e.g. `fields=slug,name` (only the matching columns are queried)
+    - **cursor**: Keyset pagination within the chosen `sort`; pass the previous page's `next_cursor`
     """
+    selected = TREK_LIST_FIELDS.parse(fields)
+    not_modified = cond.evaluate(*await trek_async_crud.get_validators(db))
+    if not_modified:
+        return not_modified
+
     if limit is None:
         limit = settings.DEFAULT_PAGE_SIZE
     limit = min(limit, settings.MAX_PAGE_SIZE)
-    
-    treks = trek_crud.get_multi_with_filters(
-        db,
-        skip=skip,
-        limit=limit,
-        difficulty=difficulty,
-        min_price=min_price,
-        max_price=max_price,
-        featured=featured,
-        status=status,
-        location=location,
-        search=search,
-        season=season,
-        sort=sort,
-    )
-    total = trek_crud.get_count_with_filters(
-        db,
+    filters = dict(
         difficulty=difficulty,
         min_price=min_price,
         max_price=max_price,
@@ -79,44 +81,74 @@ def list_treks(
         search=search,
         season=season,
     )
-    
-    return PaginatedResponse(
-        items=[TrekListResponse.model_validate(t) for t in treks],
-        total=total,
+
+    sort = sort or "newest"
+
+    async def build() -> dict:
+        treks, total = await trek_async_crud.get_page_with_filters(
+            db, skip=skip, limit=limit, sort=sort, fields=selected and selected.attributes,
+            cursor=cursor, **filters
+        )
+        return serialize_page(
+            treks, TrekListResponse, total=total, skip=0 if cursor is not None else skip, limit=limit,
+            fields=selected, next_cursor=trek_crud.next_cursor(treks, limit, TREK_SORTS[sort], sort),
+        )
+
+    # ILIKE filters are case-insensitive, so fold them in the key as well
+    key = trek_response_cache.make_key(
+        "list",
         skip=skip,
         limit=limit,
+        sort=sort,
+        cursor=cursor,
+        fields=selected and selected.key,
+        **{**filters, "location": location and location.lower(), "search": search and search.lower()},
     )
+    return cond.apply(await trek_response_cache.respond_async(key, build))
 
 
 @router.get("/featured", response_model=List[TrekListResponse])
-def list_featured_treks(
+async def list_featured_treks(
     limit: int = Query(6, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get featured treks."""
-    treks = trek_crud.get_multi_with_filters(db, limit=limit, featured=True, status="published")
-    return [TrekListResponse.model_validate(t) for t in treks]
+    async def build() -> List[dict]:
+        treks = await trek_async_crud.get_multi_with_filters(db, limit=limit, featured=True, status="published")
+        return serialize_rows(treks, TrekListResponse)
+
+    return await trek_response_cache.respond_async(trek_response_cache.make_key("featured", limit=limit), build)
 
 
 @router.get("/{slug}", response_model=TrekDetailResponse)
-def get_trek(
+async def get_trek(
     slug: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    cond: ConditionalGet = Depends(conditional_get(CACHE_DETAIL)),
 ):
     """Get a trek by slug with full details."""
-    trek = trek_crud.get_by_slug_with_details(db, slug)
-    if not trek:
-        raise HTTPException(status_code=404, detail="Trek not found")
-    return TrekDetailResponse.model_validate(trek)
+    not_modified = cond.evaluate(*await trek_async_crud.get_detail_validators(db, slug))
+    if not_modified:
+        return not_modified
+
+    async def build() -> TrekDetailResponse:
+        trek = await trek_async_crud.get_by_slug_with_details(db, slug, strategy=load_strategy("get_trek"))
+        if not trek:
+            raise HTTPException(status_code=404, detail="Trek not found")
+        return TrekDetailResponse.model_validate(trek)
+
+    return cond.apply(
+        await trek_response_cache.respond_async(trek_response_cache.make_key("detail", slug=slug), build)
+    )
 
 
 @router.get("/id/{trek_id}", response_model=TrekDetailResponse)
-def get_trek_by_id(
+async def get_trek_by_id(
     trek_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a trek by ID with full details."""
-    trek = trek_crud.get_with_details(db, trek_id)
+    trek = await trek_async_crud.get_with_details(db, trek_id, strategy=load_strategy("get_trek_by_id"))
     if not trek:
         raise HTTPException(status_code=404, detail="Trek not found")
     return TrekDetailResponse.model_validate(trek)
@@ -256,14 +288,21 @@ def list_batches(trek_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{slug}/batches/public", response_model=List[TrekBatchResponse])
-def list_batches_public(slug: str, db: Session = Depends(get_db)):
+async def list_batches_public(slug: str, db: AsyncSession = Depends(get_async_db)):
     """Get active future batches for a trek by slug (frontend)."""
-    trek = trek_crud.get_by_slug_with_details(db, slug)
-    if not trek:
-        raise HTTPException(status_code=404, detail="Trek not found")
     today = date.today()
-    batches = [b for b in trek.batches if b.is_active and b.end_date >= today]
-    return [TrekBatchResponse.from_orm_model(b) for b in batches]
+
+    async def build() -> List[TrekBatchResponse]:
+        trek = await trek_async_crud.get_by_slug_with_details(
+            db, slug, strategy=load_strategy("list_batches_public"), relations=("batches",)
+        )
+        if not trek:
+            raise HTTPException(status_code=404, detail="Trek not found")
+        batches = [b for b in trek.batches if b.is_active and b.end_date >= today]
+        return [TrekBatchResponse.from_orm_model(b) for b in batches]
+
+    key = trek_response_cache.make_key("batches_public", slug=slug, today=today.isoformat())
+    return await trek_response_cache.respond_async(key, build)
 
 
 @router.post("/{trek_id}/batches", response_model=TrekBatchResponse, status_code=201)
@@ -21,6 +21,10 @@ from app.api.v1.endpoints import (
     google_reviews,
     webhooks,
     email_logs,
+    pages,
+    sitemap,
+    search,
+    autocomplete,
 )
 
 api_router = APIRouter()
@@ -44,4 +48,8 @@ api_router.include_router(site_settings.router, prefix="/site-settings", tags=["
 api_router.include_router(google_reviews.router, prefix="/google-reviews", tags=["Google Reviews"])
 api_router.include_router(webhooks.router, prefix="/webhooks", tags=["Webhooks"])
 api_router.include_router(email_logs.router, prefix="/email-logs", tags=["Email Logs"])
+api_router.include_router(pages.router, prefix="/pages", tags=["Pages"])
+api_router.include_router(sitemap.router, prefix="/sitemap", tags=["Sitemap"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
+api_router.include_router(autocomplete.router, prefix="/autocomplete", tags=["Search"])
 
@@ -0,0 +1,310 @@
+"""
+In-process caching primitives.
+
+TTLCache is a thread-safe TTL + LRU map with hit/miss counters. ResponseCache
+builds on it to hold serialized JSON bodies for read-heavy public endpoints,
+together with their compressed variants (see app.core.compression).
+SWRCache serves rarely changing values stale-while-revalidate, with
+single-flight loading.
+Every cache registers itself by name so its counters can be inspected from
+the health endpoints.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from fastapi import Response
+
+from app.core.compression import EncodedBody, encoded_response
+from app.core.config import settings
+from app.core.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_registry: Dict[str, Any] = {}
+
+
+class TTLCache:
+    """Thread-safe TTL + LRU cache with hit/miss counters."""
+
+    def __init__(self, name: str, *, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+        _registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if absent/expired."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] <= now:
+                if item is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry if full.
+
+        Pass the ``generation`` read before computing ``value`` to skip the store
+        when the cache was cleared in the meantime (the value may be stale).
+        """
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, *_: Any) -> None:
+        """Drop every entry. Accepts and ignores arguments so it can be used as a listener."""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class ResponseCache(TTLCache):
+    """TTLCache holding serialized JSON response bodies keyed on normalized request params."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(
+            name,
+            maxsize=maxsize or settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl=ttl if ttl is not None else settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    @staticmethod
+    def make_key(route: str, **params: Any) -> Tuple:
+        """Build a cache key from the route name and its (unordered) query params."""
+        return (route,) + tuple(sorted((k, v) for k, v in params.items() if v is not None))
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Tuple[EncodedBody, bool]:
+        """Return ``(body, hit)``, rendering and storing the body on a miss."""
+        if settings.RESPONSE_CACHE_ENABLED:
+            body = self.get(key)
+            if body is not None:
+                return body, True
+        generation = self.generation
+        body = EncodedBody(render_json(build()))
+        if settings.RESPONSE_CACHE_ENABLED:
+            self.set(key, body, generation=generation)
+        return body, False
+
+    async def get_or_build_async(
+        self, key: Hashable, build: Callable[[], Awaitable[Any]]
+    ) -> Tuple[EncodedBody, bool]:
+        """Async variant of get_or_build for payloads assembled by coroutines."""
+        if settings.RESPONSE_CACHE_ENABLED:
+            body = self.get(key)
+            if body is not None:
+                return body, True
+        generation = self.generation
+        body = EncodedBody(render_json(await build()))
+        if settings.RESPONSE_CACHE_ENABLED:
+            self.set(key, body, generation=generation)
+        return body, False
+
+    def respond(self, key: Hashable, build: Callable[[], Any]) -> Response:
+        """Serve ``key`` from cache, calling ``build`` to produce the payload on a miss."""
+        body, hit = self.get_or_build(key, build)
+        return self.to_response(body, hit)
+
+    async def respond_async(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Response:
+        """Async variant of respond for ``async def`` handlers."""
+        body, hit = await self.get_or_build_async(key, build)
+        return self.to_response(body, hit)
+
+    @staticmethod
+    def to_response(body: EncodedBody, hit: bool) -> Response:
+        """Response for a cached body, precompressed if the client accepts it."""
+        return encoded_response(body, headers={"X-Cache": "HIT" if hit else "MISS"})
+
+
+class SWRCache:
+    """
+    Keyed stale-while-revalidate cache with single-flight loading.
+
+    A value younger than ``ttl`` is returned as is. An older one is still
+    returned immediately while a single background thread reloads it.
+    Concurrent cold misses for a key wait on one load instead of each hitting
+    the database. ``None`` is a cacheable value.
+    """
+
+    def __init__(self, name: str, *, ttl: float, wait_timeout: float = 10.0):
+        self.name = name
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, threading.Event] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.invalidations = 0
+        self.generation = 0
+        _registry[name] = self
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        refresh: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Return the value for ``key``.
+
+        ``load`` runs inline on a cold miss (it may use the caller's session);
+        ``refresh`` (default: ``load``) runs on a background thread when the
+        value is stale, so it must open its own session.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                loaded_at, value = item
+                if time.monotonic() - loaded_at < self.ttl:
+                    self.hits += 1
+                elif key not in self._refreshing:
+                    self.stale_hits += 1
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, refresh or load, self.generation),
+                        name=f"swr-{self.name}",
+                        daemon=True,
+                    ).start()
+                else:
+                    self.stale_hits += 1
+                return value
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+                generation = self.generation
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            event.wait(self.wait_timeout)
+            with self._lock:
+                item = self._data.get(key)
+            # Leader failed or the cache was cleared meanwhile: load for ourselves
+            return item[1] if item is not None else load()
+
+        try:
+            value = load()
+            self._store(key, value, generation)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        with self._lock:
+            # A clear() during the load means the value may predate the change
+            if generation == self.generation:
+                self._data[key] = (time.monotonic(), value)
+
+    def _refresh(self, key: Hashable, refresh: Callable[[], Any], generation: int) -> None:
+        try:
+            self._store(key, refresh(), generation)
+            self.refreshes += 1
+        except Exception:
+            self.refresh_failures += 1
+            logger.exception("Background refresh of %s[%r] failed", self.name, key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear(self, *_: Any) -> None:
+        """Drop every entry. Accepts and ignores arguments so it can be used as a listener."""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._data),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "invalidations": self.invalidations,
+        }
+
+
+def render_json(payload: Any) -> bytes:
+    """Serialize a payload (models, lists/dicts of models, plain data) to JSON bytes, by alias like FastAPI."""
+    if isinstance(payload, bytes):
+        return payload
+    return dumps(payload)
+
+
+def cache_stats(names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Counters for every registered cache (or only those in ``names``)."""
+    wanted = set(names) if names is not None else None
+    return {
+        name: cache.stats()
+        for name, cache in _registry.items()
+        if wanted is None or name in wanted
+    }
@@ -0,0 +1,227 @@
+"""
+Response compression (gzip / brotli).
+
+CompressionMiddleware negotiates an encoding from ``Accept-Encoding`` and
+compresses compressible responses above a minimum size, including streamed
+ones. Cached bodies are wrapped in EncodedBody, which compresses each variant
+once and keeps it next to the raw bytes; responses built from it are sent
+already encoded and the middleware passes them through untouched.
+
+Brotli is optional: without the ``brotli`` package only gzip is offered.
+"""
+import gzip
+import zlib
+from contextvars import ContextVar
+from typing import Dict, Mapping, Optional
+
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Preference order when the client accepts several encodings equally
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/xml",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+# Encoding negotiated for the current request (set by the middleware)
+accepted_encoding: ContextVar[Optional[str]] = ContextVar("accepted_encoding", default=None)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header (honouring q-values)."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a whole body with the configured level for ``encoding``."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class EncodedBody:
+    """Serialized body plus lazily built, memoized compressed variants."""
+
+    __slots__ = ("raw", "_variants")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._variants: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def variant(self, encoding: Optional[str]) -> Optional[bytes]:
+        """Compressed body for ``encoding``, or None if it should go out uncompressed."""
+        if (
+            encoding is None
+            or not settings.COMPRESSION_ENABLED
+            or len(self.raw) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return None
+        data = self._variants.get(encoding)
+        if data is None:
+            # Racing threads may both compress once; the result is identical
+            data = self._variants[encoding] = compress(self.raw, encoding)
+        return data
+
+    def sizes(self) -> Dict[str, int]:
+        return {"identity": len(self.raw), **{k: len(v) for k, v in self._variants.items()}}
+
+
+def encoded_response(
+    body: EncodedBody,
+    *,
+    media_type: str = "application/json",
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """Build a Response from ``body``, using the precompressed variant the client accepts."""
+    encoding = accepted_encoding.get()
+    data = body.variant(encoding)
+    response = Response(content=data if data is not None else body.raw, media_type=media_type, headers=headers)
+    response.headers["Vary"] = "Accept-Encoding"
+    if data is not None:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._obj = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+            self._compress, self._finish = self._obj.process, self._obj.finish
+        else:
+            self._obj = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._compress, self._finish = self._obj.compress, self._obj.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI gzip/brotli middleware.
+
+    Skips responses that already carry a Content-Encoding (precompressed cache
+    hits), non-compressible content types, and single-message bodies smaller
+    than ``minimum_size``. Streamed bodies are compressed incrementally.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        token = accepted_encoding.set(encoding)
+        try:
+            if encoding is None:
+                await self.app(scope, receive, send)
+            else:
+                await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size))
+        finally:
+            accepted_encoding.reset(token)
+
+
+class _CompressingSend:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            status = message["status"]
+            self.passthrough = (
+                "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+                or status < 200
+                or status in (204, 206, 304)
+            )
+            if not self.passthrough:
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            if not more_body:
+                body = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            # Streaming: length is unknown up front
+            del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding)
+            await self.send(start)
+
+        if self.passthrough or self.compressor is None:
+            await self.send(message)
+            return
+
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
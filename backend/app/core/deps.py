@@ -2,19 +2,43 @@
 Dependency injection for FastAPI.
 Provides database sessions and other common dependencies.
 """
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal, read_replicas
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
+    GET requests may be served by a read replica (see app/db/replicas.py).
     Automatically closes the session after the request.
     """
+    db = read_replicas.session(request, SessionLocal)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_primary_db() -> Generator[Session, None, None]:
+    """Like get_db, but always on the primary (reads that must see the latest writes)."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session (for ``async def`` handlers).
+    GET requests may be served by a read replica.
+    Automatically closes the session after the request.
+    """
+    db = await read_replicas.async_session(request, AsyncSessionLocal)
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,72 @@
+"""
+Sparse fieldsets (``?fields=``) for list endpoints.
+
+A SparseFields spec lists which fields of a list response schema are backed by
+plain model columns. ``parse()`` turns the comma-separated query value into a
+FieldSelection: the model attributes to hand to the CRUD layer (which applies
+``load_only`` so only those columns are selected) and a serializer that builds
+each item from just those attributes, never touching the deferred columns.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+
+class FieldSelection:
+    """Requested output fields mapped to model attributes."""
+
+    def __init__(self, fields: Dict[str, str]):
+        self.fields = fields
+
+    @property
+    def attributes(self) -> List[str]:
+        """Model column attributes to load (always includes the primary key)."""
+        attributes = list(dict.fromkeys(self.fields.values()))
+        if "id" not in attributes:
+            attributes.insert(0, "id")
+        return attributes
+
+    @property
+    def key(self) -> str:
+        """Stable representation for cache keys."""
+        return ",".join(sorted(self.fields))
+
+    def serialize(self, rows: Iterable[Any]) -> List[dict]:
+        items = self.fields.items()
+        return [{name: getattr(row, attr) for name, attr in items} for row in rows]
+
+
+class SparseFields:
+    """Fields of ``schema`` that can be selected with ``?fields=`` for ``model`` rows."""
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        model: type,
+        renames: Optional[Mapping[str, str]] = None,
+    ):
+        columns = {attr.key for attr in inspect(model).column_attrs}
+        renames = renames or {}
+        self.allowed: Dict[str, str] = {}
+        for name in schema.model_fields:
+            attr = renames.get(name, name)
+            if attr in columns:
+                self.allowed[name] = attr
+
+    def parse(self, fields: Optional[str]) -> Optional[FieldSelection]:
+        """Parse a ``fields=`` value; None means the full schema. Unknown fields are a 400."""
+        if not fields:
+            return None
+        names = [f.strip() for f in fields.split(",") if f.strip()]
+        if not names:
+            return None
+        unknown = [n for n in names if n not in self.allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field(s): {', '.join(unknown)}. "
+                f"Allowed: {', '.join(self.allowed)}",
+            )
+        return FieldSelection({name: self.allowed[name] for name in dict.fromkeys(names)})
@@ -0,0 +1,117 @@
+"""
+HTTP conditional GET support (ETag / Last-Modified).
+
+Handlers compute cheap validators - the newest ``updated_at`` and a row count -
+before building the response. If the client already holds that version, a 304
+is returned without loading or serializing any rows.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+
+# Cache-Control presets used by the public read routes
+CACHE_LIST = "public, max-age=60, stale-while-revalidate=300"
+CACHE_DETAIL = "public, max-age=300, stale-while-revalidate=600"
+CACHE_PRIVATE = "private, no-cache"
+
+
+class ConditionalGet:
+    """Per-request helper that evaluates validators and decorates the response."""
+
+    def __init__(self, request: Request, response: Response, cache_control: str):
+        self.request = request
+        self.response = response
+        self.cache_control = cache_control
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[datetime] = None
+
+    def evaluate(
+        self,
+        last_modified: Optional[datetime],
+        count: Optional[int] = None,
+        *extra: Any,
+    ) -> Optional[Response]:
+        """
+        Set validators for this request and return a 304 response if the client is current.
+
+        The weak ETag covers the path and query string, so every page/filter
+        combination gets its own validator.
+        """
+        if last_modified is None and not count:
+            # Nothing to validate against (e.g. unknown slug) - let the handler 404
+            return None
+        if last_modified is not None and last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        self.last_modified = last_modified.replace(microsecond=0) if last_modified else None
+
+        raw = "|".join(
+            str(part)
+            for part in (
+                self.request.url.path,
+                self.request.url.query,
+                last_modified.isoformat() if last_modified else "",
+                count if count is not None else "",
+                *extra,
+            )
+        )
+        self.etag = f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:20]}"'
+
+        if self._is_not_modified():
+            return self.apply(Response(status_code=304))
+        # Headers on the injected response are merged into model-returning handlers' output
+        self.apply(self.response)
+        return None
+
+    def _is_not_modified(self) -> bool:
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in candidates or self.etag in candidates or self.etag[2:] in candidates
+
+        if_modified_since = self.request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified <= since
+        return False
+
+    def apply(self, response: Response) -> Response:
+        """
+        Attach ETag, Last-Modified and Cache-Control headers to ``response``.
+
+        Only needed when the handler returns a Response object itself (FastAPI does
+        not merge the injected response's headers into it).
+        """
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
+def conditional_get(cache_control: str = CACHE_LIST) -> Callable[[Request], ConditionalGet]:
+    """
+    Dependency factory for conditional GET handling.
+
+    Usage::
+
+        cond: ConditionalGet = Depends(conditional_get(CACHE_DETAIL))
+        not_modified = cond.evaluate(*crud.get_validators(db))
+        if not_modified:
+            return not_modified
+        ...
+    """
+
+    def dependency(request: Request, response: Response) -> ConditionalGet:
+        return ConditionalGet(request, response, cache_control)
+
+    return dependency
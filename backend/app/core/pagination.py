@@ -0,0 +1,68 @@
+"""
+Opaque cursors for keyset (seek) pagination.
+
+A cursor records where the previous page ended: the sort-key values of its
+last row (always ending with ``id``) and the name of the sort they belong to.
+It is base64url-encoded JSON - opaque to clients, who only pass back the
+``next_cursor`` of the page they have. Malformed or mismatched cursors are a 400.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Sequence
+
+from fastapi import HTTPException
+
+_DATETIME = "$dt"
+_DATE = "$d"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if _DATETIME in value:
+            return datetime.fromisoformat(value[_DATETIME])
+        if _DATE in value:
+            return date.fromisoformat(value[_DATE])
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """Cursor pointing just after a row with these sort-key ``values``."""
+    payload = json.dumps({"s": sort, "k": [_encode_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, size: int) -> List[Any]:
+    """Sort-key values from ``cursor``; 400 if it is malformed or was issued for another sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = [_decode_value(v) for v in payload["k"]]
+        valid = payload["s"] == sort and len(values) == size
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=400, detail="Invalid or expired cursor for this listing")
+    return values
+
+
+# Shared ``cursor`` query parameter documentation for list endpoints
+CURSOR_DESCRIPTION = (
+    "Keyset pagination: the next_cursor of the previous page (empty for the first page). "
+    "skip is ignored when set."
+)
+
+# Shared ``approx_total`` query parameter documentation for large admin lists
+APPROX_TOTAL_DESCRIPTION = (
+    "Take total from a briefly cached count for the same filters (it may trail recent writes) "
+    "instead of counting on every request."
+)
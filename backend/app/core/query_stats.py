@@ -0,0 +1,161 @@
+"""
+Per-request SQL statistics.
+
+``cursor_execute`` listeners on every Engine (sync, async and replicas) add
+each statement and its time to the ``QueryStats`` of the current request, set
+by ``QueryStatsMiddleware``, and to any active ``capture()``.
+The middleware reports the totals in a ``Server-Timing`` header
+(``db;dur=4.2;desc="3 queries"``), which browser dev tools show next to the request.
+
+With N+1 detection on (``DEBUG`` or ``QUERY_N_PLUS_ONE_DETECTION``), a statement
+that runs ``QUERY_N_PLUS_ONE_THRESHOLD`` or more times in one request with
+different parameters is logged as a likely N+1 pattern. The usual cause is a
+lazy-loaded relation read in a loop.
+
+Transaction control (BEGIN, SAVEPOINT, RELEASE, ROLLBACK) is not counted.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+_START = "query_stats_start"
+# Distinct parameter sets remembered per statement (enough to tell repeats apart)
+_MAX_PARAMS = 16
+
+
+class QueryStats:
+    """Statements run (and time spent in them) within one request or ``capture()``."""
+
+    def __init__(self, detect: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.detect = detect
+        self.statements: Dict[str, Tuple[int, set]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, parameters, elapsed: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += elapsed
+            if self.detect:
+                count, params = self.statements.get(statement, (0, set()))
+                if len(params) < _MAX_PARAMS:
+                    params.add(repr(parameters))
+                self.statements[statement] = (count + 1, params)
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(statement, times run) for statements repeated ``threshold``+ times with different parameters."""
+        threshold = settings.QUERY_N_PLUS_ONE_THRESHOLD if threshold is None else threshold
+        found = [
+            (statement, count)
+            for statement, (count, params) in self.statements.items()
+            if count >= threshold and len(params) > 1
+        ]
+        return sorted(found, key=lambda item: -item[1])
+
+    def server_timing(self) -> str:
+        noun = "query" if self.count == 1 else "queries"
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} {noun}"'
+
+    def summary(self) -> str:
+        """Count and time, then each statement by how often it ran (with detection on)."""
+        lines = [f"{self.count} queries in {self.duration * 1000:.1f} ms"]
+        for statement, (count, _) in sorted(self.statements.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {count}x {' '.join(statement.split())[:200]}")
+        return "\n".join(lines)
+
+
+# Stats of the request being handled (set by the middleware)
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_captures: List[QueryStats] = []
+
+
+def current() -> Optional[QueryStats]:
+    """Stats of the current request, if the middleware is counting it."""
+    return _request_stats.get()
+
+
+@contextmanager
+def capture(detect: bool = True) -> Iterator[QueryStats]:
+    """Count every statement run in the block, on any thread (tests and benchmarks)."""
+    stats = QueryStats(detect=detect)
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is None and not _captures:
+        return
+    conn.info.setdefault(_START, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(_START)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    if statement.lstrip()[:9].upper().startswith(_CONTROL):
+        return
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, parameters, elapsed)
+    for captured in list(_captures):
+        captured.record(statement, parameters, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context) -> None:
+    # The statement failed: after_cursor_execute will not pop its start time
+    started = context.connection.info.get(_START) if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+class QueryStatsMiddleware:
+    """Count each request's SQL, report it as ``Server-Timing`` and log likely N+1 patterns."""
+
+    def __init__(self, app: ASGIApp, detect: Optional[bool] = None, threshold: Optional[int] = None):
+        self.app = app
+        self.detect = (settings.DEBUG or settings.QUERY_N_PLUS_ONE_DETECTION) if detect is None else detect
+        self.threshold = settings.QUERY_N_PLUS_ONE_THRESHOLD if threshold is None else threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(detect=self.detect)
+        token = _request_stats.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            if self.detect:
+                for statement, count in stats.repeated(self.threshold):
+                    logger.warning(
+                        "Possible N+1 in %s %s: %d runs of %s",
+                        scope.get("method"), scope.get("path"), count, " ".join(statement.split())[:200],
+                    )
@@ -0,0 +1,125 @@
+"""
+Precomputed response snapshots.
+
+A Snapshot holds the serialized JSON of an expensive aggregate payload and
+rebuilds it on a background thread - immediately (debounced) after a commit
+touches one of its source tables, and otherwise every ``interval`` seconds.
+Serving a request is a single attribute read.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.core.cache import render_json
+from app.core.compression import EncodedBody
+from app.db.events import ChangeSet, on_commit
+
+logger = logging.getLogger(__name__)
+
+_registry: Dict[str, "Snapshot"] = {}
+
+
+class Snapshot:
+    """Background-refreshed, serialized payload."""
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[], Any],
+        *,
+        tables: Iterable[str],
+        interval: float,
+        debounce: float = 0.5,
+    ):
+        self.name = name
+        self._build = build
+        self.interval = interval
+        self.debounce = debounce
+        self.body: Optional[EncodedBody] = None
+        self.built_at: Optional[datetime] = None
+        self.build_seconds: float = 0.0
+        self.rebuilds = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        on_commit(self._on_change, tables=tables)
+        _registry[name] = self
+
+    def get(self) -> EncodedBody:
+        """Return the current snapshot, building it inline only if none exists yet."""
+        body = self.body
+        if body is None:
+            body = self.rebuild()
+        return body
+
+    def rebuild(self) -> EncodedBody:
+        """Build and publish a new snapshot (serialized so concurrent callers share one build)."""
+        with self._lock:
+            started = time.perf_counter()
+            body = EncodedBody(render_json(self._build()))
+            self.body = body
+            self.built_at = datetime.utcnow()
+            self.build_seconds = time.perf_counter() - started
+            self.rebuilds += 1
+            return body
+
+    def _on_change(self, changes: ChangeSet) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._wake.set()
+        else:
+            # No refresher running (CLI, tests): rebuild lazily on next read
+            self.body = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            woken = self._wake.wait(timeout=self.interval)
+            if self._stop.is_set():
+                break
+            if woken:
+                # Let a burst of admin writes settle into one rebuild
+                time.sleep(self.debounce)
+                self._wake.clear()
+            try:
+                self.rebuild()
+            except Exception:
+                self.failures += 1
+                logger.exception("Rebuilding snapshot %s failed", self.name)
+
+    def start(self) -> None:
+        """Build the first snapshot and start the background refresher."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        try:
+            self.rebuild()
+        except Exception:
+            self.failures += 1
+            logger.exception("Initial build of snapshot %s failed", self.name)
+        self._thread = threading.Thread(target=self._run, name=f"snapshot-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "built_at": self.built_at.isoformat() if self.built_at else None,
+            "build_seconds": round(self.build_seconds, 4),
+            "bytes": len(self.body) if self.body else 0,
+            "rebuilds": self.rebuilds,
+            "failures": self.failures,
+            "interval": self.interval,
+        }
+
+
+def snapshot_stats() -> Dict[str, dict]:
+    """Build counters for every registered snapshot."""
+    return {name: snapshot.stats() for name, snapshot in _registry.items()}
@@ -1,18 +1,20 @@
 # CRUD operations package
-from app.crud.trek import trek_crud
-from app.crud.expedition import expedition_crud
+from app.crud.trek import trek_crud, trek_async_crud
+from app.crud.expedition import expedition_crud, expedition_async_crud
 from app.crud.guide import guide_crud
 from app.crud.booking import booking_crud
 from app.crud.lead import lead_crud
 from app.crud.contact import contact_crud
 from app.crud.testimonial import testimonial_crud
 from app.crud.office import office_crud
-from app.crud.blog import blog_crud, blog_author_crud
+from app.crud.blog import blog_crud, blog_author_crud, blog_async_crud
 from app.crud.media import media as media_crud
 
 __all__ = [
     "trek_crud",
+    "trek_async_crud",
     "expedition_crud",
+    "expedition_async_crud",
     "guide_crud",
     "booking_crud",
     "lead_crud",
@@ -21,6 +23,7 @@ __all__ = [
     "office_crud",
     "blog_crud",
     "blog_author_crud",
+    "blog_async_crud",
     "media_crud",
 ]
 
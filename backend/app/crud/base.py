@@ -1,15 +1,30 @@
 """
 Base CRUD class with common operations.
 """
-from typing import Generic, TypeVar, Type, List, Optional, Any, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from datetime import datetime
+from typing import Callable, Generic, TypeVar, Type, List, Optional, Any, Dict, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session, joinedload, load_only, selectinload, subqueryload
+from sqlalchemy import and_, or_, select, func
 from pydantic import BaseModel
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+T = TypeVar("T")
+
+# List order as (attribute, descending) pairs; ``id`` is appended as the tie-breaker
+SortSpec = Tuple[Tuple[str, bool], ...]
+
+# Relationship loader per detail load strategy (see ``CRUDBase.relation_options``)
+LOADERS = {"selectin": selectinload, "joined": joinedload, "subquery": subqueryload}
+
+# Per-filter row counts behind ``approx_total`` (keyed on the compiled count query)
+approx_counts = TTLCache("approx_counts", maxsize=1024, ttl=settings.APPROX_COUNT_TTL_SECONDS)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -20,6 +35,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     * `model`: A SQLAlchemy model class
     """
     
+    # Default list order, also the key of cursor pagination (back it with an index)
+    default_sort: SortSpec = ()
+    
     def __init__(self, model: Type[ModelType]):
         self.model = model
     
@@ -33,23 +51,194 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             return db.query(self.model).filter(self.model.slug == slug).first()
         return None
     
+    def apply_fields(self, query: Query, fields: Optional[Sequence[str]]) -> Query:
+        """Load only the given column attributes (sparse fieldsets); None loads full rows."""
+        if fields:
+            query = query.options(load_only(*(getattr(self.model, f) for f in fields)))
+        return query
+    
+    def relation_options(self, relations: Sequence[str], strategy: Optional[str] = None) -> List[Any]:
+        """
+        Loader options for the ``relations`` of a detail query under ``strategy``
+        (default ``DETAIL_LOAD_STRATEGY``).
+
+        "selectin" joins many-to-one relations (one row each) and fetches every
+        collection with its own ``WHERE <fk> IN (...)`` query, so rows transferred
+        grow with the sum of the collection sizes. "joined" loads everything in
+        one statement, where collections multiply into a cartesian product that is
+        de-duplicated in Python. "subquery" is selectin with the parent query
+        repeated as a subquery.
+        """
+        strategy = strategy or settings.DETAIL_LOAD_STRATEGY
+        if strategy not in LOADERS:
+            raise ValueError(f"Unknown load strategy: {strategy!r}")
+        options = []
+        for name in relations:
+            attr = getattr(self.model, name)
+            loader = LOADERS[strategy] if attr.property.uselist else joinedload
+            options.append(loader(attr))
+        return options
+    
+    def apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """
+        Narrow ``query`` to ``filters``: equality on each model attribute, None
+        values ignored. Models with richer filters (ranges, ILIKE, joins) override
+        this, so lists, counts and validators share one definition.
+        """
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model, key) and value is not None:
+                    query = query.filter(getattr(self.model, key) == value)
+        return query
+    
+    # ============================================
+    # Pagination
+    # ============================================
+    
+    def sort_keys(self, sort: Optional[SortSpec] = None) -> SortSpec:
+        """``sort`` (default: ``default_sort``) with ``id`` appended so the order is total."""
+        sort = tuple(self.default_sort if sort is None else sort)
+        if any(attr == "id" for attr, _ in sort):
+            return sort
+        return sort + (("id", sort[-1][1] if sort else False),)
+    
+    def sort_fields(self, fields: Optional[Sequence[str]], sort: Optional[SortSpec] = None) -> Optional[List[str]]:
+        """Sparse ``fields`` plus the sort-key columns a cursor is built from."""
+        if not fields:
+            return None
+        return list(dict.fromkeys([*fields, *(attr for attr, _ in self.sort_keys(sort))]))
+    
+    def paginate(
+        self,
+        query: Query,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: Optional[SortSpec] = None,
+        sort_name: str = "default",
+    ) -> Query:
+        """
+        Order ``query`` by ``sort`` and cut one page from it.
+
+        Offset mode by default. With ``cursor`` (opt-in; ``""`` is the first page)
+        the page starts after the row the cursor points at - a seek on the
+        sort-key index instead of counting past ``skip`` rows - and ``skip`` is
+        ignored. ``sort_name`` ties cursors to the sort that issued them.
+        """
+        keys = [(getattr(self.model, attr), desc) for attr, desc in self.sort_keys(sort)]
+        if cursor:
+            values = decode_cursor(cursor, sort_name, len(keys))
+            query = query.filter(seek_after(keys, values))
+        if cursor is not None:
+            skip = 0
+        query = query.order_by(*(column.desc() if desc else column.asc() for column, desc in keys))
+        return query.offset(skip).limit(limit)
+    
+    def next_cursor(
+        self,
+        rows: Sequence[Any],
+        limit: int,
+        sort: Optional[SortSpec] = None,
+        sort_name: str = "default",
+    ) -> Optional[str]:
+        """Cursor for the page after ``rows`` (None when this page was the last)."""
+        if not rows or len(rows) < limit:
+            return None
+        last = rows[-1]
+        return encode_cursor(sort_name, [getattr(last, attr) for attr, _ in self.sort_keys(sort)])
+    
+    def fetch_page(
+        self,
+        db: Session,
+        query: Query,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: Optional[SortSpec] = None,
+        sort_name: str = "default",
+        approx_total: bool = False,
+        count_query: Optional[Query] = None,
+    ) -> Tuple[List[ModelType], int]:
+        """
+        One page of the filtered ``query`` (see ``paginate``) and the number of rows
+        matching it, in one round-trip.
+
+        The total rides along with every row as an uncorrelated scalar subquery,
+        ``(SELECT COUNT(id) ... WHERE <filters>)``, which the database evaluates
+        once, from an index where it can. Unlike ``COUNT(*) OVER ()`` it does not
+        make the page materialize and sort every matching row, so the page still
+        walks its sort index and stops at LIMIT, and keyset pages get the full
+        total too. Only an empty page past the end needs a second query.
+        ``count_query`` replaces the default ``COUNT(id)`` over ``query``.
+
+        With ``approx_total`` the total comes from a per-filter count cached for
+        ``APPROX_COUNT_TTL_SECONDS`` (seeded by the exact path on a miss) - for large
+        admin tables, where counting on every page turn costs more than it is worth.
+        """
+        page = self.paginate(query, skip=skip, limit=limit, cursor=cursor, sort=sort, sort_name=sort_name)
+        counter = count_query if count_query is not None else self.count_query(query)
+        key = None
+        if approx_total:
+            key = self.count_key(counter)
+            total = approx_counts.get(key)
+            if total is not None:
+                return page.all(), total
+        
+        results = page.add_columns(counter.statement.correlate(None).scalar_subquery().label("total")).all()
+        rows = [row[0] for row in results]
+        if rows:
+            total = results[0][1]
+        elif skip or cursor:
+            total = counter.scalar() or 0  # past the end; the rows may still exist before it
+        else:
+            total = 0
+        
+        if key is not None:
+            approx_counts.set(key, total)
+        return rows, total
+    
+    def count_query(self, query: Query) -> Query:
+        """``COUNT(id)`` over the rows of a (filtered, unpaginated) list query."""
+        return query.enable_eagerloads(False).order_by(None).with_entities(func.count(self.model.id))
+    
+    def count_key(self, count_query: Query) -> Tuple:
+        """``approx_counts`` key: the table plus the compiled count SQL and its parameters."""
+        compiled = count_query.statement.compile(dialect=count_query.session.get_bind().dialect)
+        return (self.model.__tablename__, compiled.string, tuple(sorted(compiled.params.items(), key=str)))
+    
     def get_multi(
         self, 
         db: Session, 
         *, 
         skip: int = 0, 
         limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None
     ) -> List[ModelType]:
-        """Get multiple records with pagination and optional filters."""
-        query = db.query(self.model)
-        
-        if filters:
-            for key, value in filters.items():
-                if hasattr(self.model, key) and value is not None:
-                    query = query.filter(getattr(self.model, key) == value)
-        
-        return query.offset(skip).limit(limit).all()
+        """
+        Get multiple records in ``default_sort`` order with pagination (offset, or
+        keyset with ``cursor``), optional filters and column projection.
+        """
+        query = self.apply_filters(self.apply_fields(db.query(self.model), self.sort_fields(fields)), filters)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
+    
+    def get_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        approx_total: bool = False
+    ) -> Tuple[List[ModelType], int]:
+        """``get_multi`` plus the filtered total, fetched together (see ``fetch_page``)."""
+        query = self.apply_filters(self.apply_fields(db.query(self.model), self.sort_fields(fields)), filters)
+        return self.fetch_page(db, query, skip=skip, limit=limit, cursor=cursor, approx_total=approx_total)
     
     def get_count(
         self, 
@@ -57,14 +246,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         filters: Optional[Dict[str, Any]] = None
     ) -> int:
         """Get total count of records with optional filters."""
-        query = db.query(func.count(self.model.id))
-        
-        if filters:
-            for key, value in filters.items():
-                if hasattr(self.model, key) and value is not None:
-                    query = query.filter(getattr(self.model, key) == value)
-        
-        return query.scalar() or 0
+        return self.apply_filters(db.query(func.count(self.model.id)), filters).scalar() or 0
+    
+    def get_validators(
+        self,
+        db: Session,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get (max updated_at, row count) for conditional GET validators.
+
+        Any insert or update moves the max timestamp and any delete changes the
+        count, so together they identify a version of the rows without loading them.
+        """
+        query = self.apply_filters(
+            db.query(func.max(self.model.updated_at), func.count(self.model.id)), filters
+        )
+        last_modified, count = query.one()
+        return last_modified, count or 0
     
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record."""
@@ -116,3 +315,81 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             ).offset(skip).limit(limit).all()
         return []
 
+
+class AsyncCRUDBase(Generic[ModelType]):
+    """
+    Read operations of a ``CRUDBase`` on an ``AsyncSession``.
+
+    Lookups by id/slug are issued as ``select()`` statements. List, page, count
+    and validator queries keep their single ``Query``-based definition on the
+    wrapped sync CRUD and are driven through ``AsyncSession.run_sync``, which
+    runs them on the async connection: every round-trip is awaited on the event
+    loop, none of it occupies a threadpool worker.
+
+    Only eagerly loaded relationships may be read from the returned rows; a lazy
+    load outside ``run_sync`` raises ``MissingGreenlet``.
+    
+    **Parameters**
+    * `crud`: The sync CRUD object whose model, filters and sorts are reused
+    """
+    
+    def __init__(self, crud: CRUDBase):
+        self.crud = crud
+        self.model = crud.model
+    
+    async def run(self, db: AsyncSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call the sync ``fn(session, *args, **kwargs)`` on ``db``'s async connection."""
+        return await db.run_sync(fn, *args, **kwargs)
+    
+    async def first(self, db: AsyncSession, *criteria: Any, options: Sequence[Any] = ()) -> Optional[ModelType]:
+        """First row matching ``criteria`` (de-duplicated, so joined collections are safe)."""
+        result = await db.execute(select(self.model).options(*options).where(*criteria))
+        return result.unique().scalars().first()
+    
+    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """Get a single record by ID."""
+        return await db.get(self.model, id)
+    
+    async def get_by_slug(self, db: AsyncSession, slug: str) -> Optional[ModelType]:
+        """Get a single record by slug (if model has slug field)."""
+        if hasattr(self.model, 'slug'):
+            return await self.first(db, self.model.slug == slug)
+        return None
+    
+    async def get_multi(self, db: AsyncSession, **kwargs: Any) -> List[ModelType]:
+        """See ``CRUDBase.get_multi``."""
+        return await self.run(db, self.crud.get_multi, **kwargs)
+    
+    async def get_page(self, db: AsyncSession, **kwargs: Any) -> Tuple[List[ModelType], int]:
+        """See ``CRUDBase.get_page``."""
+        return await self.run(db, self.crud.get_page, **kwargs)
+    
+    async def get_count(self, db: AsyncSession, filters: Optional[Dict[str, Any]] = None) -> int:
+        """See ``CRUDBase.get_count``."""
+        return await self.run(db, self.crud.get_count, filters)
+    
+    async def get_validators(
+        self, db: AsyncSession, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """See ``CRUDBase.get_validators``."""
+        return await self.run(db, self.crud.get_validators, filters)
+
+
+def load_strategy(endpoint: str) -> str:
+    """Detail load strategy for ``endpoint`` (its ``DETAIL_LOAD_STRATEGIES`` entry or the default)."""
+    return settings.DETAIL_LOAD_STRATEGIES.get(endpoint, settings.DETAIL_LOAD_STRATEGY)
+
+
+def seek_after(keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    """
+    Rows strictly after ``values`` in the order given by ``keys`` ((column, descending) pairs):
+    ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...``, with ``<`` for descending keys.
+
+    Spelled out rather than as a row-value comparison so mixed directions work
+    and every backend can turn the leading term into an index range.
+    """
+    clauses = []
+    for i, (column, desc) in enumerate(keys):
+        step = column < values[i] if desc else column > values[i]
+        clauses.append(and_(*(keys[j][0] == values[j] for j in range(i)), step))
+    return or_(*clauses)
@@ -1,18 +1,26 @@
 """
 CRUD operations for Blog models.
 """
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from app.crud.base import CRUDBase
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
+from sqlalchemy import func, select
+from app.crud import blog_counts, blog_search
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from app.db.models.blog import BlogPost, BlogAuthor, BlogCategory, BlogTag, blog_post_tags
+from app.core.cache import ResponseCache
+from app.db.events import on_commit
 from app.models.blog import (
     BlogPostCreate, BlogPostUpdate,
     BlogAuthorCreate, BlogAuthorUpdate,
-    BlogCategoryCreate, BlogCategoryUpdate,
+    BlogCategoryCreate, BlogCategoryUpdate, BlogCategoryTreeResponse,
     BlogTagCreate, BlogTagUpdate
 )
 
+# Relationships rendered with a post's detail page
+BLOG_POST_DETAIL_RELATIONS = ("author", "category_rel", "tags_rel")
+
 
 class CRUDBlogAuthor(CRUDBase[BlogAuthor, BlogAuthorCreate, BlogAuthorUpdate]):
     """CRUD operations for BlogAuthor model."""
@@ -45,19 +53,44 @@ class CRUDBlogCategory(CRUDBase[BlogCategory, BlogCategoryCreate, BlogCategoryUp
         db: Session,
         active_only: bool = False
     ) -> List[Dict[str, Any]]:
-        """Get all categories with post counts."""
-        query = db.query(
-            BlogCategory,
-            func.count(BlogPost.id).label('post_count')
-        ).outerjoin(
-            BlogPost, BlogPost.category_id == BlogCategory.id
-        ).group_by(BlogCategory.id)
-        
+        """Get all categories with post counts (the materialized ``post_count``)."""
+        query = db.query(BlogCategory)
         if active_only:
             query = query.filter(BlogCategory.is_active == True)
         
         results = query.order_by(BlogCategory.display_order, BlogCategory.name).all()
-        return [{"category": cat, "post_count": count} for cat, count in results]
+        return [{"category": cat, "post_count": cat.post_count} for cat in results]
+    
+    def get_count_tree(self, db: Session, active_only: bool = False) -> List[BlogCategoryTreeResponse]:
+        """
+        Root categories with nested children and post counts, ordered by
+        display_order then name at every level. Children of a filtered-out
+        (inactive) parent are left out.
+        """
+        nodes = {}
+        for item in self.get_all_with_counts(db, active_only=active_only):
+            cat = item["category"]
+            nodes[cat.id] = BlogCategoryTreeResponse(
+                id=cat.id,
+                name=cat.name,
+                slug=cat.slug,
+                description=cat.description,
+                parent_id=cat.parent_id,
+                display_order=cat.display_order,
+                is_active=cat.is_active,
+                created_at=cat.created_at,
+                updated_at=cat.updated_at,
+                post_count=item["post_count"],
+                children=[],
+            )
+        roots = []
+        # Categories arrive in display order, so each children list is already sorted
+        for node in nodes.values():
+            if node.parent_id is None:
+                roots.append(node)
+            elif node.parent_id in nodes:
+                nodes[node.parent_id].children.append(node)
+        return roots
     
     def get_children(self, db: Session, parent_id: int) -> List[BlogCategory]:
         """Get child categories of a parent."""
@@ -74,15 +107,9 @@ class CRUDBlogTag(CRUDBase[BlogTag, BlogTagCreate, BlogTagUpdate]):
         return db.query(BlogTag).filter(BlogTag.slug == slug).first()
     
     def get_all_with_counts(self, db: Session) -> List[Dict[str, Any]]:
-        """Get all tags with post counts."""
-        results = db.query(
-            BlogTag,
-            func.count(blog_post_tags.c.post_id).label('post_count')
-        ).outerjoin(
-            blog_post_tags, blog_post_tags.c.tag_id == BlogTag.id
-        ).group_by(BlogTag.id).order_by(BlogTag.name).all()
-        
-        return [{"tag": tag, "post_count": count} for tag, count in results]
+        """Get all tags with post counts (the materialized ``post_count``)."""
+        results = db.query(BlogTag).order_by(BlogTag.name).all()
+        return [{"tag": tag, "post_count": tag.post_count} for tag in results]
     
     def get_by_ids(self, db: Session, ids: List[int]) -> List[BlogTag]:
         """Get tags by list of IDs."""
@@ -92,44 +119,86 @@ class CRUDBlogTag(CRUDBase[BlogTag, BlogTagCreate, BlogTagUpdate]):
 class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
     """CRUD operations for BlogPost model."""
     
-    def get_with_author(self, db: Session, id: int) -> Optional[BlogPost]:
-        """Get blog post with author."""
+    # Newest first; backed by ix_blog_posts_created_at_id
+    default_sort = (("created_at", True),)
+    
+    def get_with_author(
+        self, db: Session, id: int, *, strategy: Optional[str] = None
+    ) -> Optional[BlogPost]:
+        """Get blog post with author, category and tags, loaded per ``strategy``."""
         return db.query(BlogPost).options(
-            joinedload(BlogPost.author),
-            joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            *self.relation_options(BLOG_POST_DETAIL_RELATIONS, strategy)
         ).filter(BlogPost.id == id).first()
     
     def get_by_slug(self, db: Session, slug: str) -> Optional[BlogPost]:
         """Get blog post by slug."""
         return db.query(BlogPost).filter(BlogPost.slug == slug).first()
     
-    def get_by_slug_with_author(self, db: Session, slug: str) -> Optional[BlogPost]:
-        """Get blog post by slug with author."""
+    def get_by_slug_with_author(
+        self, db: Session, slug: str, *, strategy: Optional[str] = None
+    ) -> Optional[BlogPost]:
+        """Get blog post by slug with author, category and tags, loaded per ``strategy``."""
         return db.query(BlogPost).options(
-            joinedload(BlogPost.author),
-            joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            *self.relation_options(BLOG_POST_DETAIL_RELATIONS, strategy)
         ).filter(BlogPost.slug == slug).first()
     
-    def get_multi_with_author(
+    def get_validators(
         self,
         db: Session,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        category: Optional[str] = None,
-        category_id: Optional[int] = None,
-        featured: Optional[bool] = None,
-        status: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> List[BlogPost]:
-        """Get blog posts with author."""
-        query = db.query(BlogPost).options(
-            joinedload(BlogPost.author),
-            joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get (max updated_at, row count) for the post list, including the authors
+        and categories rendered with each post (editing one does not touch the
+        post rows).
+        """
+        authors = select(func.max(BlogAuthor.updated_at)).correlate(None).scalar_subquery()
+        categories = select(func.max(BlogCategory.updated_at)).correlate(None).scalar_subquery()
+        query = self.apply_filters(
+            db.query(func.max(BlogPost.updated_at), func.count(BlogPost.id), authors, categories), filters
         )
+        posts_updated, count, authors_updated, categories_updated = query.one()
+        if not count:
+            return None, 0
+        timestamps = (posts_updated, authors_updated, categories_updated)
+        return max(ts for ts in timestamps if ts is not None), count
+    
+    def get_detail_validators(
+        self, db: Session, slug: str
+    ) -> Tuple[Optional[datetime], int, int]:
+        """
+        Get (max updated_at, tag count, tag id checksum) for a post, its author and category.
+
+        Re-tagging does not touch the post row, so the tag count and id sum are
+        included to catch changes to the association table.
+        """
+        post = db.execute(
+            select(BlogPost.id, BlogPost.updated_at, BlogAuthor.updated_at, BlogCategory.updated_at)
+            .outerjoin(BlogAuthor, BlogPost.author_id == BlogAuthor.id)
+            .outerjoin(BlogCategory, BlogPost.category_id == BlogCategory.id)
+            .where(BlogPost.slug == slug)
+        ).first()
+        if not post:
+            return None, 0, 0
+        post_id, *timestamps = post
+        tag_count, tag_sum = db.execute(
+            select(func.count(), func.coalesce(func.sum(blog_post_tags.c.tag_id), 0))
+            .where(blog_post_tags.c.post_id == post_id)
+        ).one()
+        last_modified = max(ts for ts in timestamps if ts is not None)
+        return last_modified, tag_count, tag_sum
+    
+    def apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """
+        Narrow ``query`` by the post list filters: category (slug), category_id,
+        featured, status and search (full-text index when available, else ILIKE).
+        """
+        filters = filters or {}
+        category = filters.get("category")
+        category_id = filters.get("category_id")
+        featured = filters.get("featured")
+        status = filters.get("status")
+        search = filters.get("search")
         
         if category:
             # Filter by category slug via FK relationship
@@ -141,38 +210,77 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         if status:
             query = query.filter(BlogPost.status == status)
         if search:
-            query = query.filter(
-                BlogPost.title.ilike(f"%{search}%") |
-                BlogPost.content.ilike(f"%{search}%")
+            matching = blog_search.matching_ids(query.session, search)
+            if matching is not None:
+                query = query.filter(BlogPost.id.in_(matching))
+            else:
+                query = query.filter(
+                    BlogPost.title.ilike(f"%{search}%") |
+                    BlogPost.content.ilike(f"%{search}%")
+                )
+        return query
+    
+    def _list_query(
+        self, db: Session, fields: Optional[Sequence[str]], cursor: Optional[str], filters: Dict[str, Any]
+    ) -> Query:
+        if fields:
+            query = self.apply_fields(db.query(BlogPost), self.sort_fields(fields))
+        else:
+            # Tags by primary-key IN: joined, the nested association join is
+            # materialized whole (a scan of blog_post_tags per page)
+            query = db.query(BlogPost).options(
+                joinedload(BlogPost.author),
+                joinedload(BlogPost.category_rel),
+                selectinload(BlogPost.tags_rel)
             )
         
-        return query.order_by(BlogPost.created_at.desc()).offset(skip).limit(limit).all()
+        search = filters.get("search")
+        ranked = blog_search.ranked_ids(db, search) if search and cursor is None else None
+        if ranked is not None:
+            # Full-text index: best matches first (the join does the filtering)
+            query = query.join(ranked, ranked.c.post_id == BlogPost.id).order_by(ranked.c.rank)
+            filters = {**filters, "search": None}
+        return self.apply_filters(query, filters)
     
-    def get_count(
+    def get_multi_with_author(
         self,
         db: Session,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> int:
-        """Get count of posts with optional filters."""
-        query = db.query(func.count(BlogPost.id))
-        
-        if filters:
-            if filters.get("category"):
-                query = query.join(BlogCategory, BlogPost.category_id == BlogCategory.id).filter(BlogCategory.slug == filters["category"])
-            if filters.get("category_id"):
-                query = query.filter(BlogPost.category_id == filters["category_id"])
-            if filters.get("featured") is not None:
-                query = query.filter(BlogPost.featured == filters["featured"])
-            if filters.get("status"):
-                query = query.filter(BlogPost.status == filters["status"])
-            if filters.get("search"):
-                s = filters["search"]
-                query = query.filter(
-                    BlogPost.title.ilike(f"%{s}%") |
-                    BlogPost.content.ilike(f"%{s}%")
-                )
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> List[BlogPost]:
+        """
+        Get blog posts matching ``filters`` (see ``apply_filters``) with author, newest first.
         
-        return query.scalar() or 0
+        With ``fields`` only those columns are loaded and the author/category/tag
+        relationships are skipped (sparse fieldsets only cover plain columns).
+        A ``search`` ranks best matches first; with ``cursor`` pages are
+        keyset-paginated and search results are then filtered by the index but
+        kept in date order (relevance is not a seekable key).
+        """
+        query = self._list_query(db, fields, cursor, filters)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
+    
+    def get_page_with_author(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> Tuple[List[BlogPost], int]:
+        """``get_multi_with_author`` plus the filtered total, fetched together."""
+        return self.fetch_page(
+            db, self._list_query(db, fields, cursor, filters),
+            skip=skip, limit=limit, cursor=cursor,
+            # Count through the uncorrelated IN, not the ranked join
+            count_query=self.apply_filters(db.query(func.count(BlogPost.id)), filters),
+        )
     
     def get_by_category(
         self, 
@@ -185,7 +293,7 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         return db.query(BlogPost).options(
             joinedload(BlogPost.author),
             joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            selectinload(BlogPost.tags_rel)
         ).join(
             BlogCategory, BlogPost.category_id == BlogCategory.id
         ).filter(
@@ -203,7 +311,7 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         return db.query(BlogPost).options(
             joinedload(BlogPost.author),
             joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            selectinload(BlogPost.tags_rel)
         ).join(
             blog_post_tags, blog_post_tags.c.post_id == BlogPost.id
         ).filter(
@@ -219,7 +327,7 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         return db.query(BlogPost).options(
             joinedload(BlogPost.author),
             joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            selectinload(BlogPost.tags_rel)
         ).filter(
             BlogPost.status == "published"
         ).order_by(BlogPost.created_at.desc()).limit(limit).all()
@@ -240,7 +348,7 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         return db.query(BlogPost).options(
             joinedload(BlogPost.author),
             joinedload(BlogPost.category_rel),
-            joinedload(BlogPost.tags_rel)
+            selectinload(BlogPost.tags_rel)
         ).filter(
             BlogPost.slug != current_slug,
             BlogPost.status == "published",
@@ -340,7 +448,81 @@ class CRUDBlogPost(CRUDBase[BlogPost, BlogPostCreate, BlogPostUpdate]):
         return db_obj
 
 
+class AsyncCRUDBlogCategory(AsyncCRUDBase[BlogCategory]):
+    """Blog category reads on an ``AsyncSession`` (see ``AsyncCRUDBase``)."""
+    
+    crud: CRUDBlogCategory
+    
+    async def get_count_tree(self, db: AsyncSession, active_only: bool = False) -> List[BlogCategoryTreeResponse]:
+        """See ``CRUDBlogCategory.get_count_tree``."""
+        return await self.run(db, self.crud.get_count_tree, active_only=active_only)
+
+
+class AsyncCRUDBlogTag(AsyncCRUDBase[BlogTag]):
+    """Blog tag reads on an ``AsyncSession`` (see ``AsyncCRUDBase``)."""
+    
+    crud: CRUDBlogTag
+    
+    async def get_all_with_counts(self, db: AsyncSession) -> List[Dict[str, Any]]:
+        """See ``CRUDBlogTag.get_all_with_counts``."""
+        return await self.run(db, self.crud.get_all_with_counts)
+
+
+class AsyncCRUDBlogPost(AsyncCRUDBase[BlogPost]):
+    """Blog post reads on an ``AsyncSession`` (see ``AsyncCRUDBase``)."""
+    
+    crud: CRUDBlogPost
+    
+    async def get_with_author(
+        self, db: AsyncSession, id: int, *, strategy: Optional[str] = None
+    ) -> Optional[BlogPost]:
+        """See ``CRUDBlogPost.get_with_author``."""
+        return await self.first(
+            db, BlogPost.id == id, options=self.crud.relation_options(BLOG_POST_DETAIL_RELATIONS, strategy)
+        )
+    
+    async def get_by_slug_with_author(
+        self, db: AsyncSession, slug: str, *, strategy: Optional[str] = None
+    ) -> Optional[BlogPost]:
+        """See ``CRUDBlogPost.get_by_slug_with_author``."""
+        return await self.first(
+            db, BlogPost.slug == slug, options=self.crud.relation_options(BLOG_POST_DETAIL_RELATIONS, strategy)
+        )
+    
+    async def get_detail_validators(self, db: AsyncSession, slug: str) -> Tuple[Optional[datetime], int, int]:
+        """See ``CRUDBlogPost.get_detail_validators``."""
+        return await self.run(db, self.crud.get_detail_validators, slug)
+    
+    async def get_multi_with_author(self, db: AsyncSession, **kwargs: Any) -> List[BlogPost]:
+        """See ``CRUDBlogPost.get_multi_with_author``."""
+        return await self.run(db, self.crud.get_multi_with_author, **kwargs)
+    
+    async def get_page_with_author(self, db: AsyncSession, **kwargs: Any) -> Tuple[List[BlogPost], int]:
+        """See ``CRUDBlogPost.get_page_with_author``."""
+        return await self.run(db, self.crud.get_page_with_author, **kwargs)
+    
+    async def get_by_category(self, db: AsyncSession, category: str, limit: int = 100) -> List[BlogPost]:
+        """See ``CRUDBlogPost.get_by_category``."""
+        return await self.run(db, self.crud.get_by_category, category, limit=limit)
+    
+    async def get_recent(self, db: AsyncSession, limit: int = 5) -> List[BlogPost]:
+        """See ``CRUDBlogPost.get_recent``."""
+        return await self.run(db, self.crud.get_recent, limit=limit)
+    
+    async def get_related(self, db: AsyncSession, *, current_slug: str, limit: int = 3) -> List[BlogPost]:
+        """See ``CRUDBlogPost.get_related``."""
+        return await self.run(db, self.crud.get_related, current_slug=current_slug, limit=limit)
+
+
 blog_author_crud = CRUDBlogAuthor(BlogAuthor)
 blog_category_crud = CRUDBlogCategory(BlogCategory)
 blog_tag_crud = CRUDBlogTag(BlogTag)
 blog_crud = CRUDBlogPost(BlogPost)
+blog_category_async_crud = AsyncCRUDBlogCategory(blog_category_crud)
+blog_tag_async_crud = AsyncCRUDBlogTag(blog_tag_crud)
+blog_async_crud = AsyncCRUDBlogPost(blog_crud)
+
+# Serialized category trees. post_count changes with every post write, so any
+# commit touching posts or categories drops them.
+blog_category_cache = ResponseCache("blog_categories")
+on_commit(blog_category_cache.clear, tables=("blog_categories", "blog_posts"))
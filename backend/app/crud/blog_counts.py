@@ -0,0 +1,129 @@
+"""
+Materialized post counts for blog categories and tags.
+
+``blog_categories.post_count`` and ``blog_tags.post_count`` are adjusted in
+the same transaction as the post write, so the category tree and the tag list
+read a column instead of aggregating blog_posts and blog_post_tags on every
+request. After each flush the net change per category and tag - from posts
+created, deleted, moved between categories or re-tagged - is applied as
+``post_count = post_count + n``, which stays correct under concurrent writers.
+
+Writes that bypass the ORM (raw SQL, bulk imports) are not seen; ``reconcile``
+recounts everything and reports the rows it corrected.
+"""
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app.db.models.blog import BlogCategory, BlogPost, BlogTag, blog_post_tags
+
+_DELETED_KEY = "blog_counts_deleted"
+
+
+def _ids(values) -> List[int]:
+    return [value for value in values if value is not None]
+
+
+@event.listens_for(Session, "before_flush")
+def _count_deleted(session: Session, flush_context, instances) -> None:
+    # Read while the deleted posts (and their blog_post_tags rows) are still there
+    deleted = [obj for obj in session.deleted if isinstance(obj, BlogPost) and obj.id is not None]
+    if not deleted:
+        return
+    categories, tags = session.info.setdefault(_DELETED_KEY, (Counter(), Counter()))
+    for post in deleted:
+        history = inspect(post).attrs.category_id.history
+        categories.update(_ids(history.deleted or [post.category_id]))
+    rows = session.connection().execute(
+        select(blog_post_tags.c.tag_id).where(blog_post_tags.c.post_id.in_([post.id for post in deleted]))
+    )
+    tags.update(tag_id for (tag_id,) in rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_deltas(session: Session, flush_context) -> None:
+    deleted_categories, deleted_tags = session.info.pop(_DELETED_KEY, (Counter(), Counter()))
+    categories = Counter({row_id: -n for row_id, n in deleted_categories.items()})
+    tags = Counter({row_id: -n for row_id, n in deleted_tags.items()})
+
+    for post in session.new:
+        if isinstance(post, BlogPost):
+            categories.update(_ids([post.category_id]))
+            tags.update(tag.id for tag in inspect(post).attrs.tags_rel.history.added)
+    for post in session.dirty:
+        if not isinstance(post, BlogPost) or post in session.deleted:
+            continue
+        state = inspect(post)
+        history = state.attrs.category_id.history
+        if history.has_changes():
+            categories.subtract(_ids(history.deleted))
+            categories.update(_ids(history.added))
+        history = state.attrs.tags_rel.history
+        if history.has_changes():
+            tags.subtract(tag.id for tag in history.deleted)
+            tags.update(tag.id for tag in history.added)
+
+    _apply(session, BlogCategory, categories)
+    _apply(session, BlogTag, tags)
+
+
+def _apply(session: Session, model, deltas: Counter) -> None:
+    by_delta: Dict[int, List[int]] = {}
+    for row_id, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(row_id)
+    conn = session.connection()
+    for delta, ids in by_delta.items():
+        conn.execute(update(model).where(model.id.in_(ids)).values(post_count=model.post_count + delta))
+        for row_id in ids:
+            obj = session.identity_map.get(identity_key(model, row_id))
+            if obj is not None:
+                session.expire(obj, ["post_count"])
+
+
+def _category_counts():
+    return (
+        select(func.count(BlogPost.id))
+        .where(BlogPost.category_id == BlogCategory.id)
+        .correlate(BlogCategory)
+        .scalar_subquery()
+    )
+
+
+def _tag_counts():
+    return (
+        select(func.count(blog_post_tags.c.post_id))
+        .where(blog_post_tags.c.tag_id == BlogTag.id)
+        .correlate(BlogTag)
+        .scalar_subquery()
+    )
+
+
+def drift(db: Session) -> Dict[str, int]:
+    """Number of categories and tags whose stored post_count disagrees with a recount."""
+    return {
+        "categories": db.query(BlogCategory).filter(BlogCategory.post_count != _category_counts()).count(),
+        "tags": db.query(BlogTag).filter(BlogTag.post_count != _tag_counts()).count(),
+    }
+
+
+def reconcile(db: Session) -> Dict[str, int]:
+    """Recount every category and tag; returns how many rows were corrected."""
+    conn = db.connection()
+    corrected = {
+        "categories": conn.execute(
+            update(BlogCategory)
+            .where(BlogCategory.post_count != _category_counts())
+            .values(post_count=_category_counts())
+        ).rowcount,
+        "tags": conn.execute(
+            update(BlogTag)
+            .where(BlogTag.post_count != _tag_counts())
+            .values(post_count=_tag_counts())
+        ).rowcount,
+    }
+    db.commit()
+    return corrected
@@ -0,0 +1,323 @@
+"""
+Full-text search index for blog posts.
+
+Posts are mirrored into ``blog_posts_fts`` as plain text (HTML stripped):
+an FTS5 virtual table on SQLite, an InnoDB table with a FULLTEXT index on
+MySQL. Rows are written in the same transaction as the post (mapper events),
+so the index follows every ORM create, update and delete; ``rebuild`` repopulates
+it from scratch. When the index table is missing the callers fall back to the
+ILIKE scan.
+"""
+import html
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import Connection, Float, Integer, Select, column, event, inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Subquery
+
+from app.db.models.blog import BlogPost
+
+FTS_TABLE = "blog_posts_fts"
+
+# Relative weight of title / excerpt / body matches in the ranking
+TITLE_WEIGHT = 10.0
+EXCERPT_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+
+SNIPPET_TOKENS = 24
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+# Control characters used as match markers so the text can be HTML-escaped first
+_OPEN, _CLOSE = "\x02", "\x03"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Engine URL -> whether the index table exists (checked once per process)
+_available: Dict[str, bool] = {}
+
+
+# ============================================
+# Schema
+# ============================================
+
+def create_index_sql(dialect: str) -> List[str]:
+    """DDL for the search table on ``dialect`` (migration i7j8k9l0m1n2 has its own copy)."""
+    if dialect == "sqlite":
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "title, excerpt, body, tokenize = 'porter unicode61')"
+        ]
+    if dialect == "mysql":
+        return [
+            f"CREATE TABLE IF NOT EXISTS {FTS_TABLE} ("
+            "post_id INT NOT NULL PRIMARY KEY, "
+            "title VARCHAR(255) NOT NULL, "
+            "excerpt TEXT NULL, "
+            "body LONGTEXT NOT NULL, "
+            "FULLTEXT KEY ft_blog_posts_fts (title, excerpt, body)"
+            ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        ]
+    return []
+
+
+def _id_column(dialect: str) -> str:
+    return "rowid" if dialect == "sqlite" else "post_id"
+
+
+def ensure_index(engine: Engine) -> bool:
+    """Create the search table if the backend supports it. Returns availability."""
+    statements = create_index_sql(engine.dialect.name)
+    if not statements:
+        return False
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+    _available[str(engine.url)] = True
+    return True
+
+
+def is_available(bind) -> bool:
+    """Whether the search table exists for this engine/connection/session."""
+    if isinstance(bind, Session):
+        bind = bind.get_bind()
+    engine = bind.engine if isinstance(bind, Connection) else bind
+    key = str(engine.url)
+    if key not in _available:
+        _available[key] = (
+            engine.dialect.name in ("sqlite", "mysql") and inspect(bind).has_table(FTS_TABLE)
+        )
+    return _available[key]
+
+
+# ============================================
+# Sync
+# ============================================
+
+def html_to_text(value: Optional[str]) -> str:
+    """Strip tags and entities so markup does not pollute the index or snippets."""
+    if not value:
+        return ""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", value))).strip()
+
+
+def _document(post: BlogPost) -> dict:
+    return {
+        "id": post.id,
+        "title": post.title or "",
+        "excerpt": html_to_text(post.excerpt),
+        "body": html_to_text(post.content),
+    }
+
+
+def _upsert(conn: Connection, doc: dict) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": doc["id"]})
+        conn.execute(
+            text(f"INSERT INTO {FTS_TABLE} (rowid, title, excerpt, body) VALUES (:id, :title, :excerpt, :body)"),
+            doc,
+        )
+    else:
+        conn.execute(
+            text(f"REPLACE INTO {FTS_TABLE} (post_id, title, excerpt, body) VALUES (:id, :title, :excerpt, :body)"),
+            doc,
+        )
+
+
+def _delete(conn: Connection, post_id: int) -> None:
+    conn.execute(
+        text(f"DELETE FROM {FTS_TABLE} WHERE {_id_column(conn.dialect.name)} = :id"), {"id": post_id}
+    )
+
+
+@event.listens_for(BlogPost, "after_insert")
+@event.listens_for(BlogPost, "after_update")
+def _index_post(mapper, connection: Connection, post: BlogPost) -> None:
+    if is_available(connection):
+        _upsert(connection, _document(post))
+
+
+@event.listens_for(BlogPost, "after_delete")
+def _unindex_post(mapper, connection: Connection, post: BlogPost) -> None:
+    if is_available(connection):
+        _delete(connection, post.id)
+
+
+def rebuild(db: Session, batch_size: int = 500) -> int:
+    """Repopulate the index from blog_posts. Returns the number of posts indexed."""
+    conn = db.connection()
+    ensure_index(conn.engine)
+    conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    count = 0
+    last_id = 0
+    while True:
+        posts = (
+            db.query(BlogPost.id, BlogPost.title, BlogPost.excerpt, BlogPost.content)
+            .filter(BlogPost.id > last_id)
+            .order_by(BlogPost.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not posts:
+            break
+        for post in posts:
+            _upsert(conn, _document(post))
+        count += len(posts)
+        last_id = posts[-1].id
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')"))
+    db.commit()
+    return count
+
+
+def is_stale(db: Session) -> bool:
+    """
+    Whether the index row count disagrees with blog_posts, e.g. after posts were
+    written by a process that never imported this module (raw seeds, SQL imports).
+    """
+    if not is_available(db):
+        return False
+    indexed = db.execute(text(f"SELECT COUNT(*) FROM {FTS_TABLE}")).scalar()
+    return indexed != db.query(BlogPost).count()
+
+
+# ============================================
+# Query
+# ============================================
+
+def terms(query: str) -> List[str]:
+    """Split user input into word terms (operators and quotes are dropped)."""
+    return [t.lower() for t in _WORD_RE.findall(query or "")]
+
+
+def match_expression(query: str, dialect: str) -> Optional[str]:
+    """All terms must match; the last one is a prefix so results update while typing."""
+    words = terms(query)
+    if not words:
+        return None
+    if dialect == "sqlite":
+        parts = [f'"{w}"' for w in words]
+        parts[-1] += "*"
+        return " ".join(parts)
+    parts = [f"+{w}" for w in words]
+    parts[-1] += "*"
+    return " ".join(parts)
+
+
+def _expression(db: Session, query: str) -> Optional[tuple]:
+    if not is_available(db):
+        return None
+    dialect = db.get_bind().dialect.name
+    expression = match_expression(query, dialect)
+    return (dialect, expression) if expression is not None else None
+
+
+def matching_ids(db: Session, query: str) -> Optional[Select]:
+    """
+    ``SELECT post_id`` of posts matching ``query`` (no ranking), for counts and
+    ``IN`` filters. Used as an uncorrelated ``IN`` the match runs once; joined,
+    SQLite may probe the index once per outer row instead.
+
+    Returns None when the index is unavailable or the query has no terms.
+    """
+    match = _expression(db, query)
+    if match is None:
+        return None
+    dialect, expression = match
+    if dialect == "sqlite":
+        stmt = text(f"SELECT rowid AS post_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q")
+    else:
+        stmt = text(
+            f"SELECT post_id FROM {FTS_TABLE} "
+            f"WHERE MATCH(title, excerpt, body) AGAINST (:q IN BOOLEAN MODE)"
+        )
+    sub = stmt.bindparams(q=expression).columns(column("post_id", Integer)).subquery("search_ids")
+    return select(sub.c.post_id)
+
+
+def ranked_ids(db: Session, query: str) -> Optional[Subquery]:
+    """
+    Subquery of ``(post_id, rank)`` for posts matching ``query``; lower rank is better.
+
+    Returns None when the index is unavailable or the query has no terms.
+    """
+    match = _expression(db, query)
+    if match is None:
+        return None
+    dialect, expression = match
+    if dialect == "sqlite":
+        stmt = text(
+            f"SELECT rowid AS post_id, "
+            f"bm25({FTS_TABLE}, {TITLE_WEIGHT}, {EXCERPT_WEIGHT}, {BODY_WEIGHT}) AS rank "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q"
+        )
+    else:
+        stmt = text(
+            f"SELECT post_id, -MATCH(title, excerpt, body) AGAINST (:q IN BOOLEAN MODE) AS rank "
+            f"FROM {FTS_TABLE} WHERE MATCH(title, excerpt, body) AGAINST (:q IN BOOLEAN MODE)"
+        )
+    return (
+        stmt.bindparams(q=expression)
+        .columns(column("post_id", Integer), column("rank", Float))
+        .subquery("search")
+    )
+
+
+def highlights(db: Session, query: str, post_ids: List[int]) -> Dict[int, dict]:
+    """``{post_id: {"title": ..., "snippet": ...}}`` with matches wrapped in <mark>."""
+    if not post_ids or not is_available(db):
+        return {}
+    dialect = db.get_bind().dialect.name
+    expression = match_expression(query, dialect)
+    if expression is None:
+        return {}
+    ids = ",".join(str(int(i)) for i in post_ids)
+    if dialect == "sqlite":
+        rows = db.execute(
+            text(
+                f"SELECT rowid, highlight({FTS_TABLE}, 0, :open, :close), "
+                f"snippet({FTS_TABLE}, 2, :open, :close, '…', {SNIPPET_TOKENS}) "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q AND rowid IN ({ids})"
+            ),
+            {"q": expression, "open": _OPEN, "close": _CLOSE},
+        )
+        return {row[0]: {"title": _to_html(row[1]), "snippet": _to_html(row[2])} for row in rows}
+
+    # MySQL has no snippet function: cut a window around the first match in Python
+    rows = db.execute(
+        text(
+            f"SELECT post_id, title, body FROM {FTS_TABLE} WHERE post_id IN ({ids})"
+        )
+    )
+    words = terms(query)
+    return {
+        row[0]: {"title": _to_html(_mark(row[1], words)), "snippet": _snippet(row[2], words)}
+        for row in rows
+    }
+
+
+def _to_html(marked: str) -> str:
+    """Escape text and turn the match markers into <mark> tags."""
+    return html.escape(marked).replace(_OPEN, HIGHLIGHT_OPEN).replace(_CLOSE, HIGHLIGHT_CLOSE)
+
+
+def _mark(value: str, words: List[str]) -> str:
+    pattern = re.compile(r"\b(" + "|".join(map(re.escape, words)) + r")\w*", re.IGNORECASE)
+    return pattern.sub(lambda m: f"{_OPEN}{m.group(0)}{_CLOSE}", value)
+
+
+def _snippet(body: str, words: List[str]) -> str:
+    tokens = body.split(" ")
+    lowered = [t.lower() for t in tokens]
+    start = next(
+        (i for i, t in enumerate(lowered) if any(t.lstrip("\"'(").startswith(w) for w in words)),
+        0,
+    )
+    start = max(0, start - SNIPPET_TOKENS // 4)
+    window = " ".join(tokens[start:start + SNIPPET_TOKENS])
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + SNIPPET_TOKENS < len(tokens) else ""
+    return prefix + _to_html(_mark(window, words)) + suffix
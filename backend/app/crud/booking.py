@@ -11,6 +11,9 @@ from app.models.booking import BookingCreate, BookingUpdate
 class CRUDBooking(CRUDBase[Booking, BookingCreate, BookingUpdate]):
     """CRUD operations for Booking model."""
     
+    # Newest first; backed by ix_bookings_created_at_id
+    default_sort = (("created_at", True),)
+    
     def get_by_email(self, db: Session, email: str) -> List[Booking]:
         """Get all bookings for an email."""
         return db.query(Booking).filter(Booking.email == email).all()
@@ -24,12 +27,12 @@ class CRUDBooking(CRUDBase[Booking, BookingCreate, BookingUpdate]):
         db: Session, 
         status: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Booking]:
-        """Get bookings by status."""
-        return db.query(Booking).filter(
-            Booking.status == status
-        ).offset(skip).limit(limit).all()
+        """Get bookings by status (newest first)."""
+        query = db.query(Booking).filter(Booking.status == status)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
     
     def update_status(
         self,
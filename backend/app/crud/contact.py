@@ -11,28 +11,30 @@ from app.models.contact import ContactMessageCreate, ContactMessageUpdate
 class CRUDContactMessage(CRUDBase[ContactMessage, ContactMessageCreate, ContactMessageUpdate]):
     """CRUD operations for ContactMessage model."""
     
+    # Newest first; backed by ix_contact_messages_created_at_id
+    default_sort = (("created_at", True),)
+    
     def get_unread(
         self, 
         db: Session,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ContactMessage]:
         """Get unread messages."""
-        return db.query(ContactMessage).filter(
-            ContactMessage.status == "unread"
-        ).order_by(ContactMessage.created_at.desc()).offset(skip).limit(limit).all()
+        return self.get_by_status(db, "unread", skip=skip, limit=limit, cursor=cursor)
     
     def get_by_status(
         self, 
         db: Session, 
         status: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[ContactMessage]:
-        """Get messages by status."""
-        return db.query(ContactMessage).filter(
-            ContactMessage.status == status
-        ).offset(skip).limit(limit).all()
+        """Get messages by status (newest first)."""
+        query = db.query(ContactMessage).filter(ContactMessage.status == status)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
     
     def mark_as_read(
         self,
@@ -13,6 +13,9 @@ from app.db.models.email_log import EmailLog
 class CRUDEmailLog(CRUDBase[EmailLog, dict, dict]):
     """CRUD for email logs - create from dict, no update schema."""
 
+    # Most recent first; backed by ix_email_logs_sent_at_id
+    default_sort = (("sent_at", True),)
+
     def create_from_send(
         self,
         db: Session,
@@ -1,26 +1,37 @@
 """
 CRUD operations for Expedition model.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from app.crud.base import CRUDBase
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from app.db.models.expedition import Expedition, ExpeditionDay
 from app.models.expedition import ExpeditionCreate, ExpeditionUpdate, ExpeditionDayCreate
 
+# Relationships rendered with an expedition's detail page
+EXPEDITION_DETAIL_RELATIONS = ("itinerary",)
+
 
 class CRUDExpedition(CRUDBase[Expedition, ExpeditionCreate, ExpeditionUpdate]):
     """CRUD operations for Expedition model."""
     
-    def get_with_details(self, db: Session, id: int) -> Optional[Expedition]:
-        """Get expedition with all related data."""
+    # Recently updated first; backed by ix_expeditions_updated_at_id
+    default_sort = (("updated_at", True),)
+    
+    def get_with_details(
+        self, db: Session, id: int, *, strategy: Optional[str] = None
+    ) -> Optional[Expedition]:
+        """Get expedition with its itinerary, loaded per ``strategy`` (see ``relation_options``)."""
         return db.query(Expedition).options(
-            joinedload(Expedition.itinerary)
+            *self.relation_options(EXPEDITION_DETAIL_RELATIONS, strategy)
         ).filter(Expedition.id == id).first()
     
-    def get_by_slug_with_details(self, db: Session, slug: str) -> Optional[Expedition]:
-        """Get expedition by slug with all related data."""
+    def get_by_slug_with_details(
+        self, db: Session, slug: str, *, strategy: Optional[str] = None
+    ) -> Optional[Expedition]:
+        """Get expedition by slug with its itinerary, loaded per ``strategy``."""
         return db.query(Expedition).options(
-            joinedload(Expedition.itinerary)
+            *self.relation_options(EXPEDITION_DETAIL_RELATIONS, strategy)
         ).filter(Expedition.slug == slug).first()
     
     def get_by_slug(self, db: Session, slug: str) -> Optional[Expedition]:
@@ -34,22 +45,19 @@ class CRUDExpedition(CRUDBase[Expedition, ExpeditionCreate, ExpeditionUpdate]):
             Expedition.status == "published"
         ).limit(limit).all()
     
-    def get_multi_with_filters(
-        self,
-        db: Session,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        difficulty: Optional[str] = None,
-        max_price: Optional[float] = None,
-        min_price: Optional[float] = None,
-        featured: Optional[bool] = None,
-        region: Optional[str] = None,
-        status: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> List[Expedition]:
-        """Get expeditions with various filters."""
-        query = db.query(Expedition)
+    def apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """
+        Narrow ``query`` by the expedition list filters: difficulty, min_price,
+        max_price, featured, region, status and search.
+        """
+        filters = filters or {}
+        difficulty = filters.get("difficulty")
+        max_price = filters.get("max_price")
+        min_price = filters.get("min_price")
+        featured = filters.get("featured")
+        region = filters.get("region")
+        status = filters.get("status")
+        search = filters.get("search")
         
         if difficulty:
             query = query.filter(Expedition.difficulty == difficulty)
@@ -69,45 +77,40 @@ class CRUDExpedition(CRUDBase[Expedition, ExpeditionCreate, ExpeditionUpdate]):
                 Expedition.location.ilike(f"%{search}%") |
                 Expedition.region.ilike(f"%{search}%")
             )
-        
-        return query.order_by(Expedition.updated_at.desc()).offset(skip).limit(limit).all()
+        return query
     
-    def get_count_with_filters(
+    def get_multi_with_filters(
         self,
         db: Session,
         *,
-        difficulty: Optional[str] = None,
-        max_price: Optional[float] = None,
-        min_price: Optional[float] = None,
-        featured: Optional[bool] = None,
-        region: Optional[str] = None,
-        status: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> int:
-        """Get count of expeditions with filters."""
-        from sqlalchemy import func
-        query = db.query(func.count(Expedition.id))
-        
-        if difficulty:
-            query = query.filter(Expedition.difficulty == difficulty)
-        if max_price is not None:
-            query = query.filter(Expedition.price <= max_price)
-        if min_price is not None:
-            query = query.filter(Expedition.price >= min_price)
-        if featured is not None:
-            query = query.filter(Expedition.featured == featured)
-        if region:
-            query = query.filter(Expedition.region.ilike(f"%{region}%"))
-        if status:
-            query = query.filter(Expedition.status == status)
-        if search:
-            query = query.filter(
-                Expedition.name.ilike(f"%{search}%") |
-                Expedition.location.ilike(f"%{search}%") |
-                Expedition.region.ilike(f"%{search}%")
-            )
-        
-        return query.scalar() or 0
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> List[Expedition]:
+        """
+        Get expeditions matching ``filters`` (see ``apply_filters``; ``fields`` limits
+        the loaded columns), offset- or keyset-paginated (``cursor``).
+        """
+        return self.get_multi(db, skip=skip, limit=limit, filters=filters, fields=fields, cursor=cursor)
+    
+    def get_page_with_filters(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> Tuple[List[Expedition], int]:
+        """``get_multi_with_filters`` plus the filtered total, fetched together."""
+        return self.get_page(db, skip=skip, limit=limit, filters=filters, fields=fields, cursor=cursor)
+    
+    def get_count_with_filters(self, db: Session, **filters: Any) -> int:
+        """Get count of expeditions matching ``filters`` (see ``apply_filters``)."""
+        return self.get_count(db, filters=filters)
     
     def create_with_relations(
         self,
@@ -271,5 +274,36 @@ class CRUDExpedition(CRUDBase[Expedition, ExpeditionCreate, ExpeditionUpdate]):
         return new_exp
 
 
+class AsyncCRUDExpedition(AsyncCRUDBase[Expedition]):
+    """Expedition reads on an ``AsyncSession`` (see ``AsyncCRUDBase``)."""
+    
+    crud: CRUDExpedition
+    
+    async def get_with_details(
+        self, db: AsyncSession, id: int, *, strategy: Optional[str] = None
+    ) -> Optional[Expedition]:
+        """See ``CRUDExpedition.get_with_details``."""
+        return await self.first(
+            db, Expedition.id == id, options=self.crud.relation_options(EXPEDITION_DETAIL_RELATIONS, strategy)
+        )
+    
+    async def get_by_slug_with_details(
+        self, db: AsyncSession, slug: str, *, strategy: Optional[str] = None
+    ) -> Optional[Expedition]:
+        """See ``CRUDExpedition.get_by_slug_with_details``."""
+        return await self.first(
+            db, Expedition.slug == slug, options=self.crud.relation_options(EXPEDITION_DETAIL_RELATIONS, strategy)
+        )
+    
+    async def get_featured(self, db: AsyncSession, limit: int = 4) -> List[Expedition]:
+        """See ``CRUDExpedition.get_featured``."""
+        return await self.run(db, self.crud.get_featured, limit)
+    
+    async def get_page_with_filters(self, db: AsyncSession, **kwargs: Any) -> Tuple[List[Expedition], int]:
+        """See ``CRUDExpedition.get_page_with_filters``."""
+        return await self.run(db, self.crud.get_page_with_filters, **kwargs)
+
+
 expedition_crud = CRUDExpedition(Expedition)
+expedition_async_crud = AsyncCRUDExpedition(expedition_crud)
 
@@ -2,13 +2,37 @@
 CRUD operations for Google reviews (read-only from API perspective).
 """
 from sqlalchemy.orm import Session
+from app.core.cache import SWRCache
+from app.core.config import settings
+from app.db.events import on_commit
 from app.db.models.google_review import GoogleReview
 from app.db.models.google_reviews_meta import GoogleReviewsMeta
+from app.db.session import SessionLocal
 from app.models.google_review import GoogleReviewResponse, GoogleReviewsResponse
 
+# Reviews are synced from Google at most daily; serve them stale-while-revalidate
+_cache = SWRCache("google_reviews", ttl=settings.GOOGLE_REVIEWS_CACHE_TTL_SECONDS)
+on_commit(_cache.clear, tables=("google_reviews", "google_reviews_meta"))
+
 
 def get_reviews_with_meta(db: Session, place_id: str) -> GoogleReviewsResponse | None:
-    """Get all reviews and meta for a place. Returns None if no data."""
+    """Get all reviews and meta for a place (cached). Returns None if no data."""
+    return _cache.get(
+        place_id,
+        lambda: _load_reviews_with_meta(db, place_id),
+        refresh=lambda: _refresh_reviews_with_meta(place_id),
+    )
+
+
+def _refresh_reviews_with_meta(place_id: str) -> GoogleReviewsResponse | None:
+    db = SessionLocal()
+    try:
+        return _load_reviews_with_meta(db, place_id)
+    finally:
+        db.close()
+
+
+def _load_reviews_with_meta(db: Session, place_id: str) -> GoogleReviewsResponse | None:
     meta = db.query(GoogleReviewsMeta).filter(GoogleReviewsMeta.place_id == place_id).first()
     reviews = (
         db.query(GoogleReview)
@@ -11,6 +11,9 @@ from app.models.lead import LeadCreate, LeadUpdate
 class CRUDLead(CRUDBase[Lead, LeadCreate, LeadUpdate]):
     """CRUD operations for Lead model."""
     
+    # Newest first; backed by ix_leads_created_at_id
+    default_sort = (("created_at", True),)
+    
     def get_by_email(self, db: Session, email: str) -> List[Lead]:
         """Get all leads for an email."""
         return db.query(Lead).filter(Lead.email == email).all()
@@ -24,23 +27,22 @@ class CRUDLead(CRUDBase[Lead, LeadCreate, LeadUpdate]):
         db: Session, 
         status: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Lead]:
-        """Get leads by status."""
-        return db.query(Lead).filter(
-            Lead.status == status
-        ).offset(skip).limit(limit).all()
+        """Get leads by status (newest first)."""
+        query = db.query(Lead).filter(Lead.status == status)
+        return self.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
     
     def get_new_leads(
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Lead]:
         """Get new/uncontacted leads."""
-        return db.query(Lead).filter(
-            Lead.status == "new"
-        ).order_by(Lead.created_at.desc()).offset(skip).limit(limit).all()
+        return self.get_by_status(db, "new", skip=skip, limit=limit, cursor=cursor)
     
     def mark_itinerary_sent(
         self,
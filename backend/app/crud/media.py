@@ -4,6 +4,7 @@ CRUD operations for Media model.
 from typing import List, Optional
 from sqlalchemy import or_, func
 from sqlalchemy.orm import Session
+from app.crud import media_tags
 from app.crud.base import CRUDBase
 from app.db.models.media import Media
 from app.models.media import MediaCreate, MediaUpdate
@@ -12,6 +13,9 @@ from app.models.media import MediaCreate, MediaUpdate
 class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
     """CRUD operations for Media."""
     
+    # Newest first; backed by ix_media_created_at (secondary indexes end in the primary key)
+    default_sort = (("created_at", True),)
+    
     def get_by_hash(self, db: Session, *, hash: str) -> Optional[Media]:
         """Get media by content hash."""
         return db.query(Media).filter(Media.hash == hash).first()
@@ -43,18 +47,9 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
         limit: int = 50
     ) -> List[Media]:
         """Get media files that have any of the specified tags."""
-        # For SQLite, we need to use JSON functions
-        # This query finds media where tags array contains any of the specified tags
-        conditions = []
-        for tag in tags:
-            # Use JSON_EACH for SQLite or JSON_CONTAINS for MySQL
-            conditions.append(
-                Media.tags.contains([tag])
-            )
-        
         return (
             db.query(Media)
-            .filter(or_(*conditions))
+            .filter(Media.id.in_(media_tags.media_ids(tags)))
             .order_by(Media.created_at.desc())
             .offset(skip)
             .limit(limit)
@@ -70,10 +65,11 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
         tags: Optional[List[str]] = None,
         mime_type: Optional[str] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> tuple[List[Media], int]:
         """
-        Search media with filters.
+        Search media with filters, newest first (offset or keyset ``cursor`` paging).
         
         Returns:
             Tuple of (media list, total count)
@@ -95,10 +91,7 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
             q = q.filter(Media.folder == folder)
         
         if tags:
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(Media.tags.contains([tag]))
-            q = q.filter(or_(*tag_conditions))
+            q = q.filter(Media.id.in_(media_tags.media_ids(tags)))
         
         if mime_type:
             if mime_type.endswith("/*"):
@@ -112,12 +105,7 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
         total = q.count()
         
         # Apply ordering and pagination
-        media_list = (
-            q.order_by(Media.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        media_list = self.paginate(q, skip=skip, limit=limit, cursor=cursor).all()
         
         return media_list, total
     
@@ -128,11 +116,11 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
         media_id: int,
         tags: List[str]
     ) -> Optional[Media]:
-        """Update tags for a media item."""
+        """Replace the tag set of a media item."""
         media = self.get(db, id=media_id)
         if media:
-            media.tags = tags
-            db.add(media)
+            media_tags.replace(db.connection(), media_id, tags)
+            media_tags.store(db, media_id, media_tags.names(tags))
             db.commit()
             db.refresh(media)
         return media
@@ -147,11 +135,9 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
         """Add tags to a media item (without removing existing ones)."""
         media = self.get(db, id=media_id)
         if media:
-            existing_tags = media.tags or []
-            # Add new tags that don't already exist
-            new_tags = list(set(existing_tags + tags))
-            media.tags = new_tags
-            db.add(media)
+            conn = db.connection()
+            if media_tags.add(conn, media_id, tags):
+                media_tags.store(db, media_id, media_tags.current(conn, media_id))
             db.commit()
             db.refresh(media)
         return media
@@ -165,30 +151,17 @@ class CRUDMedia(CRUDBase[Media, MediaCreate, MediaUpdate]):
     ) -> Optional[Media]:
         """Remove a specific tag from a media item."""
         media = self.get(db, id=media_id)
-        if media and media.tags:
-            if tag in media.tags:
-                media.tags = [t for t in media.tags if t != tag]
-                db.add(media)
-                db.commit()
-                db.refresh(media)
+        if media:
+            conn = db.connection()
+            if media_tags.remove(conn, media_id, [tag]):
+                media_tags.store(db, media_id, media_tags.current(conn, media_id))
+            db.commit()
+            db.refresh(media)
         return media
     
     def get_all_tags(self, db: Session) -> List[dict]:
-        """Get all unique tags with their usage counts."""
-        # This is a simple approach - for large datasets, 
-        # consider a separate tags table
-        all_media = db.query(Media).filter(Media.tags.isnot(None)).all()
-        
-        tag_counts = {}
-        for media in all_media:
-            if media.tags:
-                for tag in media.tags:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        return [
-            {"tag": tag, "count": count}
-            for tag, count in sorted(tag_counts.items(), key=lambda x: -x[1])
-        ]
+        """Get all unique tags with their usage counts, most used first."""
+        return media_tags.counts(db)
     
     def get_folders(self, db: Session) -> List[dict]:
         """Get all folders with their file counts."""
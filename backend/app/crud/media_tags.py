@@ -0,0 +1,177 @@
+"""
+Normalized media tags: a tag dictionary plus the ``media_tags`` association.
+
+``Media.tags`` is a JSON list, which can only be filtered by scanning and
+decoding every row. Each tag name gets one ``media_tag_names`` row and each
+(media, tag) pair one ``media_tags`` row, so the tag filter is an index lookup
+and the tag cloud a ``GROUP BY``. The JSON column stays as the list returned by
+the API.
+
+Writes through the ORM (upload, PATCH) are mirrored in the same transaction by
+mapper events. The CRUD tag operations work the other way round: set operations
+on ``media_tags`` (insert-or-ignore / delete), after which the JSON copy is
+rewritten from the table. ``rebuild`` repopulates everything from the JSON column.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import Connection, Select, delete, event, exists, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.media import Media, MediaTag, media_tags
+
+# Longer names do not fit MediaTag.name; they stay in the JSON list but cannot be filtered on
+MAX_TAG_LENGTH = MediaTag.__table__.c.name.type.length
+
+
+def names(tags: Optional[Iterable]) -> List[str]:
+    """
+    Distinct tag names in their original order, without surrounding whitespace.
+
+    MySQL ignores trailing spaces when comparing even under the binary
+    collation of ``media_tag_names.name``, so "Nepal " would collapse into
+    "Nepal" on insert and then be missing from the id lookup.
+    """
+    seen = []
+    for value in tags or ():
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if value and len(value) <= MAX_TAG_LENGTH and value not in seen:
+            seen.append(value)
+    return seen
+
+
+def _insert_ignore(table):
+    """INSERT that skips rows violating a unique key (the set-add primitive)."""
+    return insert(table).prefix_with("OR IGNORE", dialect="sqlite").prefix_with("IGNORE", dialect="mysql")
+
+
+def tag_ids(conn: Connection, tags: List[str]) -> Dict[str, int]:
+    """Dictionary ids for ``tags``, adding the names not seen before."""
+    if not tags:
+        return {}
+    conn.execute(_insert_ignore(MediaTag.__table__), [{"name": name} for name in tags])
+    return dict(conn.execute(select(MediaTag.name, MediaTag.id).where(MediaTag.name.in_(tags))).all())
+
+
+def add(conn: Connection, media_id: int, tags: Iterable[str]) -> int:
+    """Union ``tags`` into a media item's tag set. Returns the number of tags added."""
+    ids = tag_ids(conn, names(tags))
+    if not ids:
+        return 0
+    return conn.execute(
+        _insert_ignore(media_tags), [{"media_id": media_id, "tag_id": i} for i in ids.values()]
+    ).rowcount
+
+
+def remove(conn: Connection, media_id: int, tags: Iterable[str]) -> int:
+    """Subtract ``tags`` from a media item's tag set. Returns the number of tags removed."""
+    return conn.execute(
+        delete(media_tags).where(
+            media_tags.c.media_id == media_id,
+            media_tags.c.tag_id.in_(select(MediaTag.id).where(MediaTag.name.in_(names(tags)))),
+        )
+    ).rowcount
+
+
+def replace(conn: Connection, media_id: int, tags: Iterable[str]) -> None:
+    """Make a media item's tag set exactly ``tags``."""
+    tags = names(tags)
+    conn.execute(
+        delete(media_tags).where(
+            media_tags.c.media_id == media_id,
+            media_tags.c.tag_id.not_in(select(MediaTag.id).where(MediaTag.name.in_(tags))),
+        )
+    )
+    add(conn, media_id, tags)
+
+
+def current(conn: Connection, media_id: int) -> List[str]:
+    """A media item's tags from the association table, by name."""
+    return list(conn.execute(
+        select(MediaTag.name)
+        .join(media_tags, media_tags.c.tag_id == MediaTag.id)
+        .where(media_tags.c.media_id == media_id)
+        .order_by(MediaTag.name)
+    ).scalars())
+
+
+def store(db: Session, media_id: int, tags: List[str]) -> None:
+    """Write the JSON copy of a media item's tags without re-triggering the mirror events."""
+    db.execute(update(Media).where(Media.id == media_id).values(tags=tags, updated_at=datetime.utcnow()))
+
+
+@event.listens_for(Media, "after_insert")
+def _insert_tags(mapper, connection: Connection, media: Media) -> None:
+    add(connection, media.id, media.tags)
+
+
+@event.listens_for(Media, "after_update")
+def _update_tags(mapper, connection: Connection, media: Media) -> None:
+    if inspect(media).attrs.tags.history.has_changes():
+        replace(connection, media.id, media.tags)
+
+
+@event.listens_for(Media, "after_delete")
+def _delete_tags(mapper, connection: Connection, media: Media) -> None:
+    connection.execute(delete(media_tags).where(media_tags.c.media_id == media.id))
+
+
+def media_ids(tags: List[str]) -> Select:
+    """Ids of the media items tagged with any of ``tags``."""
+    return (
+        select(media_tags.c.media_id)
+        .join(MediaTag, MediaTag.id == media_tags.c.tag_id)
+        .where(MediaTag.name.in_(names(tags)))
+    )
+
+
+def counts(db: Session) -> List[dict]:
+    """Every tag in use with its number of media items, most used first."""
+    count = func.count(media_tags.c.media_id)
+    rows = (
+        db.query(MediaTag.name, count)
+        .join(media_tags, media_tags.c.tag_id == MediaTag.id)
+        .group_by(MediaTag.id, MediaTag.name)
+        .order_by(count.desc(), MediaTag.name)
+        .all()
+    )
+    return [{"tag": name, "count": n} for name, n in rows]
+
+
+def rebuild(db: Session, batch_size: int = 500) -> int:
+    """Repopulate media_tags (and the dictionary) from Media.tags. Returns the number of media items."""
+    conn = db.connection()
+    conn.execute(delete(media_tags))
+    count = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Media.id, Media.tags)
+            .filter(Media.id > last_id)
+            .order_by(Media.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        ids = tag_ids(conn, names(tag for row in rows for tag in names(row.tags)))
+        pairs = [{"media_id": row.id, "tag_id": ids[tag]} for row in rows for tag in names(row.tags)]
+        if pairs:
+            conn.execute(insert(media_tags), pairs)
+        count += len(rows)
+        last_id = rows[-1].id
+    db.commit()
+    return count
+
+
+def is_stale(db: Session) -> bool:
+    """
+    Whether a tagged media item has no media_tags rows, e.g. after media was
+    written by a process that never imported this module (raw SQL imports).
+    """
+    unsynced = db.query(Media.tags).filter(
+        Media.tags.isnot(None), ~exists().where(media_tags.c.media_id == Media.id)
+    )
+    return any(names(tags) for (tags,) in unsynced)
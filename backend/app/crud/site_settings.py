@@ -1,23 +1,63 @@
 """
 CRUD operations for SiteSettings model (single-row).
 """
+from datetime import datetime
+from typing import Optional, Tuple
 from sqlalchemy.orm import Session
+from app.core.cache import SWRCache
+from app.core.config import settings
+from app.db.events import on_commit
 from app.db.models.site_settings import SiteSettings
-from app.models.site_settings import SiteSettingsUpdate
+from app.db.session import SessionLocal
+from app.models.site_settings import SiteSettingsResponse, SiteSettingsUpdate
 
 
 SITE_SETTINGS_ID = 1
 
+# Read on every page render, changed a few times a year
+_cache = SWRCache("site_settings", ttl=settings.SITE_SETTINGS_CACHE_TTL_SECONDS)
+on_commit(_cache.clear, tables=("site_settings",))
 
-def get(db: Session) -> SiteSettings | None:
-    """Get the single site settings row."""
-    return db.query(SiteSettings).filter(SiteSettings.id == SITE_SETTINGS_ID).first()
 
+def _load(db: Session) -> SiteSettingsResponse | None:
+    row = db.query(SiteSettings).filter(SiteSettings.id == SITE_SETTINGS_ID).first()
+    return SiteSettingsResponse.model_validate(row) if row else None
+
+
+def _refresh(loader):
+    db = SessionLocal()
+    try:
+        return loader(db)
+    finally:
+        db.close()
+
+
+def get(db: Session) -> SiteSettingsResponse | None:
+    """
+    Get the site settings (None if the row does not exist yet).
+
+    Returns a cached, read-only snapshot served stale-while-revalidate; use
+    ``update`` to change settings.
+    """
+    return _cache.get(SITE_SETTINGS_ID, lambda: _load(db), refresh=lambda: _refresh(_load))
 
-def get_defaults() -> "SiteSettingsResponse":
-    """Return default values when no row exists (for API response)."""
-    from app.models.site_settings import SiteSettingsResponse
 
+def _load_validators(db: Session) -> Tuple[Optional[datetime], int]:
+    updated_at = (
+        db.query(SiteSettings.updated_at).filter(SiteSettings.id == SITE_SETTINGS_ID).scalar()
+    )
+    return updated_at, 1 if updated_at else 0
+
+
+def get_validators(db: Session) -> Tuple[Optional[datetime], int]:
+    """Get (updated_at, row count) of the settings row for conditional GETs (cached like ``get``)."""
+    return _cache.get(
+        "validators", lambda: _load_validators(db), refresh=lambda: _refresh(_load_validators)
+    )
+
+
+def get_defaults() -> SiteSettingsResponse:
+    """Return default values when no row exists (for API response)."""
     return SiteSettingsResponse(
         id=SITE_SETTINGS_ID,
         company_name="Global Events Travels",
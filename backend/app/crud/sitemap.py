@@ -0,0 +1,39 @@
+"""
+Sitemap index queries.
+
+One (status, updated_at, slug) index-only query per content table, streamed
+in batches so the full set never sits in memory.
+"""
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.blog import BlogPost
+from app.db.models.expedition import Expedition
+from app.db.models.trek import Trek
+
+# Content type reported in the sitemap -> model
+SITEMAP_MODELS = (
+    ("trek", Trek),
+    ("expedition", Expedition),
+    ("blog", BlogPost),
+)
+
+SITEMAP_BATCH_SIZE = 500
+
+
+def iter_entries(
+    db: Session,
+    *,
+    since: Optional[datetime] = None,
+) -> Iterator[Tuple[str, str, datetime]]:
+    """Yield ``(type, slug, updated_at)`` for every published item, optionally changed after ``since``."""
+    for content_type, model in SITEMAP_MODELS:
+        stmt = select(model.slug, model.updated_at).where(model.status == "published")
+        if since is not None:
+            stmt = stmt.where(model.updated_at > since)
+        stmt = stmt.order_by(model.updated_at).execution_options(yield_per=SITEMAP_BATCH_SIZE)
+        for slug, updated_at in db.execute(stmt):
+            yield content_type, slug, updated_at
@@ -2,55 +2,98 @@
 CRUD operations for Trek model.
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, cast, String
-from app.crud.base import CRUDBase
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import func, null, select, union_all
+from app.core.cache import ResponseCache
+from app.crud import trek_seasons
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.db.events import on_commit
 from app.db.models.trek import Trek, TrekImage, ItineraryDay, TrekFAQ, TrekBatch
 from app.models.trek import TrekCreate, TrekUpdate, ItineraryDayCreate, TrekImageCreate, TrekFAQCreate
 
+# ``sort=`` options of the trek list -> order (``id`` breaks ties); "newest" is the default
+TREK_SORTS = {
+    "newest": (("created_at", True),),
+    "popularity": (("review_count", True), ("rating", True)),
+    "price_asc": (("price", False),),
+    "price_desc": (("price", True),),
+    "rating": (("rating", True),),
+}
+
+# Relationships rendered with a trek's detail page
+TREK_DETAIL_RELATIONS = ("itinerary", "images", "faqs", "guide", "batches")
+
 
 class CRUDTrek(CRUDBase[Trek, TrekCreate, TrekUpdate]):
     """CRUD operations for Trek model."""
     
-    def get_with_details(self, db: Session, id: int) -> Optional[Trek]:
-        """Get trek with all related data."""
+    # Newest first; backed by ix_treks_created_at_id
+    default_sort = TREK_SORTS["newest"]
+    
+    def get_with_details(
+        self,
+        db: Session,
+        id: int,
+        *,
+        strategy: Optional[str] = None,
+        relations: Sequence[str] = TREK_DETAIL_RELATIONS,
+    ) -> Optional[Trek]:
+        """Get trek with its related data, loaded per ``strategy`` (see ``relation_options``)."""
         return db.query(Trek).options(
-            joinedload(Trek.itinerary),
-            joinedload(Trek.images),
-            joinedload(Trek.faqs),
-            joinedload(Trek.guide),
-            joinedload(Trek.batches),
+            *self.relation_options(relations, strategy)
         ).filter(Trek.id == id).first()
 
-    def get_by_slug_with_details(self, db: Session, slug: str) -> Optional[Trek]:
-        """Get trek by slug with all related data."""
-        return db.query(Trek).options(
-            joinedload(Trek.itinerary),
-            joinedload(Trek.images),
-            joinedload(Trek.faqs),
-            joinedload(Trek.guide),
-            joinedload(Trek.batches),
-        ).filter(Trek.slug == slug).first()
-    
-    def get_multi_with_filters(
+    def get_by_slug_with_details(
         self,
         db: Session,
+        slug: str,
         *,
-        skip: int = 0,
-        limit: int = 100,
-        difficulty: Optional[str] = None,
-        max_price: Optional[float] = None,
-        min_price: Optional[float] = None,
-        featured: Optional[bool] = None,
-        status: Optional[str] = None,
-        location: Optional[str] = None,
-        search: Optional[str] = None,
-        season: Optional[str] = None,
-        sort: Optional[str] = None,
-    ) -> List[Trek]:
-        """Get treks with various filters."""
-        query = db.query(Trek)
+        strategy: Optional[str] = None,
+        relations: Sequence[str] = TREK_DETAIL_RELATIONS,
+    ) -> Optional[Trek]:
+        """Get trek by slug with its related data, loaded per ``strategy`` (see ``relation_options``)."""
+        return db.query(Trek).options(
+            *self.relation_options(relations, strategy)
+        ).filter(Trek.slug == slug).first()
+    
+    def get_detail_validators(self, db: Session, slug: str) -> Tuple[Optional[datetime], int, Optional[int]]:
+        """
+        Get (max updated_at, row count, newest image id) across a trek and its
+        batches, itinerary, FAQs and images.
+
+        Images have no timestamps: adding or removing one changes the count, and
+        replacing them (new rows) moves the newest id.
+        """
+        trek_id = select(Trek.id).where(Trek.slug == slug).scalar_subquery()
+        rows = union_all(
+            select(Trek.updated_at.label("ts")).where(Trek.slug == slug),
+            select(TrekBatch.updated_at).where(TrekBatch.trek_id == trek_id),
+            select(ItineraryDay.updated_at).where(ItineraryDay.trek_id == trek_id),
+            select(TrekFAQ.updated_at).where(TrekFAQ.trek_id == trek_id),
+            select(null()).where(TrekImage.trek_id == trek_id),
+        ).subquery()
+        image_id = select(func.max(TrekImage.id)).where(TrekImage.trek_id == trek_id).scalar_subquery()
+        last_modified, count, newest_image = db.execute(
+            select(func.max(rows.c.ts), func.count(), image_id).select_from(rows)
+        ).one()
+        return last_modified, count or 0, newest_image
+    
+    def apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """
+        Narrow ``query`` by the trek list filters: difficulty, min_price, max_price,
+        featured, status, location, search and season.
+        """
+        filters = filters or {}
+        difficulty = filters.get("difficulty")
+        max_price = filters.get("max_price")
+        min_price = filters.get("min_price")
+        featured = filters.get("featured")
+        status = filters.get("status")
+        location = filters.get("location")
+        search = filters.get("search")
+        season = filters.get("season")
         
         if difficulty:
             query = query.filter(Trek.difficulty == difficulty)
@@ -71,62 +114,58 @@ class CRUDTrek(CRUDBase[Trek, TrekCreate, TrekUpdate]):
                 (Trek.location.ilike(f"%{search}%"))
             )
         if season:
-            # best_season is JSON array; match if season appears as array element
-            query = query.filter(cast(Trek.best_season, String).contains(f'"{season}"'))
-        
-        # Apply sort
-        if sort == "popularity":
-            query = query.order_by(Trek.review_count.desc(), Trek.rating.desc())
-        elif sort == "price_asc":
-            query = query.order_by(Trek.price.asc())
-        elif sort == "price_desc":
-            query = query.order_by(Trek.price.desc())
-        elif sort == "rating":
-            query = query.order_by(Trek.rating.desc())
-        else:
-            # newest (default)
-            query = query.order_by(Trek.created_at.desc())
-        
-        return query.offset(skip).limit(limit).all()
+            # Indexed lookup in the normalized best_season entries
+            query = query.filter(Trek.id.in_(trek_seasons.trek_ids(season)))
+        return query
+    
+    def _list_query(self, db: Session, sort: str, fields: Optional[Sequence[str]], filters: Dict[str, Any]) -> Query:
+        return self.apply_filters(
+            self.apply_fields(db.query(Trek), self.sort_fields(fields, TREK_SORTS[sort])), filters
+        )
     
-    def get_count_with_filters(
+    def get_multi_with_filters(
         self,
         db: Session,
         *,
-        difficulty: Optional[str] = None,
-        max_price: Optional[float] = None,
-        min_price: Optional[float] = None,
-        featured: Optional[bool] = None,
-        status: Optional[str] = None,
-        location: Optional[str] = None,
-        search: Optional[str] = None,
-        season: Optional[str] = None,
-    ) -> int:
-        """Get count of treks with filters."""
-        query = db.query(func.count(Trek.id))
-        
-        if difficulty:
-            query = query.filter(Trek.difficulty == difficulty)
-        if max_price is not None:
-            query = query.filter(Trek.price <= max_price)
-        if min_price is not None:
-            query = query.filter(Trek.price >= min_price)
-        if featured is not None:
-            query = query.filter(Trek.featured == featured)
-        if status:
-            query = query.filter(Trek.status == status)
-        if location:
-            query = query.filter(Trek.location.ilike(f"%{location}%"))
-        if search:
-            query = query.filter(
-                (Trek.name.ilike(f"%{search}%")) |
-                (Trek.short_description.ilike(f"%{search}%")) |
-                (Trek.location.ilike(f"%{search}%"))
-            )
-        if season:
-            query = query.filter(cast(Trek.best_season, String).contains(f'"{season}"'))
-        
-        return query.scalar() or 0
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> List[Trek]:
+        """
+        Get treks matching ``filters`` (see ``apply_filters``; ``fields`` limits the
+        loaded columns), offset- or keyset-paginated (``cursor``, tied to the ``sort``
+        it came from).
+        """
+        sort = sort if sort in TREK_SORTS else "newest"
+        return self.paginate(
+            self._list_query(db, sort, fields, filters),
+            skip=skip, limit=limit, cursor=cursor, sort=TREK_SORTS[sort], sort_name=sort,
+        ).all()
+    
+    def get_page_with_filters(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[Trek], int]:
+        """``get_multi_with_filters`` plus the filtered total, fetched together."""
+        sort = sort if sort in TREK_SORTS else "newest"
+        return self.fetch_page(
+            db, self._list_query(db, sort, fields, filters),
+            skip=skip, limit=limit, cursor=cursor, sort=TREK_SORTS[sort], sort_name=sort,
+        )
+    
+    def get_count_with_filters(self, db: Session, **filters: Any) -> int:
+        """Get count of treks matching ``filters`` (see ``apply_filters``)."""
+        return self.get_count(db, filters=filters)
     
     def create_with_relations(
         self,
@@ -328,4 +367,55 @@ class CRUDTrek(CRUDBase[Trek, TrekCreate, TrekUpdate]):
         return db_img
 
 
+class AsyncCRUDTrek(AsyncCRUDBase[Trek]):
+    """Trek reads on an ``AsyncSession`` (see ``AsyncCRUDBase``)."""
+    
+    crud: CRUDTrek
+    
+    async def get_with_details(
+        self,
+        db: AsyncSession,
+        id: int,
+        *,
+        strategy: Optional[str] = None,
+        relations: Sequence[str] = TREK_DETAIL_RELATIONS,
+    ) -> Optional[Trek]:
+        """See ``CRUDTrek.get_with_details``."""
+        return await self.first(db, Trek.id == id, options=self.crud.relation_options(relations, strategy))
+    
+    async def get_by_slug_with_details(
+        self,
+        db: AsyncSession,
+        slug: str,
+        *,
+        strategy: Optional[str] = None,
+        relations: Sequence[str] = TREK_DETAIL_RELATIONS,
+    ) -> Optional[Trek]:
+        """See ``CRUDTrek.get_by_slug_with_details``."""
+        return await self.first(db, Trek.slug == slug, options=self.crud.relation_options(relations, strategy))
+    
+    async def get_detail_validators(
+        self, db: AsyncSession, slug: str
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        """See ``CRUDTrek.get_detail_validators``."""
+        return await self.run(db, self.crud.get_detail_validators, slug)
+    
+    async def get_multi_with_filters(self, db: AsyncSession, **kwargs: Any) -> List[Trek]:
+        """See ``CRUDTrek.get_multi_with_filters``."""
+        return await self.run(db, self.crud.get_multi_with_filters, **kwargs)
+    
+    async def get_page_with_filters(self, db: AsyncSession, **kwargs: Any) -> Tuple[List[Trek], int]:
+        """See ``CRUDTrek.get_page_with_filters``."""
+        return await self.run(db, self.crud.get_page_with_filters, **kwargs)
+
+
 trek_crud = CRUDTrek(Trek)
+trek_async_crud = AsyncCRUDTrek(trek_crud)
+
+# Serialized responses of the public trek endpoints. Dropped whenever a commit
+# touches a trek or anything rendered with it (batches, itinerary, images, FAQs).
+trek_response_cache = ResponseCache("treks")
+on_commit(
+    trek_response_cache.clear,
+    tables=("treks", "trek_batches", "itinerary_days", "trek_images", "trek_faqs", "guides"),
+)
@@ -0,0 +1,91 @@
+"""
+Normalized trek seasons for the ``season`` list filter.
+
+``Trek.best_season`` is a JSON list of month names, which no index can search.
+Each entry is mirrored into ``trek_seasons (trek_id, month)`` in the same
+transaction as the trek (mapper events), so ``season=May`` becomes a lookup on
+``ix_trek_seasons_month_trek_id`` instead of a substring scan over serialized
+JSON. ``rebuild`` repopulates the table from ``treks``.
+"""
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Connection, Select, delete, event, exists, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.models.trek import Trek, TrekSeason
+
+# Longer entries do not fit TrekSeason.month and can never match a month filter
+MAX_MONTH_LENGTH = TrekSeason.__table__.c.month.type.length
+
+
+def months(best_season: Optional[Iterable]) -> List[str]:
+    """Distinct ``best_season`` entries in their original order."""
+    seen = []
+    for value in best_season or ():
+        if isinstance(value, str) and value and len(value) <= MAX_MONTH_LENGTH and value not in seen:
+            seen.append(value)
+    return seen
+
+
+def _write(conn: Connection, trek_id: int, best_season: Optional[Iterable]) -> None:
+    conn.execute(delete(TrekSeason).where(TrekSeason.trek_id == trek_id))
+    rows = [{"trek_id": trek_id, "month": month} for month in months(best_season)]
+    if rows:
+        conn.execute(insert(TrekSeason), rows)
+
+
+@event.listens_for(Trek, "after_insert")
+def _insert_seasons(mapper, connection: Connection, trek: Trek) -> None:
+    _write(connection, trek.id, trek.best_season)
+
+
+@event.listens_for(Trek, "after_update")
+def _update_seasons(mapper, connection: Connection, trek: Trek) -> None:
+    if inspect(trek).attrs.best_season.history.has_changes():
+        _write(connection, trek.id, trek.best_season)
+
+
+@event.listens_for(Trek, "after_delete")
+def _delete_seasons(mapper, connection: Connection, trek: Trek) -> None:
+    connection.execute(delete(TrekSeason).where(TrekSeason.trek_id == trek.id))
+
+
+def rebuild(db: Session, batch_size: int = 500) -> int:
+    """Repopulate trek_seasons from treks. Returns the number of treks written."""
+    conn = db.connection()
+    conn.execute(delete(TrekSeason))
+    count = 0
+    last_id = 0
+    while True:
+        treks = (
+            db.query(Trek.id, Trek.best_season)
+            .filter(Trek.id > last_id)
+            .order_by(Trek.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not treks:
+            break
+        rows = [{"trek_id": t.id, "month": month} for t in treks for month in months(t.best_season)]
+        if rows:
+            conn.execute(insert(TrekSeason), rows)
+        count += len(treks)
+        last_id = treks[-1].id
+    db.commit()
+    return count
+
+
+def is_stale(db: Session) -> bool:
+    """
+    Whether a trek with seasons has no trek_seasons rows, e.g. after treks were
+    written by a process that never imported this module (raw seeds, SQL imports).
+    """
+    unsynced = db.query(Trek.best_season).filter(
+        ~exists().where(TrekSeason.trek_id == Trek.id)
+    )
+    return any(months(best_season) for (best_season,) in unsynced)
+
+
+def trek_ids(month: str) -> Select:
+    """Ids of the treks whose ``best_season`` lists ``month``."""
+    return select(TrekSeason.trek_id).where(TrekSeason.month == month)
@@ -0,0 +1,123 @@
+"""
+Commit-time change notifications.
+
+Records which rows were written during a session's flushes and notifies
+registered listeners once the surrounding transaction commits. Caches and
+in-process indexes use this to stay in sync with the database without every
+write path having to remember to invalidate them.
+"""
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_CHANGES_KEY = "committed_changes"
+
+
+class ChangeSet:
+    """Tables and primary keys written in one committed transaction."""
+
+    def __init__(self) -> None:
+        self.rows: Dict[str, Set[int]] = {}
+        self.bulk: Set[str] = set()
+
+    @property
+    def tables(self) -> Set[str]:
+        """Names of every table touched by the transaction."""
+        return set(self.rows) | self.bulk
+
+    def add_row(self, table: str, pk: Optional[int]) -> None:
+        ids = self.rows.setdefault(table, set())
+        if pk is not None:
+            ids.add(pk)
+
+    def add_bulk(self, table: str) -> None:
+        """Mark a table as changed by a bulk UPDATE/DELETE (row ids unknown)."""
+        self.bulk.add(table)
+
+    def ids(self, table: str) -> Set[int]:
+        """Primary keys written for a table (empty if only bulk-changed)."""
+        return self.rows.get(table, set())
+
+    def __bool__(self) -> bool:
+        return bool(self.rows or self.bulk)
+
+
+Listener = Callable[[ChangeSet], None]
+_listeners: List[Tuple[Optional[Set[str]], Listener]] = []
+
+
+def on_commit(callback: Listener, tables: Optional[Iterable[str]] = None) -> Listener:
+    """
+    Register a callback run after a commit that touched any of ``tables``.
+
+    When ``tables`` is None the callback fires for every committed write.
+    Callbacks run synchronously in the committing thread, so they should be
+    cheap (drop a cache, schedule a rebuild) rather than do I/O themselves.
+    """
+    _listeners.append((set(tables) if tables is not None else None, callback))
+    return callback
+
+
+def _table_name(obj: object) -> Optional[str]:
+    table = getattr(obj, "__table__", None)
+    return table.name if table is not None else None
+
+
+def _pending(session: Session) -> ChangeSet:
+    changes = session.info.get(_CHANGES_KEY)
+    if changes is None:
+        changes = session.info[_CHANGES_KEY] = ChangeSet()
+    return changes
+
+
+def _row_id(obj: object) -> Optional[int]:
+    state = inspect(obj)
+    # New objects only get their identity key after after_flush, but the
+    # flushed primary key is already on the instance
+    identity = state.identity or state.mapper.primary_key_from_instance(obj)
+    return identity[0] if identity else None
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context) -> None:
+    changes = _pending(session)
+    for obj in list(session.new) + list(session.deleted):
+        table = _table_name(obj)
+        if table:
+            changes.add_row(table, _row_id(obj))
+    for obj in session.dirty:
+        table = _table_name(obj)
+        if table and session.is_modified(obj):
+            changes.add_row(table, _row_id(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk(orm_execute_state) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _pending(orm_execute_state.session).add_bulk(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch(session: Session) -> None:
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if not changes:
+        return
+    touched = changes.tables
+    for tables, callback in list(_listeners):
+        if tables is not None and not (tables & touched):
+            continue
+        try:
+            callback(changes)
+        except Exception:
+            logger.exception("Commit listener %r failed", callback)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_CHANGES_KEY, None)
@@ -2,7 +2,7 @@
 Database models package.
 All models are imported here for easy access.
 """
-from app.db.models.trek import Trek, TrekImage, ItineraryDay, TrekFAQ, TrekBatch
+from app.db.models.trek import Trek, TrekImage, ItineraryDay, TrekFAQ, TrekBatch, TrekSeason
 from app.db.models.expedition import Expedition, ExpeditionDay
 from app.db.models.guide import Guide
 from app.db.models.booking import Booking
@@ -15,7 +15,7 @@ from app.db.models.blog import (
     blog_post_tags, PostStatus, ContentType
 )
 from app.db.models.user import User
-from app.db.models.media import Media
+from app.db.models.media import Media, MediaTag, media_tags
 from app.db.models.email_log import EmailLog
 from app.db.models.site_settings import SiteSettings
 from app.db.models.google_review import GoogleReview
@@ -27,6 +27,7 @@ __all__ = [
     "ItineraryDay",
     "TrekFAQ",
     "TrekBatch",
+    "TrekSeason",
     "Expedition",
     "ExpeditionDay",
     "Guide",
@@ -44,6 +45,8 @@ __all__ = [
     "ContentType",
     "User",
     "Media",
+    "MediaTag",
+    "media_tags",
     "EmailLog",
     "SiteSettings",
     "GoogleReview",
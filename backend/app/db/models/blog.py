@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
     String, Integer, Text, DateTime, Boolean, JSON, ForeignKey, 
-    Table, Column, Enum as SQLEnum
+    Table, Column, Index, Enum as SQLEnum
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
@@ -31,6 +31,8 @@ blog_post_tags = Table(
     Base.metadata,
     Column("post_id", Integer, ForeignKey("blog_posts.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("blog_tags.id", ondelete="CASCADE"), primary_key=True),
+    # Posts by tag (the primary key leads with post_id)
+    Index("ix_blog_post_tags_tag_id_post_id", "tag_id", "post_id"),
 )
 
 
@@ -48,6 +50,8 @@ class BlogCategory(Base):
     )
     display_order: Mapped[int] = mapped_column(Integer, default=0)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Posts in this category, maintained by app.crud.blog_counts
+    post_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -77,6 +81,8 @@ class BlogTag(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     slug: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
+    # Posts with this tag, maintained by app.crud.blog_counts
+    post_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -100,6 +106,11 @@ class BlogAuthor(Base):
     bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     role: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
+    # Timestamps (the post list and detail validators include it)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    
     # Relationships
     posts: Mapped[List["BlogPost"]] = relationship("BlogPost", back_populates="author")
 
@@ -108,6 +119,15 @@ class BlogPost(Base):
     """Blog post model."""
     
     __tablename__ = "blog_posts"
+    __table_args__ = (
+        # Covers the sitemap query (status filter, updated_at range, slug) without touching rows
+        Index("ix_blog_posts_status_updated_at_slug", "status", "updated_at", "slug"),
+        # Default list order / keyset pagination key
+        Index("ix_blog_posts_created_at_id", "created_at", "id"),
+        # Published / category lists, newest first
+        Index("ix_blog_posts_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_blog_posts_category_id_status_created_at_id", "category_id", "status", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
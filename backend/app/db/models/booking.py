@@ -3,7 +3,7 @@ Booking model for trek reservations.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -12,6 +12,12 @@ class Booking(Base):
     """Booking model for trek reservations."""
     
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Default list order / keyset pagination key
+        Index("ix_bookings_created_at_id", "created_at", "id"),
+        # Lists filtered by status, newest first
+        Index("ix_bookings_status_created_at_id", "status", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     trek_id: Mapped[int] = mapped_column(
@@ -3,7 +3,7 @@ Email log model for tracking Brevo transactional email events.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
@@ -12,6 +12,13 @@ class EmailLog(Base):
     """Email log for tracking sent emails and Brevo webhook events."""
 
     __tablename__ = "email_logs"
+    __table_args__ = (
+        # Default list order / keyset pagination key
+        Index("ix_email_logs_sent_at_id", "sent_at", "id"),
+        # Lists filtered by type or status, newest first
+        Index("ix_email_logs_email_type_sent_at_id", "email_type", "sent_at", "id"),
+        Index("ix_email_logs_status_sent_at_id", "status", "sent_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     recipient_email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
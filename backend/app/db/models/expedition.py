@@ -3,7 +3,7 @@ Expedition model for high-altitude climbing expeditions.
 """
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, Integer, Float, Text, Boolean, JSON, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Float, Text, Boolean, JSON, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -12,6 +12,12 @@ class Expedition(Base):
     """Expedition model for mountaineering expeditions."""
     
     __tablename__ = "expeditions"
+    __table_args__ = (
+        # Covers the sitemap query (status filter, updated_at range, slug) without touching rows
+        Index("ix_expeditions_status_updated_at_slug", "status", "updated_at", "slug"),
+        # Default list order / keyset pagination key
+        Index("ix_expeditions_updated_at_id", "updated_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -69,6 +75,10 @@ class ExpeditionDay(Base):
     """Day-by-day itinerary for an expedition."""
     
     __tablename__ = "expedition_days"
+    __table_args__ = (
+        # An expedition's itinerary in day order (Expedition.itinerary)
+        Index("ix_expedition_days_expedition_id_day", "expedition_id", "day"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     expedition_id: Mapped[int] = mapped_column(
@@ -3,7 +3,7 @@ Lead model for capturing potential customer information.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, DateTime, Boolean
+from sqlalchemy import String, Integer, Text, DateTime, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
@@ -12,6 +12,12 @@ class Lead(Base):
     """Lead model for capturing leads from website forms."""
     
     __tablename__ = "leads"
+    __table_args__ = (
+        # Default list order / keyset pagination key
+        Index("ix_leads_created_at_id", "created_at", "id"),
+        # Lists filtered by status, newest first
+        Index("ix_leads_status_created_at_id", "status", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -3,11 +3,41 @@ Media model for tracking uploaded files with hash deduplication and tags.
 """
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, Integer, Text, DateTime, JSON, Index
+from sqlalchemy import String, Integer, Text, DateTime, JSON, Index, Table, Column, ForeignKey
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 
+# Media <-> tag association, written by app.crud.media_tags (Media.tags is the response copy)
+media_tags = Table(
+    "media_tags",
+    Base.metadata,
+    Column("media_id", Integer, ForeignKey("media.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("media_tag_names.id", ondelete="CASCADE"), primary_key=True),
+    # Media by tag (the primary key leads with media_id)
+    Index("ix_media_tags_tag_id_media_id", "tag_id", "media_id"),
+)
+
+
+class MediaTag(Base):
+    """Tag dictionary for media: one row per distinct tag name."""
+    
+    __tablename__ = "media_tag_names"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Binary collation: the default one is case- and accent-insensitive, which would
+    # merge "Nepal" and "nepal" into one row under the unique key
+    name: Mapped[str] = mapped_column(
+        String(100).with_variant(mysql.VARCHAR(100, collation="utf8mb4_bin"), "mysql"),
+        unique=True,
+        nullable=False,
+    )
+    
+    def __repr__(self) -> str:
+        return f"<MediaTag(id={self.id}, name='{self.name}')>"
+
+
 class Media(Base):
     """Media model representing an uploaded file with hash-based deduplication."""
     
@@ -27,6 +57,7 @@ class Media(Base):
     
     # Organization
     folder: Mapped[str] = mapped_column(String(100), nullable=False, default="general")
+    # Tag names as returned by the API; filters and counts use media_tags
     tags: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True, default=list)
     
     # Storage backend info
@@ -49,6 +80,8 @@ class Media(Base):
     __table_args__ = (
         Index('ix_media_folder', 'folder'),
         Index('ix_media_created_at', 'created_at'),
+        # Folder browser, newest first
+        Index('ix_media_folder_created_at_id', 'folder', 'created_at', 'id'),
     )
     
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@ Trek model and related tables.
 """
 from datetime import date, datetime
 from typing import List, Optional
-from sqlalchemy import String, Integer, Float, Text, Boolean, ForeignKey, JSON, DateTime, Date
+from sqlalchemy import String, Integer, Float, Text, Boolean, ForeignKey, JSON, DateTime, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -12,6 +12,18 @@ class Trek(Base):
     """Trek model representing a trekking package."""
     
     __tablename__ = "treks"
+    __table_args__ = (
+        # Covers the sitemap query (status filter, updated_at range, slug) without touching rows
+        Index("ix_treks_status_updated_at_slug", "status", "updated_at", "slug"),
+        # Default list order / keyset pagination key
+        Index("ix_treks_created_at_id", "created_at", "id"),
+        # Public lists: status (and featured) filter, then each sort= order
+        Index("ix_treks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_treks_status_featured_created_at_id", "status", "featured", "created_at", "id"),
+        Index("ix_treks_status_price_id", "status", "price", "id"),
+        Index("ix_treks_status_rating_id", "status", "rating", "id"),
+        Index("ix_treks_status_review_count_rating_id", "status", "review_count", "rating", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -100,10 +112,34 @@ class Trek(Base):
     )
 
 
+class TrekSeason(Base):
+    """
+    One row per entry of a trek's ``best_season`` list, for indexed season filtering.
+
+    Written by the mapper events in ``app.crud.trek_seasons`` whenever
+    ``best_season`` is; never edit it directly.
+    """
+
+    __tablename__ = "trek_seasons"
+    __table_args__ = (
+        # Season filter: the treks best in a month
+        Index("ix_trek_seasons_month_trek_id", "month", "trek_id"),
+    )
+
+    trek_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("treks.id", ondelete="CASCADE"), primary_key=True
+    )
+    month: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+
 class TrekImage(Base):
     """Additional images for a trek."""
     
     __tablename__ = "trek_images"
+    __table_args__ = (
+        # A trek's images (Trek.images); also serves the trek_id foreign key
+        Index("ix_trek_images_trek_id_display_order", "trek_id", "display_order"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     trek_id: Mapped[int] = mapped_column(
@@ -121,6 +157,10 @@ class ItineraryDay(Base):
     """Day-by-day itinerary for a trek."""
     
     __tablename__ = "itinerary_days"
+    __table_args__ = (
+        # A trek's itinerary in day order (Trek.itinerary)
+        Index("ix_itinerary_days_trek_id_day", "trek_id", "day"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     trek_id: Mapped[int] = mapped_column(
@@ -153,6 +193,10 @@ class TrekFAQ(Base):
     """FAQ items for a trek."""
     
     __tablename__ = "trek_faqs"
+    __table_args__ = (
+        # A trek's FAQs in display order (Trek.faqs)
+        Index("ix_trek_faqs_trek_id_display_order", "trek_id", "display_order"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     trek_id: Mapped[int] = mapped_column(
@@ -178,10 +222,14 @@ class TrekBatch(Base):
     """Departure date batch with seat availability for a trek."""
 
     __tablename__ = "trek_batches"
+    __table_args__ = (
+        # A trek's batches in date order (Trek.batches); also serves the trek_id foreign key
+        Index("ix_trek_batches_trek_id_start_date", "trek_id", "start_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     trek_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("treks.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("treks.id", ondelete="CASCADE"), nullable=False
     )
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
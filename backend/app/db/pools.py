@@ -0,0 +1,163 @@
+"""
+Connection pool metrics.
+
+``watch(engine, name)`` registers an engine's pool for ``/health/db`` and the
+Prometheus text at ``/health/metrics``:
+
+- ``checked_out``, ``checked_in``, ``overflow``: the pool's own gauges.
+- checkout wait: time spent getting a connection (queueing for a free one,
+  or opening a new one), measured by ``TimedQueuePool`` /
+  ``TimedAsyncAdaptedQueuePool``. Mean and max since start, p95 over the last
+  ``WAIT_SAMPLES`` checkouts.
+- ``pre_ping_failures``: pooled connections found dead by ``pool_pre_ping``.
+  ``invalidations`` counts every connection thrown away as broken.
+
+Counters are per worker process.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+WAIT_SAMPLES = 1024
+_WAIT_KEY = "checkout_wait"
+
+
+class _TimedCheckout:
+    """Stores how long each checkout took on the connection record, for the ``checkout`` event."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        record.info[_WAIT_KEY] = time.perf_counter() - started
+        return record
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class PoolMetrics:
+    """Checkout and failure counters for one engine's pool."""
+
+    def __init__(self, name: str, engine: Engine):
+        self.name = name
+        self.engine = engine
+        self.checkouts = 0
+        self.connects = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.pre_ping_failures = 0
+        self.invalidations = 0
+        self._waits: deque = deque(maxlen=WAIT_SAMPLES)
+        self._lock = threading.Lock()
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        wait = connection_record.info.pop(_WAIT_KEY, None)
+        with self._lock:
+            self.checkouts += 1
+            if wait is not None:
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+                self._waits.append(wait)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_error(self, context) -> None:
+        if context.is_pre_ping:
+            with self._lock:
+                self.pre_ping_failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        with self._lock:
+            waits = sorted(self._waits)
+            timed = len(waits)
+            stats = {
+                "name": self.name,
+                "pool": type(pool).__name__,
+                "size": _gauge(pool, "size"),
+                "checked_out": _gauge(pool, "checkedout"),
+                "checked_in": _gauge(pool, "checkedin"),
+                "overflow": _gauge(pool, "overflow"),
+                "max_overflow": getattr(pool, "_max_overflow", None),
+                "pre_ping": bool(getattr(pool, "_pre_ping", False)),
+                "recycle": pool._recycle if pool._recycle >= 0 else None,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "wait_ms_mean": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_ms_p95": round(waits[min(timed - 1, int(timed * 0.95))] * 1000, 3) if timed else 0.0,
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+                "wait_seconds_total": round(self.wait_total, 6),
+                "pre_ping_failures": self.pre_ping_failures,
+                "invalidations": self.invalidations,
+            }
+        return stats
+
+
+def _gauge(pool, method: str) -> Optional[int]:
+    read = getattr(pool, method, None)
+    return read() if callable(read) else None
+
+
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def watch(engine: Engine, name: str) -> PoolMetrics:
+    """Collect metrics for ``engine`` (the sync engine of an async one) under ``name``."""
+    metrics = _registry[name] = PoolMetrics(name, engine)
+    return metrics
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """Stats of every watched pool."""
+    return [metrics.stats() for metrics in _registry.values()]
+
+
+# Prometheus name, stats key, type, help
+_METRICS = (
+    ("db_pool_size", "size", "gauge", "Connections the pool keeps open"),
+    ("db_pool_checked_out", "checked_out", "gauge", "Connections in use"),
+    ("db_pool_checked_in", "checked_in", "gauge", "Idle connections in the pool"),
+    ("db_pool_overflow", "overflow", "gauge", "Connections above pool size (negative: unopened pool slots)"),
+    ("db_pool_checkouts_total", "checkouts", "counter", "Connections checked out"),
+    ("db_pool_connects_total", "connects", "counter", "New database connections opened"),
+    ("db_pool_checkout_wait_seconds_total", "wait_seconds_total", "counter", "Time spent getting a connection"),
+    ("db_pool_checkout_wait_max_seconds", "wait_ms_max", "gauge", "Longest checkout wait"),
+    ("db_pool_pre_ping_failures_total", "pre_ping_failures", "counter", "Pooled connections found dead by pre-ping"),
+    ("db_pool_invalidations_total", "invalidations", "counter", "Connections discarded as broken"),
+)
+
+
+def prometheus() -> str:
+    """Pool metrics in the Prometheus text exposition format."""
+    stats = pool_stats()
+    lines: List[str] = []
+    for metric, key, kind, help_text in _METRICS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for pool in stats:
+            value = pool[key]
+            if value is None:
+                continue
+            if key == "wait_ms_max":
+                value = value / 1000
+            lines.append(f'{metric}{{pool="{pool["name"]}"}} {value}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,275 @@
+"""
+Read-replica routing.
+
+With ``DATABASE_READ_URLS`` set, sessions opened for safe (GET/HEAD) requests
+are bound to a replica, picked round-robin or by fewest checked-out
+connections (``DATABASE_READ_STRATEGY``). Sessions stay on the primary for:
+
+- every other method (writes);
+- ``READ_YOUR_WRITES_SECONDS`` after this process committed a write, so caches
+  dropped by that commit are not rebuilt from a replica that has not caught up;
+- a client whose own write set the ``db_primary_until`` cookie
+  (``ReadYourWritesMiddleware``), on whichever worker it lands next;
+- as long as no replica is healthy.
+
+A replica leaves the rotation when checking out a connection fails (that
+request falls back to the primary) or a connection to it is found dead; a
+background thread pings every replica each ``READ_REPLICA_CHECK_SECONDS`` and
+puts recovered ones back.
+"""
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.events import on_commit
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("round_robin", "least_connections")
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_COOKIE = "db_primary_until"
+
+
+def _checked_out(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+class Replica:
+    """One read replica: a sync and an async engine on the same URL, plus its health."""
+
+    def __init__(self, url: str, engine: Engine, async_engine: Optional[AsyncEngine] = None):
+        self.url = url
+        self.engine = engine
+        self.async_engine = async_engine
+        self.healthy = True
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        for watched in filter(None, (engine, async_engine and async_engine.sync_engine)):
+            event.listen(watched, "handle_error", self._on_error)
+
+    @property
+    def name(self) -> str:
+        """The URL without credentials."""
+        return self.engine.url.render_as_string(hide_password=True)
+
+    def connections(self) -> int:
+        """Connections currently checked out from this replica (sync and async pools)."""
+        count = _checked_out(self.engine)
+        if self.async_engine is not None:
+            count += _checked_out(self.async_engine.sync_engine)
+        return count
+
+    def mark_down(self, error: BaseException) -> None:
+        if self.healthy:
+            logger.warning("Read replica %s is unavailable: %s", self.name, error)
+        self.healthy = False
+        self.failures += 1
+        self.last_error = str(error).splitlines()[0] if str(error) else type(error).__name__
+
+    def check(self) -> bool:
+        """Ping the replica and update its health; returns whether it answered."""
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except DBAPIError as exc:
+            self.mark_down(exc)
+            return False
+        if not self.healthy:
+            logger.info("Read replica %s is back", self.name)
+        self.healthy = True
+        return True
+
+    def _on_error(self, context) -> None:
+        # A stale pooled connection failing pre-ping is replaced, not a replica outage
+        if context.is_disconnect and not context.is_pre_ping:
+            self.mark_down(context.original_exception)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.name,
+            "healthy": self.healthy,
+            "connections": self.connections(),
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class ReplicaPool:
+    """Picks the replica (or the primary) each request's session is bound to."""
+
+    def __init__(
+        self,
+        replicas: Iterable[Replica] = (),
+        *,
+        strategy: str = "round_robin",
+        read_your_writes: float = 5.0,
+        check_interval: float = 10.0,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown read replica strategy: {strategy!r}")
+        self.replicas: List[Replica] = list(replicas)
+        self.strategy = strategy
+        self.read_your_writes = read_your_writes
+        self.check_interval = check_interval
+        self.primary_until = 0.0
+        self.reads = {"replica": 0, "primary": 0, "fallback": 0}
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    # ============================================
+    # Routing
+    # ============================================
+
+    def choose(self) -> Optional[Replica]:
+        """A healthy replica per the strategy, or None when all are down."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            return min(healthy, key=Replica.connections)
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_write(self, *_: Any) -> None:
+        """Start a read-your-writes window for this process (registered with ``on_commit``)."""
+        self.primary_until = time.monotonic() + self.read_your_writes
+
+    def route(self, request: Optional[HTTPConnection]) -> Optional[Replica]:
+        """The replica for ``request``'s reads, or None for the primary."""
+        if not self.replicas or request is None or request.scope.get("method", "GET") not in SAFE_METHODS:
+            return None
+        if time.monotonic() < self.primary_until or wrote_recently(request):
+            self.reads["primary"] += 1
+            return None
+        replica = self.choose()
+        self.reads["replica" if replica is not None else "fallback"] += 1
+        return replica
+
+    def session(self, request: Optional[HTTPConnection], factory: sessionmaker) -> Session:
+        """A session from ``factory``, bound to the replica ``request`` is routed to."""
+        replica = self.route(request)
+        if replica is None:
+            return factory()
+        db = factory(bind=replica.engine)
+        try:
+            db.connection()
+        except DBAPIError as exc:
+            db.close()
+            replica.mark_down(exc)
+            self.reads["fallback"] += 1
+            return factory()
+        return db
+
+    async def async_session(self, request: Optional[HTTPConnection], factory: async_sessionmaker) -> AsyncSession:
+        """Async variant of ``session``."""
+        replica = self.route(request)
+        if replica is None or replica.async_engine is None:
+            return factory()
+        db = factory(bind=replica.async_engine)
+        try:
+            await db.connection()
+        except DBAPIError as exc:
+            await db.close()
+            replica.mark_down(exc)
+            self.reads["fallback"] += 1
+            return factory()
+        return db
+
+    # ============================================
+    # Health checks
+    # ============================================
+
+    def check(self) -> None:
+        for replica in self.replicas:
+            replica.check()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Read replica health check failed")
+
+    def start(self) -> None:
+        """Ping the replicas now and then every ``check_interval`` seconds in the background."""
+        if not self.replicas or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self.check()
+        self._thread = threading.Thread(target=self._run, name="read-replicas", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "replicas": [replica.stats() for replica in self.replicas],
+            "reads": dict(self.reads),
+            "read_your_writes_seconds": self.read_your_writes,
+        }
+
+
+def wrote_recently(request: HTTPConnection) -> bool:
+    """Whether the client's ``db_primary_until`` cookie is still running."""
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Set the ``db_primary_until`` cookie on successful writes, so the client's
+    reads keep going to the primary until replicas have caught up.
+    """
+
+    def __init__(self, app: ASGIApp, seconds: Optional[float] = None):
+        self.app = app
+        self.seconds = settings.READ_YOUR_WRITES_SECONDS if seconds is None else seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or self.seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.seconds
+                cookie = f"{PRIMARY_COOKIE}={until:.3f}; Max-Age={int(self.seconds) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                MutableHeaders(scope=message).append("set-cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def replica_pool(replicas: Iterable[Replica]) -> ReplicaPool:
+    """A pool over ``replicas`` configured from settings, with its commit hook registered."""
+    pool = ReplicaPool(
+        replicas,
+        strategy=settings.DATABASE_READ_STRATEGY,
+        read_your_writes=settings.READ_YOUR_WRITES_SECONDS,
+        check_interval=settings.READ_REPLICA_CHECK_SECONDS,
+    )
+    if pool:
+        on_commit(pool.mark_write)
+    return pool
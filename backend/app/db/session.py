@@ -1,28 +1,73 @@
 """
 Database session configuration.
 Supports both SQLite and MySQL with appropriate configurations.
+
+Alongside the sync engine an asyncio engine (aiosqlite / aiomysql) serves the
+public read endpoints, so a request waiting on the database suspends on the
+event loop instead of holding a threadpool worker. With DATABASE_READ_URLS set,
+GET requests read from replicas (see app/db/replicas.py). SQLite connections
+are tuned in app/db/sqlite.py.
 """
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-# Configure engine based on database type
-if settings.is_sqlite:
-    # SQLite configuration
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False},  # Required for SQLite
-        echo=settings.DEBUG,
-    )
-else:
+from app.core.config import async_url, settings
+from app.db import pools, sqlite
+from app.db.pools import TimedAsyncAdaptedQueuePool, TimedQueuePool
+from app.db.replicas import Replica, replica_pool
+
+
+def engine_options(url: str, *, is_async: bool = False) -> Dict[str, Any]:
+    """create_engine() arguments for a database URL."""
+    if url.startswith("sqlite"):
+        # SQLite configuration
+        options: Dict[str, Any] = {"echo": settings.DEBUG, **sqlite.pool_options(url, is_async=is_async)}
+        if not is_async:
+            options["connect_args"] = {"check_same_thread": False}  # Required for SQLite
+        return options
     # MySQL/PostgreSQL configuration
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,  # Enable connection health checks
-        pool_size=10,
-        max_overflow=20,
-        echo=settings.DEBUG,
-    )
+    recycle = settings.DB_POOL_RECYCLE > 0
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        # Connection health checks on every checkout, unless connections are recycled by age
+        "pool_pre_ping": settings.DB_POOL_PRE_PING and not recycle,
+        "pool_recycle": settings.DB_POOL_RECYCLE if recycle else -1,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "echo": settings.DEBUG,
+    }
+
+
+def make_engine(url: str, name: Optional[str] = None) -> Engine:
+    """Sync engine for ``url``, with SQLite connections tuned and pool metrics under ``name``."""
+    engine = create_engine(url, **engine_options(url))
+    if engine.dialect.name == "sqlite":
+        sqlite.tune(engine)
+    if name:
+        pools.watch(engine, name)
+    return engine
+
+
+def make_async_engine(url: str, name: Optional[str] = None) -> AsyncEngine:
+    """Async engine for ``url``, with SQLite connections tuned and pool metrics under ``name``."""
+    engine = create_async_engine(url, **engine_options(url, is_async=True))
+    if engine.dialect.name == "sqlite":
+        sqlite.tune(engine.sync_engine)
+    if name:
+        pools.watch(engine.sync_engine, name)
+    return engine
+
+
+engine = make_engine(settings.DATABASE_URL, "primary")
+async_engine = make_async_engine(settings.async_database_url, "primary_async")
+
+# Read replicas (empty unless DATABASE_READ_URLS is set)
+read_replicas = replica_pool(
+    Replica(url, make_engine(url, f"replica{n}"), make_async_engine(async_url(url), f"replica{n}_async"))
+    for n, url in enumerate(settings.read_database_urls, 1)
+)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -31,3 +76,9 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Async session factory; rows stay readable after commit (no lazy refresh on an AsyncSession)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
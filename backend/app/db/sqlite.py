@@ -0,0 +1,80 @@
+"""
+SQLite connection tuning.
+
+A ``connect`` listener runs the PRAGMAs from settings on every new connection
+(sync, aiosqlite and replica engines alike):
+
+- ``journal_mode=WAL``: readers no longer block the writer or each other.
+  Stored in the database file, so it sticks once set.
+- ``synchronous=NORMAL``: in WAL mode, fsync at checkpoints rather than on
+  every commit. A power cut can lose the last commits but not corrupt the file.
+- ``busy_timeout``: a writer waits this long for the lock instead of raising
+  "database is locked".
+- ``cache_size``, ``mmap_size``, ``temp_store``: per-connection page cache,
+  memory-mapped reads, and temporary tables/sorts kept in memory.
+
+File databases get a connection pool sized from settings; in-memory ones keep
+SQLAlchemy's default (one connection per thread, or they would not share data).
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Connection, Engine, event, make_url
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.pools import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+POOL_CLASSES = ("queue", "null")
+PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
+
+
+def pragmas() -> List[Tuple[str, Any]]:
+    """The (name, value) PRAGMAs to run on each connection; empty when tuning is off."""
+    if not settings.SQLITE_TUNING_ENABLED:
+        return []
+    return [
+        ("journal_mode", settings.SQLITE_JOURNAL_MODE),
+        ("synchronous", settings.SQLITE_SYNCHRONOUS),
+        ("busy_timeout", int(settings.SQLITE_BUSY_TIMEOUT_MS)),
+        # Negative: size in KiB rather than pages
+        ("cache_size", -int(settings.SQLITE_CACHE_SIZE_KB)),
+        ("mmap_size", int(settings.SQLITE_MMAP_SIZE)),
+        ("temp_store", settings.SQLITE_TEMP_STORE),
+    ]
+
+
+def tune(engine: Engine, values: Optional[List[Tuple[str, Any]]] = None) -> None:
+    """Run ``values`` (default: ``pragmas()``) on every new connection of ``engine``."""
+    statements = [f"PRAGMA {name}={value}" for name, value in (pragmas() if values is None else values)]
+    if not statements:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def pool_options(url: str, *, is_async: bool = False) -> Dict[str, Any]:
+    """create_engine() pool arguments for a SQLite URL."""
+    database = make_url(url).database or ""
+    if database in ("", ":memory:") or "mode=memory" in url:
+        return {}
+    if settings.SQLITE_POOL_CLASS not in POOL_CLASSES:
+        raise ValueError(f"Unknown SQLite pool class: {settings.SQLITE_POOL_CLASS!r}")
+    if settings.SQLITE_POOL_CLASS == "null":
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.SQLITE_POOL_SIZE,
+        "max_overflow": settings.SQLITE_MAX_OVERFLOW,
+    }
+
+
+def current(conn: Connection) -> Dict[str, Any]:
+    """The PRAGMA values in effect on ``conn``."""
+    return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in PRAGMAS}
@@ -6,10 +6,13 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.query_stats import QueryStatsMiddleware
 from app.api.v1.router import api_router
 from app.db.base import Base
-from app.db.session import engine
+from app.db.replicas import ReadYourWritesMiddleware
+from app.db.session import async_engine, engine, read_replicas
 
 
 @asynccontextmanager
@@ -46,10 +49,79 @@ async def lifespan(app: FastAPI):
         # Default behavior: use create_all() for backward compatibility
         Base.metadata.create_all(bind=engine)
     
+    # Full-text index for blog search (rebuilt if posts were written without it)
+    from app.crud import blog_search
+    from app.db.session import SessionLocal
+    if blog_search.ensure_index(engine):
+        db = SessionLocal()
+        try:
+            if blog_search.is_stale(db):
+                print(f"Blog search index rebuilt: {blog_search.rebuild(db)} posts")
+        finally:
+            db.close()
+    
+    # Materialized blog post counts (recounted if posts were written without them)
+    from app.crud import blog_counts
+    db = SessionLocal()
+    try:
+        if any(blog_counts.drift(db).values()):
+            print(f"Blog post counts reconciled: {blog_counts.reconcile(db)}")
+    finally:
+        db.close()
+    
+    # Normalized trek seasons behind the season filter (backfilled if treks were written without it)
+    from app.crud import trek_seasons
+    db = SessionLocal()
+    try:
+        if trek_seasons.is_stale(db):
+            print(f"Trek seasons rebuilt: {trek_seasons.rebuild(db)} treks")
+    finally:
+        db.close()
+    
+    # Normalized media tags behind the tag filter and counts (backfilled the same way)
+    from app.crud import media_tags
+    db = SessionLocal()
+    try:
+        if media_tags.is_stale(db):
+            print(f"Media tags rebuilt: {media_tags.rebuild(db)} media items")
+    finally:
+        db.close()
+    
+    # Build the homepage snapshot and keep it fresh in the background
+    from app.services.pages import home_snapshot
+    home_snapshot.start()
+    
+    # In-memory site search index, updated as content is written
+    from app.services.search import site_search
+    site_search.start()
+    
+    # Typeahead trie, rebuilt when content is published/unpublished
+    from app.services.autocomplete import autocomplete
+    autocomplete.start()
+    
+    # Ping read replicas now and keep checking them in the background
+    read_replicas.start()
+    
+    # Optionally prefetch the hot working set before accepting traffic
+    if settings.CACHE_WARMUP_ENABLED:
+        from app.services.warmup import warm_up
+        report = await warm_up(app, budget=settings.CACHE_WARMUP_BUDGET_SECONDS)
+        print(
+            f"Cache warm-up: {report['warmed']} entries warmed in {report['seconds']}s "
+            f"({report['failed']} failed, {report['skipped']} skipped, budget {report['budget']}s)"
+        )
+    
     yield
     
-    # Cleanup (if needed)
-    pass
+    # Cleanup
+    home_snapshot.stop()
+    site_search.stop()
+    autocomplete.stop()
+    read_replicas.stop()
+    await async_engine.dispose()
+    for replica in read_replicas.replicas:
+        replica.engine.dispose()
+        await replica.async_engine.dispose()
 
 
 # Create FastAPI application
@@ -90,6 +162,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses (gzip/brotli); precompressed cache hits pass through untouched
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
+# Keep a client's reads on the primary for a while after its own writes
+if read_replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Count each request's SQL (Server-Timing header, N+1 warnings in debug); outermost
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
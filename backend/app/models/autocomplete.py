@@ -0,0 +1,20 @@
+"""
+Autocomplete schemas.
+"""
+from typing import List
+from pydantic import BaseModel
+
+
+class AutocompleteSuggestion(BaseModel):
+    """One typeahead suggestion."""
+    type: str  # trek, expedition, blog
+    id: int
+    slug: str
+    label: str
+    detail: str  # location / region, or blog category
+
+
+class AutocompleteResponse(BaseModel):
+    """Suggestions ranked by popularity."""
+    query: str
+    items: List[AutocompleteSuggestion]
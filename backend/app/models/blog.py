@@ -298,5 +298,21 @@ class BlogPostListResponse(BaseModel):
         )
 
 
+class BlogPostSearchResponse(BlogPostListResponse):
+    """Blog post search hit with highlighted matches (HTML-escaped, matches in <mark>)."""
+    highlightedTitle: Optional[str] = None
+    snippet: Optional[str] = None
+
+    @classmethod
+    def from_orm_model(cls, obj, highlight: Optional[dict] = None):
+        """Convert ORM model plus its highlight entry to a search hit."""
+        highlight = highlight or {}
+        return cls(
+            **BlogPostListResponse.from_orm_model(obj).model_dump(),
+            highlightedTitle=highlight.get("title"),
+            snippet=highlight.get("snippet"),
+        )
+
+
 # Update forward references
 BlogCategoryTreeResponse.model_rebuild()
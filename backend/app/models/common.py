@@ -13,6 +13,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page (keyset pagination)
 
 
 class MessageResponse(BaseModel):
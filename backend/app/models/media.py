@@ -61,6 +61,7 @@ class MediaListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class MediaUploadResponse(MediaResponse):
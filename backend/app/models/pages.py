@@ -0,0 +1,39 @@
+"""
+Pydantic schemas for aggregated page bundles.
+"""
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+
+from app.models.batch import TrekBatchResponse
+from app.models.blog import BlogPostListResponse
+from app.models.expedition import ExpeditionListResponse
+from app.models.google_review import GoogleReviewsResponse
+from app.models.page_content import PageSectionResponse
+from app.models.site_settings import SiteSettingsResponse
+from app.models.testimonial import TestimonialListResponse
+from app.models.trek import TrekDetailResponse, TrekListResponse
+
+
+class TrekPageResponse(BaseModel):
+    """Everything the trek detail page renders, in one payload."""
+
+    trek: TrekDetailResponse
+    related_treks: List[TrekListResponse] = []
+    batches: List[TrekBatchResponse] = []
+    reviews: GoogleReviewsResponse
+    site_settings: SiteSettingsResponse
+
+
+class HomePageResponse(BaseModel):
+    """Precomputed homepage snapshot."""
+
+    featured_treks: List[TrekListResponse] = []
+    budget_treks: List[TrekListResponse] = []
+    expeditions: List[ExpeditionListResponse] = []
+    featured_testimonials: List[TestimonialListResponse] = []
+    recent_posts: List[BlogPostListResponse] = []
+    sections: List[PageSectionResponse] = []
+    reviews: GoogleReviewsResponse
+    site_settings: SiteSettingsResponse
+    generated_at: datetime
@@ -0,0 +1,23 @@
+"""
+Site search schemas.
+"""
+from typing import List
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    """One search result."""
+    type: str  # trek, expedition, blog, page
+    id: int
+    slug: str
+    title: str
+    summary: str
+    url: str  # site path of the result page
+    score: float
+
+
+class SearchResponse(BaseModel):
+    """Ranked site search results."""
+    query: str
+    total: int
+    items: List[SearchHit]
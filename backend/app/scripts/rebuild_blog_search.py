@@ -0,0 +1,52 @@
+"""
+Rebuild the blog full-text search index.
+
+Repopulates ``blog_posts_fts`` from blog_posts. Normal creates, updates and
+deletes keep the index in sync; run this after bulk imports done outside the
+ORM, after restoring a database dump, or to recover from drift.
+
+Usage:
+    poetry run python -m app.scripts.rebuild_blog_search [--batch-size N]
+    poetry run rebuild-blog-search [--batch-size N]
+"""
+import argparse
+import logging
+import time
+
+from app.crud import blog_search
+from app.db.session import SessionLocal, engine
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def run_rebuild(batch_size: int = 500) -> int:
+    """Rebuild the index; returns the number of posts indexed (0 if unsupported)."""
+    if engine.dialect.name not in ("sqlite", "mysql"):
+        logger.warning("Full-text search index is not supported on %s", engine.dialect.name)
+        return 0
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        count = blog_search.rebuild(db, batch_size=batch_size)
+    finally:
+        db.close()
+    logger.info("Indexed %d blog posts in %.2fs", count, time.perf_counter() - started)
+    return count
+
+
+def run_cli() -> None:
+    """CLI entry point for Poetry script."""
+    parser = argparse.ArgumentParser(description="Rebuild the blog full-text search index")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Posts read per batch (default 500)",
+    )
+    args = parser.parse_args()
+    run_rebuild(batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    run_cli()
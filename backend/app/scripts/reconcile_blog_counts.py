@@ -0,0 +1,53 @@
+"""
+Reconcile the materialized blog post counts.
+
+Recounts ``post_count`` on every blog category and tag from blog_posts and
+blog_post_tags and corrects the rows that drifted. Post creates, updates,
+deletes and re-tagging through the ORM keep the counts current; run this after
+bulk imports done outside the ORM, after restoring a database dump, or on a
+schedule as a safety net.
+
+Usage:
+    poetry run python -m app.scripts.reconcile_blog_counts [--check]
+    poetry run reconcile-blog-counts [--check]
+"""
+import argparse
+import logging
+import sys
+from typing import Dict
+
+from app.crud import blog_counts
+from app.db.session import SessionLocal
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def run_reconcile(check: bool = False) -> Dict[str, int]:
+    """Recount (or with ``check`` only compare) the counts; returns the drifted rows per table."""
+    db = SessionLocal()
+    try:
+        counts = blog_counts.drift(db) if check else blog_counts.reconcile(db)
+    finally:
+        db.close()
+    verb = "out of date" if check else "corrected"
+    logger.info("post_count %s: %d categories, %d tags", verb, counts["categories"], counts["tags"])
+    return counts
+
+
+def run_cli() -> None:
+    """CLI entry point for Poetry script."""
+    parser = argparse.ArgumentParser(description="Reconcile blog category and tag post counts")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report drift; exit with status 1 if any count is wrong",
+    )
+    args = parser.parse_args()
+    counts = run_reconcile(check=args.check)
+    if args.check and any(counts.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_cli()
@@ -0,0 +1,252 @@
+"""
+Typeahead suggestions from a prefix trie.
+
+Names, locations and regions of published treks, expeditions and blog posts
+are inserted into a character trie - every word-suffix of each phrase, so
+"pass" finds "Hampta Pass" - and each node keeps its top suggestions already
+ranked by popularity (review count, then rating). A lookup walks one node per
+typed character and returns that list: no scoring, no SQL.
+
+The trie is immutable once built. Commits that touch the source tables
+(publishing, unpublishing, renames, new ratings) trigger a debounced rebuild on
+a background thread, which swaps the new trie in atomically.
+"""
+import logging
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.db.events import ChangeSet, on_commit
+from app.db.models.blog import BlogPost
+from app.db.models.expedition import Expedition
+from app.db.models.trek import Trek
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_TYPES = ("trek", "expedition", "blog")
+
+# Suggestions kept per trie node (the largest ``limit`` for a prefix lookup).
+# The root keeps every item, so an empty query lists them all by popularity.
+MAX_SUGGESTIONS = 20
+
+# Settle a burst of admin writes into one rebuild
+REBUILD_DEBOUNCE_SECONDS = 0.5
+
+
+def normalize(value: Optional[str]) -> str:
+    """Lowercase, accent-folded, single-spaced text used for trie keys and queries."""
+    if not value:
+        return ""
+    folded = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return " ".join("".join(c if c.isalnum() else " " for c in folded.lower()).split())
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    type: str
+    id: int
+    slug: str
+    label: str
+    detail: str  # location / region or category shown next to the label
+    rank: Tuple  # higher sorts first
+
+    def as_dict(self) -> dict:
+        return {"type": self.type, "id": self.id, "slug": self.slug, "label": self.label, "detail": self.detail}
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[Suggestion] = []
+
+
+class PrefixTrie:
+    """Character trie whose nodes hold their best ``MAX_SUGGESTIONS`` suggestions (the root: all)."""
+
+    def __init__(self, suggestions: Iterable[Tuple[Suggestion, Iterable[str]]]):
+        """``suggestions``: each suggestion with the phrases it should be found by."""
+        self.root = _Node()
+        self.size = 0
+        self.nodes = 1
+        # Insert best-first so each node's list fills with the top entries and stops growing
+        entries = sorted(suggestions, key=lambda entry: entry[0].rank, reverse=True)
+        for suggestion, phrases in entries:
+            self.size += 1
+            self.root.top.append(suggestion)
+            keys = set()
+            for phrase in phrases:
+                words = normalize(phrase).split()
+                keys.update(" ".join(words[i:]) for i in range(len(words)))
+            for key in keys:
+                self._insert(key, suggestion)
+
+    def _insert(self, key: str, suggestion: Suggestion) -> None:
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+                self.nodes += 1
+            node = child
+            self._offer(node, suggestion)
+
+    @staticmethod
+    def _offer(node: _Node, suggestion: Suggestion) -> None:
+        # Entries arrive best-first and a suggestion's keys are inserted together,
+        # so a repeat (two keys sharing this prefix) can only be the last entry
+        if len(node.top) < MAX_SUGGESTIONS and (not node.top or node.top[-1] is not suggestion):
+            node.top.append(suggestion)
+
+    def lookup(self, prefix: str) -> List[Suggestion]:
+        """Ranked suggestions for a normalized prefix."""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top
+
+
+def _rank(row, featured: bool = False) -> Tuple:
+    return (row.review_count or 0, row.rating or 0.0, featured, row.id)
+
+
+def load_suggestions(db) -> Dict[str, List[Tuple[Suggestion, Tuple[str, ...]]]]:
+    """Published items per type with their searchable phrases."""
+    treks = db.query(
+        Trek.id, Trek.slug, Trek.name, Trek.location, Trek.review_count, Trek.rating, Trek.featured,
+    ).filter(Trek.status == "published")
+    expeditions = db.query(
+        Expedition.id, Expedition.slug, Expedition.name, Expedition.location, Expedition.region,
+        Expedition.review_count, Expedition.rating, Expedition.featured,
+    ).filter(Expedition.status == "published")
+    posts = db.query(
+        BlogPost.id, BlogPost.slug, BlogPost.title, BlogPost.category, BlogPost.featured,
+    ).filter(BlogPost.status == "published")
+    return {
+        "trek": [
+            (Suggestion("trek", t.id, t.slug, t.name, t.location, _rank(t, t.featured)), (t.name, t.location))
+            for t in treks
+        ],
+        "expedition": [
+            (
+                Suggestion(
+                    "expedition", e.id, e.slug, e.name,
+                    ", ".join(filter(None, (e.location, e.region))), _rank(e, e.featured),
+                ),
+                (e.name, e.location, e.region),
+            )
+            for e in expeditions
+        ],
+        # Posts have no reviews: featured first, then newest
+        "blog": [
+            (Suggestion("blog", p.id, p.slug, p.title, p.category or "", (0, 0.0, bool(p.featured), p.id)), (p.title,))
+            for p in posts
+        ],
+    }
+
+
+class Autocomplete:
+    """Per-type tries plus a combined one, rebuilt in the background after commits."""
+
+    tables = ("treks", "expeditions", "blog_posts")
+
+    def __init__(self) -> None:
+        self._tries: Optional[Dict[str, PrefixTrie]] = None
+        self.built_at: Optional[float] = None
+        self.build_seconds = 0.0
+        self.rebuilds = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        on_commit(self._on_change, tables=self.tables)
+
+    def rebuild(self) -> None:
+        with self._lock:
+            started = time.perf_counter()
+            db = SessionLocal()
+            try:
+                by_type = load_suggestions(db)
+            finally:
+                db.close()
+            tries = {name: PrefixTrie(entries) for name, entries in by_type.items()}
+            tries["*"] = PrefixTrie(entry for entries in by_type.values() for entry in entries)
+            self._tries = tries
+            self.built_at = time.time()
+            self.build_seconds = time.perf_counter() - started
+            self.rebuilds += 1
+
+    def suggest(self, query: str, *, types: Optional[Set[str]] = None, limit: int = 10) -> List[Suggestion]:
+        """Top ``limit`` suggestions for ``query`` (an empty query gives the most popular items)."""
+        tries = self._tries
+        if tries is None:
+            self.rebuild()
+            tries = self._tries
+        prefix = normalize(query)
+        if types is None or set(AUTOCOMPLETE_TYPES) <= types:
+            return tries["*"].lookup(prefix)[:limit]
+        if len(types) == 1:
+            return tries[next(iter(types))].lookup(prefix)[:limit]
+        merged = [s for name in types for s in tries[name].lookup(prefix)[:limit]]
+        merged.sort(key=lambda s: s.rank, reverse=True)
+        return merged[:limit]
+
+    def _on_change(self, changes: ChangeSet) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._wake.set()
+        else:
+            # No rebuilder running (CLI, tests): rebuild lazily on next lookup
+            self._tries = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            if self._stop.is_set():
+                break
+            time.sleep(REBUILD_DEBOUNCE_SECONDS)
+            self._wake.clear()
+            try:
+                self.rebuild()
+            except Exception:
+                self.failures += 1
+                logger.exception("Rebuilding the autocomplete trie failed")
+
+    def start(self) -> None:
+        """Build the tries and start rebuilding them in the background after commits."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        try:
+            self.rebuild()
+        except Exception:
+            self.failures += 1
+            logger.exception("Building the autocomplete trie failed")
+        self._thread = threading.Thread(target=self._run, name="autocomplete", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> dict:
+        tries = self._tries or {}
+        return {
+            "items": {name: trie.size for name, trie in tries.items() if name != "*"},
+            "nodes": tries["*"].nodes if "*" in tries else 0,
+            "build_seconds": round(self.build_seconds, 4),
+            "rebuilds": self.rebuilds,
+            "failures": self.failures,
+        }
+
+
+autocomplete = Autocomplete()
@@ -0,0 +1,173 @@
+"""
+Page bundle assembly.
+
+Builds the complete payload a frontend page needs in one call so the SSR
+server makes a single round-trip instead of one per section. Independent
+sections are loaded concurrently, each in its own session on the threadpool.
+"""
+import asyncio
+from datetime import date, datetime
+from typing import Callable, List, Optional, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.cache import ResponseCache
+from app.core.config import settings
+from app.core.snapshot import Snapshot
+from app.crud import google_review as crud_google_review
+from app.crud import site_settings as crud_site_settings
+from app.crud.base import load_strategy
+from app.crud.blog import blog_crud
+from app.crud.expedition import expedition_crud
+from app.crud.page_content import page_section_crud
+from app.crud.testimonial import testimonial_crud
+from app.crud.trek import trek_crud
+from app.db.events import on_commit
+from app.db.models.trek import Trek
+from app.db.session import SessionLocal
+from app.models.blog import BlogPostListResponse
+from app.models.expedition import ExpeditionListResponse
+from app.models.google_review import GoogleReviewsResponse
+from app.models.page_content import PageSectionResponse
+from app.models.pages import HomePageResponse, TrekPageResponse
+from app.models.testimonial import TestimonialListResponse
+from app.models.site_settings import SiteSettingsResponse
+from app.models.trek import TrekDetailResponse, TrekListResponse
+
+T = TypeVar("T")
+
+RELATED_TREKS_LIMIT = 4
+BUDGET_TREK_MAX_PRICE = 10000
+HOME_EXPEDITIONS_LIMIT = 2
+
+# Serialized page bundles; dropped whenever any table a bundle draws from changes.
+page_response_cache = ResponseCache("pages")
+on_commit(
+    page_response_cache.clear,
+    tables=(
+        "treks", "trek_batches", "itinerary_days", "trek_images", "trek_faqs", "guides",
+        "google_reviews", "google_reviews_meta", "site_settings",
+    ),
+)
+
+
+def _with_session(loader: Callable[[Session], T]) -> T:
+    db = SessionLocal()
+    try:
+        return loader(db)
+    finally:
+        db.close()
+
+
+async def _load(loader: Callable[[Session], T]) -> T:
+    """Run a sync loader in the threadpool with a session of its own."""
+    return await run_in_threadpool(_with_session, loader)
+
+
+def load_trek_detail(db: Session, slug: str) -> Optional[TrekDetailResponse]:
+    trek = trek_crud.get_by_slug_with_details(db, slug, strategy=load_strategy("trek_page"))
+    return TrekDetailResponse.model_validate(trek) if trek else None
+
+
+def load_related_treks(db: Session, slug: str) -> List[TrekListResponse]:
+    """Published treks in the same location, falling back to featured treks."""
+    location = db.query(Trek.location).filter(Trek.slug == slug).scalar()
+    treks = []
+    if location:
+        treks = trek_crud.get_multi_with_filters(
+            db, limit=RELATED_TREKS_LIMIT + 1, location=location, status="published"
+        )
+    treks = [t for t in treks if t.slug != slug]
+    if not treks:
+        treks = trek_crud.get_multi_with_filters(
+            db, limit=RELATED_TREKS_LIMIT + 1, featured=True, status="published"
+        )
+        treks = [t for t in treks if t.slug != slug]
+    return [TrekListResponse.model_validate(t) for t in treks[:RELATED_TREKS_LIMIT]]
+
+
+def load_reviews(db: Session) -> GoogleReviewsResponse:
+    result = crud_google_review.get_reviews_with_meta(db, settings.GOOGLE_REVIEWS_PLACE_ID)
+    if result is None:
+        return GoogleReviewsResponse(
+            reviews=[], place_name="", rating=None, user_ratings_total=None, last_synced_at=None
+        )
+    return result
+
+
+def load_site_settings(db: Session) -> SiteSettingsResponse:
+    return crud_site_settings.get(db) or crud_site_settings.get_defaults()
+
+
+async def build_trek_page(slug: str) -> Optional[TrekPageResponse]:
+    """Assemble the trek detail page bundle, or None if the trek does not exist."""
+    trek, related, reviews, site_settings = await asyncio.gather(
+        _load(lambda db: load_trek_detail(db, slug)),
+        _load(lambda db: load_related_treks(db, slug)),
+        _load(load_reviews),
+        _load(load_site_settings),
+    )
+    if trek is None:
+        return None
+
+    today = date.today()
+    return TrekPageResponse(
+        trek=trek,
+        related_treks=related,
+        batches=[b for b in trek.batches if b.is_active and b.end_date >= today],
+        reviews=reviews,
+        site_settings=site_settings,
+    )
+
+
+def build_home_page() -> HomePageResponse:
+    """Assemble the homepage payload (used by the background snapshot)."""
+    db = SessionLocal()
+    try:
+        return HomePageResponse(
+            featured_treks=[
+                TrekListResponse.model_validate(t)
+                for t in trek_crud.get_multi_with_filters(db, limit=6, featured=True, status="published")
+            ],
+            budget_treks=[
+                TrekListResponse.model_validate(t)
+                for t in trek_crud.get_multi_with_filters(
+                    db, limit=4, max_price=BUDGET_TREK_MAX_PRICE, status="published"
+                )
+            ],
+            expeditions=[
+                ExpeditionListResponse.from_orm_model(e)
+                for e in expedition_crud.get_multi_with_filters(
+                    db, limit=HOME_EXPEDITIONS_LIMIT, status="published"
+                )
+            ],
+            featured_testimonials=[
+                TestimonialListResponse.model_validate(t)
+                for t in testimonial_crud.get_featured(db, limit=6)
+            ],
+            recent_posts=[
+                BlogPostListResponse.from_orm_model(p) for p in blog_crud.get_recent(db, limit=3)
+            ],
+            sections=[
+                PageSectionResponse.model_validate(s)
+                for s in page_section_crud.list_by_page(db, page="home")
+            ],
+            reviews=load_reviews(db),
+            site_settings=load_site_settings(db),
+            generated_at=datetime.utcnow(),
+        )
+    finally:
+        db.close()
+
+
+home_snapshot = Snapshot(
+    "home",
+    build_home_page,
+    tables=(
+        "treks", "expeditions", "testimonials", "blog_posts", "blog_authors",
+        "blog_categories", "blog_tags", "page_sections", "google_reviews",
+        "google_reviews_meta", "site_settings",
+    ),
+    interval=settings.HOME_SNAPSHOT_REFRESH_SECONDS,
+)
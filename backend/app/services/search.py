@@ -0,0 +1,437 @@
+"""
+Site-wide search over treks, expeditions, blog posts and page sections.
+
+An in-process inverted index answers ``GET /api/v1/search`` without touching
+the database. It is built once at startup; afterwards each commit that writes
+one of the source tables queues the changed ids (``app.db.events``) and a
+background thread reloads just those rows, so publishes, edits and deletes
+show up within moments. Scoring is BM25 over weighted fields (title matches
+count more than body text); the last query term also matches as a prefix so
+results follow the user while they type.
+
+The index lives per worker process, like the response caches.
+"""
+import bisect
+import logging
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import Session
+
+from app.crud.blog_search import html_to_text
+from app.db.events import ChangeSet, on_commit
+from app.db.models.blog import BlogPost
+from app.db.models.expedition import Expedition
+from app.db.models.page_content import PageSection
+from app.db.models.trek import Trek
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Per-field term frequency weights
+FIELD_WEIGHTS = {"title": 3.0, "keywords": 1.5, "body": 1.0}
+
+# Prefix expansions of the last term score a little below exact matches
+PREFIX_DISCOUNT = 0.8
+# A one-letter prefix would expand to most of the vocabulary
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 50
+
+SUMMARY_LENGTH = 200
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the this to with".split()
+)
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Lowercase, accent-folded word tokens without stopwords."""
+    if not value:
+        return []
+    folded = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return [t for t in _WORD_RE.findall(folded.lower()) if t not in STOPWORDS]
+
+
+# ============================================
+# Documents
+# ============================================
+
+@dataclass
+class SearchDocument:
+    """One searchable item and the fields returned with a hit."""
+    type: str
+    id: int
+    slug: str
+    title: str
+    summary: str
+    url: str
+    keywords: str = ""
+    body: str = ""
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return (self.type, self.id)
+
+
+def _summary(value: Optional[str]) -> str:
+    text = html_to_text(value)
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[:SUMMARY_LENGTH].rsplit(" ", 1)[0] + "…"
+
+
+def _trek(trek: Trek) -> SearchDocument:
+    return SearchDocument(
+        type="trek",
+        id=trek.id,
+        slug=trek.slug,
+        title=trek.name,
+        summary=_summary(trek.short_description),
+        url=f"/treks/{trek.slug}",
+        keywords=f"{trek.location} {trek.difficulty}",
+        body=f"{trek.short_description or ''} {html_to_text(trek.description)}",
+    )
+
+
+def _expedition(expedition: Expedition) -> SearchDocument:
+    return SearchDocument(
+        type="expedition",
+        id=expedition.id,
+        slug=expedition.slug,
+        title=expedition.name,
+        summary=_summary(expedition.short_description),
+        url=f"/expeditions/{expedition.slug}",
+        keywords=f"{expedition.location} {expedition.region} {expedition.difficulty}",
+        body=f"{expedition.short_description} {html_to_text(expedition.description)}",
+    )
+
+
+def _blog_post(post: BlogPost) -> SearchDocument:
+    return SearchDocument(
+        type="blog",
+        id=post.id,
+        slug=post.slug,
+        title=post.title,
+        summary=_summary(post.excerpt or post.content),
+        url=f"/blog/{post.slug}",
+        keywords=f"{post.category or ''} {' '.join(post.tags) if isinstance(post.tags, list) else ''}",
+        body=f"{html_to_text(post.excerpt)} {html_to_text(post.content)}",
+    )
+
+
+def _page_section(section: PageSection) -> SearchDocument:
+    return SearchDocument(
+        type="page",
+        id=section.id,
+        slug=f"{section.page}/{section.key}",
+        title=section.title or section.key.replace("_", " ").title(),
+        summary=_summary(section.subtitle or section.body_html),
+        url="/" if section.page == "home" else f"/{section.page}",
+        keywords=f"{section.badge_text or ''} {section.subtitle or ''}",
+        body=html_to_text(section.body_html),
+    )
+
+
+@dataclass
+class SearchSource:
+    """A searchable table: which rows are public and how to turn one into a document."""
+    type: str
+    model: type
+    public: Callable[[], ColumnElement]
+    to_document: Callable[[object], SearchDocument]
+
+    def load(
+        self,
+        db: Session,
+        ids: Optional[Iterable[int]] = None,
+    ) -> Iterator[Tuple[int, Optional[SearchDocument]]]:
+        """
+        Yield ``(id, document)`` for public rows; with ``ids``, only those rows,
+        plus ``(id, None)`` for each one that is gone or no longer public.
+        """
+        query = db.query(self.model).filter(self.public())
+        if ids is not None:
+            ids = set(ids)
+            query = query.filter(self.model.id.in_(ids))
+        found = set()
+        for row in query.yield_per(500):
+            found.add(row.id)
+            yield row.id, self.to_document(row)
+        for missing in (ids or set()) - found:
+            yield missing, None
+
+
+SEARCH_SOURCES = (
+    SearchSource("trek", Trek, lambda: Trek.status == "published", _trek),
+    SearchSource("expedition", Expedition, lambda: Expedition.status == "published", _expedition),
+    SearchSource("blog", BlogPost, lambda: BlogPost.status == "published", _blog_post),
+    SearchSource("page", PageSection, lambda: PageSection.is_active.is_(True), _page_section),
+)
+SEARCH_TYPES = tuple(source.type for source in SEARCH_SOURCES)
+
+
+# ============================================
+# Inverted index
+# ============================================
+
+class InvertedIndex:
+    """Term -> {document key: weighted term frequency}, with BM25 scoring."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.documents: Dict[Tuple[str, int], SearchDocument] = {}
+        self._postings: Dict[str, Dict[Tuple[str, int], float]] = {}
+        self._doc_terms: Dict[Tuple[str, int], List[str]] = {}
+        self._doc_length: Dict[Tuple[str, int], float] = {}
+        self._total_length = 0.0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, doc: SearchDocument) -> None:
+        """Index ``doc``, replacing any previous version of it."""
+        frequencies: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(getattr(doc, field)):
+                frequencies[term] += weight
+        with self._lock:
+            self._remove(doc.key)
+            self.documents[doc.key] = doc
+            self._doc_terms[doc.key] = list(frequencies)
+            length = sum(frequencies.values())
+            self._doc_length[doc.key] = length
+            self._total_length += length
+            for term, tf in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._vocabulary_dirty = True
+                postings[doc.key] = tf
+
+    def remove(self, key: Tuple[str, int]) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Tuple[str, int]) -> None:
+        if key not in self.documents:
+            return
+        del self.documents[key]
+        self._total_length -= self._doc_length.pop(key)
+        for term in self._doc_terms.pop(key):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+    def clear(self, doc_type: Optional[str] = None) -> None:
+        with self._lock:
+            for key in [k for k in self.documents if doc_type is None or k[0] == doc_type]:
+                self._remove(key)
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Indexed terms starting with ``prefix`` (sorted vocabulary + bisect)."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms[:MAX_PREFIX_EXPANSIONS]
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self.documents)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        *,
+        types: Optional[Set[str]] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Tuple[SearchDocument, float]], int]:
+        """
+        Documents containing every query term (the last one as a prefix too),
+        best first. Returns ``(top hits with scores, total matches)``.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return [], 0
+        with self._lock:
+            if not self.documents:
+                return [], 0
+            avg_length = self._total_length / len(self.documents) or 1.0
+            scores: Optional[Dict[Tuple[str, int], float]] = None
+            for position, term in enumerate(terms):
+                # Each query term: {doc: best score over its exact / prefix variants}
+                variants = [(term, 1.0)]
+                if position == len(terms) - 1 and len(term) >= MIN_PREFIX_LENGTH:
+                    variants += [(t, PREFIX_DISCOUNT) for t in self._expand(term) if t != term]
+                term_scores: Dict[Tuple[str, int], float] = {}
+                for variant, factor in variants:
+                    postings = self._postings.get(variant)
+                    if not postings:
+                        continue
+                    idf = self._idf(variant) * factor
+                    for key, tf in postings.items():
+                        if scores is not None and key not in scores:
+                            continue
+                        if types is not None and key[0] not in types:
+                            continue
+                        norm = K1 * (1 - B + B * self._doc_length[key] / avg_length)
+                        score = idf * tf * (K1 + 1) / (tf + norm)
+                        if score > term_scores.get(key, 0.0):
+                            term_scores[key] = score
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {key: scores[key] + s for key, s in term_scores.items()}
+                if not scores:
+                    return [], 0
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return [(self.documents[key], score) for key, score in ranked[:limit]], len(ranked)
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = Counter(key[0] for key in self.documents)
+            return {
+                "documents": dict(counts),
+                "terms": len(self._postings),
+            }
+
+
+# ============================================
+# Site index (startup build + incremental updates)
+# ============================================
+
+class SiteSearch:
+    """The inverted index plus the machinery that keeps it in step with the database."""
+
+    def __init__(self, sources: Iterable[SearchSource] = SEARCH_SOURCES):
+        self.sources = {source.model.__tablename__: source for source in sources}
+        self.index = InvertedIndex()
+        self.built_at: Optional[float] = None
+        self.build_seconds = 0.0
+        self.updates = 0
+        self.failures = 0
+        self._pending: Dict[str, Optional[Set[int]]] = {}
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        on_commit(self._on_change, tables=self.sources)
+
+    def build(self) -> None:
+        """(Re)index every public row of every source."""
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            index = InvertedIndex()
+            for source in self.sources.values():
+                for _, doc in source.load(db):
+                    index.add(doc)
+        finally:
+            db.close()
+        self.index = index
+        self.built_at = time.time()
+        self.build_seconds = time.perf_counter() - started
+
+    def search(self, query: str, *, types: Optional[Set[str]] = None, limit: int = 20):
+        if self.built_at is None:
+            self.build()
+        elif self._pending and (self._thread is None or not self._thread.is_alive()):
+            # No updater running (CLI, tests): apply queued changes inline
+            self.apply_pending()
+        return self.index.search(query, types=types, limit=limit)
+
+    def _on_change(self, changes: ChangeSet) -> None:
+        with self._pending_lock:
+            for table in changes.tables & set(self.sources):
+                if table in changes.bulk:
+                    self._pending[table] = None  # ids unknown: reload the whole table
+                elif self._pending.get(table, set()) is not None:
+                    self._pending.setdefault(table, set()).update(changes.ids(table))
+        self._wake.set()
+
+    def apply_pending(self) -> None:
+        """Reload the rows queued by recent commits."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        db = SessionLocal()
+        try:
+            for table, ids in pending.items():
+                source = self.sources[table]
+                if ids is None:
+                    self.index.clear(source.type)
+                for row_id, doc in source.load(db, ids):
+                    if doc is None:
+                        self.index.remove((source.type, row_id))
+                    else:
+                        self.index.add(doc)
+            self.updates += 1
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.apply_pending()
+            except Exception:
+                self.failures += 1
+                logger.exception("Updating the search index failed")
+
+    def start(self) -> None:
+        """Build the index and start applying commits in the background."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        try:
+            self.build()
+        except Exception:
+            self.failures += 1
+            logger.exception("Building the search index failed")
+        self._thread = threading.Thread(target=self._run, name="site-search", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            **self.index.stats(),
+            "build_seconds": round(self.build_seconds, 4),
+            "updates": self.updates,
+            "failures": self.failures,
+            "pending_tables": sorted(self._pending),
+        }
+
+
+site_search = SiteSearch()
@@ -0,0 +1,143 @@
+"""
+Startup cache warm-up.
+
+Replays the hot read requests (the ones every SSR render makes, then the
+detail pages of published content) through the application itself, so the
+response caches, SWR caches, precompressed variants and the database's own
+page cache are populated before the first real visitor arrives. Bounded by a
+time budget; whatever does not fit is left to warm on demand.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Iterator, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message
+
+from app.core.compression import SUPPORTED_ENCODINGS
+from app.core.config import settings
+from app.crud import sitemap as crud_sitemap
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Shared by (nearly) every page render, in priority order
+HOT_PATHS = (
+    "/site-settings",
+    "/google-reviews",
+    "/pages/home",
+    "/content/home",
+    "/treks?limit=100&status=published",
+    "/treks/featured?limit=6",
+    "/expeditions?status=published&limit=20",
+    "/expeditions/featured?limit=4",
+    "/blog/posts/featured?limit=4",
+    "/blog/posts/recent?limit=5",
+    "/blog/categories/tree",
+)
+
+# Detail routes per sitemap content type
+DETAIL_PATHS = {
+    "trek": ("/pages/trek/{slug}", "/treks/{slug}"),
+    "expedition": ("/expeditions/{slug}",),
+    "blog": ("/blog/posts/{slug}",),
+}
+
+# Most recent report, exposed by /health/cache
+last_report: Optional[Dict[str, object]] = None
+
+
+def _published_slugs() -> List[tuple]:
+    db = SessionLocal()
+    try:
+        return [(t, slug) for t, slug, _ in crud_sitemap.iter_entries(db)]
+    finally:
+        db.close()
+
+
+def _detail_paths(entries: List[tuple]) -> Iterator[str]:
+    for content_type, slug in entries:
+        for template in DETAIL_PATHS.get(content_type, ()):
+            yield template.format(slug=slug)
+
+
+async def _get(app: ASGIApp, url: str) -> int:
+    """Issue an in-process GET through the full middleware stack; returns the status code."""
+    path, _, query = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", b"warmup"),
+            (b"accept-encoding", SUPPORTED_ENCODINGS[0].encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def warm_up(app: ASGIApp, budget: float) -> Dict[str, object]:
+    """
+    Prefetch the hot working set within ``budget`` seconds.
+
+    Returns a report with the number of responses warmed, failures, paths
+    skipped for lack of time, and the elapsed seconds.
+    """
+    global last_report
+    started = time.perf_counter()
+    deadline = started + budget
+    warmed = failed = 0
+    paths: List[str] = list(HOT_PATHS)
+    try:
+        paths += list(_detail_paths(await run_in_threadpool(_published_slugs)))
+    except Exception:
+        logger.exception("Cache warm-up could not list published content")
+
+    done = 0
+    for path in paths:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        done += 1
+        try:
+            status = await asyncio.wait_for(_get(app, settings.API_V1_PREFIX + path), timeout=remaining)
+        except asyncio.TimeoutError:
+            done -= 1  # cut off by the budget: report it as skipped
+            break
+        except Exception:
+            logger.exception("Cache warm-up request %s failed", path)
+            failed += 1
+            continue
+        if 200 <= status < 300:
+            warmed += 1
+        else:
+            failed += 1
+
+    last_report = {
+        "warmed": warmed,
+        "failed": failed,
+        "skipped": len(paths) - done,
+        "seconds": round(time.perf_counter() - started, 3),
+        "budget": budget,
+    }
+    return last_report
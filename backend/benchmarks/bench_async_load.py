@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Load test: sync vs. async database stack under sustained concurrency.
+
+Serves the trek list page and trek detail reads through both stacks from a
+uvicorn server and drives them with many concurrent keep-alive clients
+(default 200) for a fixed time, reporting sustained throughput and latency
+percentiles:
+
+- ``sync``: ``def`` handlers on a ``Session`` (the old public endpoints). Each
+  request holds one of Starlette's threadpool workers (40 by default) while it
+  waits on the database.
+- ``async``: ``async def`` handlers on an ``AsyncSession`` and the async CRUD
+  classes (the public endpoints now). A waiting request only holds a pooled
+  connection.
+
+Both run the same queries (validators + page, validators + detail) with the
+same connection pool size and response caches off. A local SQLite file answers
+in microseconds, which hides what the async stack is for: waiting on a remote
+MySQL. ``--db-latency`` adds that round trip to every statement, spent inside
+the driver call (a SQL function that sleeps), so it blocks a threadpool worker
+on the sync stack and only the connection on the async one.
+
+The load generator runs on the same machine; give the server spare cores or
+the numbers measure CPU contention rather than the stacks.
+
+Usage (from backend/):
+    python benchmarks/bench_async_load.py [--clients 200] [--duration 20] [--db-latency 20] [--pool-size 100]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if "--serve" not in sys.argv:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='bench-async-')}/bench.db"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.responses import FastJSONResponse, serialize_page  # noqa: E402
+from app.crud.trek import trek_async_crud, trek_crud  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import ItineraryDay, Trek, TrekFAQ, TrekImage  # noqa: E402
+from app.models.trek import TrekDetailResponse, TrekListResponse  # noqa: E402
+
+PAGE_SIZE = 10
+MODES = ("sync", "async")
+
+
+# ============================================
+# Server
+# ============================================
+
+def add_latency(engine, latency_ms: float) -> None:
+    """Make every statement wait ``latency_ms`` inside the driver before it runs."""
+    if not latency_ms:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function("bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _round_trip(conn, cursor, statement, parameters, context, executemany):
+        cursor.execute("SELECT bench_sleep(?)", (latency_ms,))
+
+
+def build_app(pool_size: int, latency_ms: float) -> FastAPI:
+    sync_engine = create_engine(
+        settings.DATABASE_URL, pool_size=pool_size, max_overflow=0, connect_args={"check_same_thread": False}
+    )
+    async_engine = create_async_engine(settings.async_database_url, pool_size=pool_size, max_overflow=0)
+    add_latency(sync_engine, latency_ms)
+    add_latency(async_engine.sync_engine, latency_ms)
+    sync_sessions = sessionmaker(bind=sync_engine, autoflush=False)
+    async_sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def sync_db():
+        db = sync_sessions()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def async_db():
+        async with async_sessions() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {}
+
+    @app.get("/sync/treks")
+    def sync_list(skip: int = 0, db: Session = Depends(sync_db)):
+        trek_crud.get_validators(db)
+        treks, total = trek_crud.get_page_with_filters(db, skip=skip, limit=PAGE_SIZE)
+        return FastJSONResponse(serialize_page(treks, TrekListResponse, total=total, skip=skip, limit=PAGE_SIZE))
+
+    @app.get("/async/treks")
+    async def async_list(skip: int = 0, db: AsyncSession = Depends(async_db)):
+        await trek_async_crud.get_validators(db)
+        treks, total = await trek_async_crud.get_page_with_filters(db, skip=skip, limit=PAGE_SIZE)
+        return FastJSONResponse(serialize_page(treks, TrekListResponse, total=total, skip=skip, limit=PAGE_SIZE))
+
+    @app.get("/sync/treks/{slug}")
+    def sync_detail(slug: str, db: Session = Depends(sync_db)):
+        trek_crud.get_detail_validators(db, slug)
+        trek = trek_crud.get_by_slug_with_details(db, slug)
+        if not trek:
+            raise HTTPException(status_code=404)
+        return FastJSONResponse(TrekDetailResponse.model_validate(trek))
+
+    @app.get("/async/treks/{slug}")
+    async def async_detail(slug: str, db: AsyncSession = Depends(async_db)):
+        await trek_async_crud.get_detail_validators(db, slug)
+        trek = await trek_async_crud.get_by_slug_with_details(db, slug)
+        if not trek:
+            raise HTTPException(status_code=404)
+        return FastJSONResponse(TrekDetailResponse.model_validate(trek))
+
+    return app
+
+
+def serve(port: int, pool_size: int, latency_ms: float) -> None:
+    import uvicorn
+
+    uvicorn.run(build_app(pool_size, latency_ms), host="127.0.0.1", port=port, log_level="error", access_log=False)
+
+
+# ============================================
+# Load generator
+# ============================================
+
+def seed(treks: int) -> List[str]:
+    engine = create_engine(settings.DATABASE_URL)
+    Base.metadata.create_all(engine)
+    slugs = [f"bench-trek-{i}" for i in range(treks)]
+    with Session(engine) as db:
+        for i, slug in enumerate(slugs):
+            db.add(Trek(
+                name=f"Bench Trek {i}", slug=slug, description="A long walk. " * 20, short_description="A walk",
+                duration=5 + i % 10, price=10000 + i * 50, status="published", location="Uttarakhand",
+                best_season=["May", "June"],
+                itinerary=[ItineraryDay(day=d, title=f"Day {d}", description="Walk. " * 15) for d in range(1, 7)],
+                images=[TrekImage(url=f"/img/{i}-{n}.jpg", display_order=n) for n in range(4)],
+                faqs=[TrekFAQ(question=f"Question {n}?", answer="Answer. " * 10, display_order=n) for n in range(5)],
+            ))
+        db.commit()
+    engine.dispose()
+    return slugs
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, int]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", str(port),
+         "--pool-size", str(args.pool_size), "--db-latency", str(args.db_latency)],
+        env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/ping", timeout=1)
+            return process, port
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("benchmark server did not start")
+
+
+async def fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str) -> int:
+    """One GET on a keep-alive connection; returns the status code."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            await reader.readexactly(int(line.split(b":", 1)[1]))
+    return status
+
+
+async def drive(port: int, paths: List[str], clients: int, warmup: float, duration: float) -> dict:
+    """
+    ``clients`` closed-loop clients, one keep-alive connection each, requesting
+    ``paths`` round-robin; only requests sent after the warm-up count. A bare
+    HTTP/1.1 client keeps the load generator's own CPU use low.
+    """
+    latencies: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+
+    async def client_loop(offset: int) -> None:
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        n = offset
+        try:
+            while True:
+                sent = time.perf_counter()
+                if sent >= stop_at:
+                    return
+                try:
+                    ok = await fetch(reader, writer, paths[n % len(paths)]) == 200
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    ok = False
+                    writer.close()
+                    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                n += 1
+                if sent >= measure_from:
+                    latencies.append(time.perf_counter() - sent)
+                    errors += not ok
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(client_loop(i * 7) for i in range(clients)))
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": latencies[-1] * 1000 if latencies else 0.0,
+        "mean": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds per stack")
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--db-latency", type=float, default=20.0, help="simulated ms per statement (0 = none)")
+    parser.add_argument("--pool-size", type=int, default=100, help="connections per stack")
+    parser.add_argument("--treks", type=int, default=200)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.pool_size, args.db_latency)
+        return
+
+    slugs = seed(args.treks)
+    rng = random.Random(7)
+    print(f"{args.treks} treks, {args.clients} clients, {args.duration:g}s per stack, "
+          f"{args.db_latency:g} ms per statement, pool {args.pool_size}")
+    print(f"  {'stack':<7}{'requests':>10}{'req/s':>9}{'mean ms':>9}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'errors':>8}")
+    for mode in MODES:
+        # Half list pages, half detail pages, in a fixed shuffled order
+        paths = [f"/{mode}/treks?skip={PAGE_SIZE * rng.randrange(args.treks // PAGE_SIZE)}" for _ in range(500)]
+        paths += [f"/{mode}/treks/{rng.choice(slugs)}" for _ in range(500)]
+        random.Random(11).shuffle(paths)
+        process, port = start_server(args)
+        try:
+            result = asyncio.run(drive(port, paths, args.clients, args.warmup, args.duration))
+        finally:
+            process.terminate()
+            process.wait()
+        print(
+            f"  {mode:<7}{result['requests']:>10}{result['rps']:>9.0f}{result['mean']:>9.1f}{result['p50']:>8.1f}"
+            f"{result['p95']:>8.1f}{result['p99']:>8.1f}{result['max']:>8.1f}{result['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: blog search via ILIKE scan vs. the full-text index.
+
+Generates a corpus of blog posts (default 10k) in a throwaway SQLite database
+and runs the same search terms through ``blog_crud.get_multi_with_author`` +
+``get_count`` (one results page plus the total, as GET /blog/posts does):
+
+- ``ilike``: the index table is reported unavailable, so the old
+  ``title ILIKE '%q%' OR content ILIKE '%q%'`` scan runs.
+- ``fts``: the query joins the FTS5 ``bm25`` ranking subquery.
+
+Usage (from backend/):
+    python benchmarks/bench_blog_search.py [--posts 10000] [--rounds 5]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+_tmpdir = tempfile.mkdtemp(prefix="bench-search-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from app.crud import blog_search  # noqa: E402
+from app.crud.blog import blog_crud  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import BlogAuthor, BlogPost  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+
+TOPIC_WORDS = (
+    "trek summit valley glacier himalaya ridge camp monsoon meadow pass lake "
+    "forest village trail altitude acclimatization snow river temple sunrise "
+    "porter guide permit kit boots layers tent stove route descent ascent base"
+).split()
+SYLLABLES = ("ka", "ri", "to", "man", "sel", "ver", "dun", "pa", "lo", "gir", "sha", "ne", "tur", "bo")
+QUERIES = ("kedarkantha", "glacier lake", "sunrise summit", "acclim", "monsoon trail guide")
+
+
+def vocabulary(rng: random.Random, size: int = 5000) -> tuple:
+    """Zipf-weighted vocabulary: filler words with the topic words spread through the ranks."""
+    words = list({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(size * 2)})[:size]
+    for i, word in enumerate(TOPIC_WORDS):
+        words.insert(20 + i * 40, word)
+    return words, list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+
+
+def paragraph(rng: random.Random, vocab: tuple, words: int) -> str:
+    return " ".join(rng.choices(vocab[0], cum_weights=vocab[1], k=words))
+
+
+def seed(posts: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    blog_search.ensure_index(engine)
+    rng = random.Random(42)
+    vocab = vocabulary(rng)
+    db = SessionLocal()
+    try:
+        author = BlogAuthor(name="Bench Author")
+        db.add(author)
+        db.flush()
+        for i in range(posts):
+            title = f"{paragraph(rng, vocab, 5).title()} {i}"
+            if i % 500 == 0:
+                title += " Kedarkantha"
+            db.add(BlogPost(
+                title=title,
+                slug=f"bench-post-{i}",
+                excerpt=paragraph(rng, vocab, 25),
+                content="".join(f"<p>{paragraph(rng, vocab, 60)}</p>" for _ in range(8)),
+                author_id=author.id,
+                status="published",
+            ))
+            if i % 1000 == 999:
+                db.commit()
+        db.commit()
+    finally:
+        db.close()
+
+
+def search(q: str) -> tuple:
+    db = SessionLocal()
+    try:
+        posts = blog_crud.get_multi_with_author(db, limit=20, status="published", search=q)
+        total = blog_crud.get_count(db, filters={"status": "published", "search": q})
+        return [p.id for p in posts], total
+    finally:
+        db.close()
+
+
+def run(rounds: int) -> dict:
+    timings = {}
+    for q in QUERIES:
+        search(q)  # warm-up
+        started = time.perf_counter()
+        for _ in range(rounds):
+            ids, total = search(q)
+        timings[q] = ((time.perf_counter() - started) / rounds * 1000, total)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    seed(args.posts)
+    print(f"seeded {args.posts} posts (indexed on insert) in {time.perf_counter() - started:.1f}s")
+
+    key = str(engine.url)
+    blog_search._available[key] = False
+    ilike = run(args.rounds)
+    blog_search._available[key] = True
+    fts = run(args.rounds)
+
+    print(f"page of 20 + total, mean of {args.rounds} rounds")
+    print(f"  {'query':<22}{'ILIKE ms':>10}{'hits':>7}{'FTS ms':>10}{'hits':>7}{'speedup':>9}")
+    for q in QUERIES:
+        (slow, slow_total), (fast, fast_total) = ilike[q], fts[q]
+        print(f"  {q:<22}{slow:>10.1f}{slow_total:>7}{fast:>10.1f}{fast_total:>7}{slow / fast:>8.1f}x")
+    print("(hit counts differ: ILIKE matches the whole query as one substring, FTS matches all terms in any order)")
+
+
+if __name__ == "__main__":
+    main()
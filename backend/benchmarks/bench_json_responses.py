@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: default FastAPI response path vs. the orjson fast path.
+
+Serves the same 100-item trek page two ways from a throwaway SQLite database:
+
+- ``default``: handler returns ``PaginatedResponse[TrekListResponse]`` and FastAPI
+  re-validates it against ``response_model`` and encodes it with ``jsonable_encoder``
+  + stdlib json (how the list endpoints worked before).
+- ``fast``: handler returns ``rows_response(...)`` (validate once, encode with orjson).
+
+Usage (from backend/):
+    python benchmarks/bench_json_responses.py [--requests 500] [--items 100]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+_tmpdir = tempfile.mkdtemp(prefix="bench-json-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.deps import get_db  # noqa: E402
+from app.core.responses import orjson, rows_response  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import Trek  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.common import PaginatedResponse  # noqa: E402
+from app.models.trek import TrekListResponse  # noqa: E402
+
+
+def seed(items: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        for i in range(items):
+            db.add(Trek(
+                name=f"Benchmark Trek {i}",
+                slug=f"benchmark-trek-{i}",
+                description="A long description of the trek. " * 20,
+                short_description="Short description for the listing card.",
+                difficulty="moderate",
+                duration=5 + i % 10,
+                max_altitude=3000 + i,
+                price=8000 + i * 100,
+                status="published",
+                location="Uttarakhand",
+                best_season=["April", "May", "June", "September", "October"],
+                rating=4.5,
+                review_count=10 + i,
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def build_app(items: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=PaginatedResponse[TrekListResponse])
+    def default_path(db: Session = Depends(get_db)):
+        treks = db.query(Trek).limit(items).all()
+        return PaginatedResponse(
+            items=[TrekListResponse.model_validate(t) for t in treks],
+            total=len(treks),
+            skip=0,
+            limit=items,
+        )
+
+    @app.get("/fast", response_model=PaginatedResponse[TrekListResponse])
+    def fast_path(db: Session = Depends(get_db)):
+        treks = db.query(Trek).limit(items).all()
+        return rows_response(treks, TrekListResponse, total=len(treks), skip=0, limit=items)
+
+    return app
+
+
+def run(client: TestClient, path: str, requests: int) -> float:
+    for _ in range(20):  # warm-up
+        client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+        assert response.status_code == 200
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+
+    seed(args.items)
+    client = TestClient(build_app(args.items))
+    assert client.get("/default").json() == client.get("/fast").json(), "payloads differ"
+
+    print(f"encoder: {'orjson ' + orjson.__version__ if orjson else 'pydantic-core (orjson not installed)'}")
+    print(f"{args.items}-item page, {args.requests} sequential requests (in-process client)")
+    baseline = run(client, "/default", args.requests)
+    fast = run(client, "/fast", args.requests)
+    print(f"  default response_model path: {baseline:8.1f} req/s")
+    print(f"  orjson fast path:            {fast:8.1f} req/s  ({fast / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
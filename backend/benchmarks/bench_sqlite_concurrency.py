@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent reads and writes on SQLite, untuned vs. tuned.
+
+Reader threads page through the trek list (``trek_crud.get_page_with_filters``
+plus the total, as GET /treks does) while writer threads insert leads, one
+commit each, against a throwaway database file for a fixed time:
+
+- ``default``: the old engine - rollback journal, ``synchronous=FULL``, the
+  driver's 5 s lock timeout and SQLAlchemy's default pool (5 + 10).
+- ``tuned``: ``make_engine`` with the app/db/sqlite.py profile - WAL,
+  ``synchronous=NORMAL``, ``busy_timeout``, page cache, mmap, in-memory temp
+  store and a pool sized from settings.
+
+Each mode gets a fresh copy of the same seeded file. Reports reads and writes
+per second, write latency percentiles and "database is locked" failures.
+
+Usage (from backend/):
+    python benchmarks/bench_sqlite_concurrency.py [--readers 16] [--writers 4] [--duration 10]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+_tmpdir = tempfile.mkdtemp(prefix="bench-sqlite-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/seed.db"
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.crud.trek import trek_crud  # noqa: E402
+from app.db import sqlite  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import ItineraryDay, Lead, Trek  # noqa: E402
+from app.db.session import make_engine  # noqa: E402
+
+PAGE_SIZE = 10
+MODES = ("default", "tuned")
+
+
+def seed(path: str, treks: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        for i in range(treks):
+            db.add(Trek(
+                name=f"Bench Trek {i}", slug=f"bench-trek-{i}", description="A long walk. " * 20,
+                short_description="A walk", duration=5 + i % 10, price=10000 + i * 50, status="published",
+                location="Uttarakhand", best_season=["May", "June"],
+                itinerary=[ItineraryDay(day=d, title=f"Day {d}", description="Walk. " * 15) for d in range(1, 4)],
+            ))
+        db.commit()
+    engine.dispose()
+
+
+def build_engine(mode: str, url: str):
+    if mode == "default":
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return make_engine(url)
+
+
+def run(mode: str, path: str, args: argparse.Namespace) -> Dict[str, float]:
+    engine = build_engine(mode, f"sqlite:///{path}")
+    sessions = sessionmaker(bind=engine, autoflush=False)
+    stop_at = time.perf_counter() + args.duration
+    reads = [0] * args.readers
+    write_latencies: List[List[float]] = [[] for _ in range(args.writers)]
+    locked = [0]
+    lock = threading.Lock()
+
+    def reader(n: int) -> None:
+        skip = n * PAGE_SIZE
+        while time.perf_counter() < stop_at:
+            db = sessions()
+            try:
+                trek_crud.get_page_with_filters(db, skip=skip % args.treks, limit=PAGE_SIZE)
+                reads[n] += 1
+            except OperationalError:
+                with lock:
+                    locked[0] += 1
+            finally:
+                db.close()
+            skip += PAGE_SIZE
+
+    def writer(n: int) -> None:
+        i = 0
+        while time.perf_counter() < stop_at:
+            db = sessions()
+            started = time.perf_counter()
+            try:
+                db.add(Lead(name=f"Writer {n}", whatsapp="9999999999", trek_slug=f"bench-trek-{i % args.treks}"))
+                db.commit()
+                write_latencies[n].append(time.perf_counter() - started)
+            except OperationalError:
+                db.rollback()
+                with lock:
+                    locked[0] += 1
+            finally:
+                db.close()
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    latencies = sorted(latency for per_writer in write_latencies for latency in per_writer)
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "reads": sum(reads) / args.duration,
+        "writes": len(latencies) / args.duration,
+        "p50": percentile(0.50),
+        "p99": percentile(0.99),
+        "locked": locked[0],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--treks", type=int, default=200)
+    args = parser.parse_args()
+
+    seed_path = os.path.join(_tmpdir, "seed.db")
+    seed(seed_path, args.treks)
+    print(f"{args.treks} treks, {args.readers} readers, {args.writers} writers, {args.duration:g}s per mode")
+    print(f"  tuned profile: {dict(sqlite.pragmas())}")
+    print(f"  {'mode':<9}{'reads/s':>9}{'writes/s':>10}{'write p50':>11}{'write p99':>11}{'locked':>8}")
+    for mode in MODES:
+        path = os.path.join(_tmpdir, f"{mode}.db")
+        shutil.copyfile(seed_path, path)
+        result = run(mode, path, args)
+        print(
+            f"  {mode:<9}{result['reads']:>9.0f}{result['writes']:>10.0f}{result['p50']:>9.1f}ms"
+            f"{result['p99']:>9.1f}ms{result['locked']:>8}"
+        )
+    shutil.rmtree(_tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: trek detail loading strategies.
+
+Seeds a throwaway SQLite database with filler treks plus one heavily populated
+trek (default 20 itinerary days, 10 images, 15 FAQs, 12 batches) and loads it
+with ``trek_crud.get_by_slug_with_details`` and TrekDetailResponse, as
+GET /treks/{slug} does, under each load strategy:
+
+- ``joined``: one statement joining every collection - the result is their
+  cartesian product, de-duplicated by the ORM;
+- ``selectin``: the trek (with its guide) plus one ``IN`` query per collection;
+- ``subquery``: like selectin, with the trek query repeated as a subquery.
+
+Rows transferred counts the rows every SELECT returned to the driver.
+
+Usage (from backend/):
+    python benchmarks/bench_trek_detail_loading.py [--days 20] [--images 10] [--faqs 15] [--batches 12] [--rounds 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+_tmpdir = tempfile.mkdtemp(prefix="bench-detail-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from sqlalchemy import event  # noqa: E402
+
+from app.crud.base import LOADERS  # noqa: E402
+from app.crud.trek import trek_crud  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import Guide, ItineraryDay, Trek, TrekBatch, TrekFAQ, TrekImage  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.trek import TrekDetailResponse  # noqa: E402
+
+SLUG = "heavy-trek"
+FILLER_TREKS = 200
+FILLER_CHILDREN = 5
+
+
+def add_trek(db, slug: str, guide_id: int, days: int, images: int, faqs: int, batches: int) -> None:
+    trek = Trek(
+        name=slug.replace("-", " ").title(), slug=slug, description="Trek description. " * 40,
+        difficulty="moderate", duration=days, max_altitude=4500, price=12000, status="published",
+        location="Uttarakhand", best_season=["March", "April", "October"], guide_id=guide_id,
+    )
+    trek.itinerary = [
+        ItineraryDay(day=d + 1, title=f"Day {d + 1}", description="Walk through the forest to camp. " * 12,
+                     elevation_gain=400, distance=8.5, accommodation="Tents", meals="B, L, D",
+                     highlights=["Sunrise", "Meadow"])
+        for d in range(days)
+    ]
+    trek.images = [TrekImage(url=f"https://img.example.com/{slug}/{i}.jpg", caption=f"View {i}", display_order=i)
+                   for i in range(images)]
+    trek.faqs = [TrekFAQ(question=f"Question {i}?", answer="A detailed answer. " * 10, display_order=i)
+                 for i in range(faqs)]
+    start = date(2027, 1, 5)
+    trek.batches = [TrekBatch(start_date=start + timedelta(weeks=2 * i), end_date=start + timedelta(weeks=2 * i, days=days),
+                              total_seats=20)
+                    for i in range(batches)]
+    db.add(trek)
+
+
+def seed(args) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        guide = Guide(name="Bench Guide", bio="Guide bio.", experience_years=10,
+                      profile_image_url="https://img.example.com/guide.jpg", specializations=["Treks"])
+        db.add(guide)
+        db.flush()
+        for i in range(FILLER_TREKS):
+            n = FILLER_CHILDREN
+            add_trek(db, f"filler-trek-{i}", guide.id, n, n, n, n)
+        add_trek(db, SLUG, guide.id, args.days, args.images, args.faqs, args.batches)
+        db.commit()
+    finally:
+        db.close()
+
+
+def load(strategy: str) -> TrekDetailResponse:
+    db = SessionLocal()
+    try:
+        return TrekDetailResponse.model_validate(trek_crud.get_by_slug_with_details(db, SLUG, strategy=strategy))
+    finally:
+        db.close()
+
+
+def rows_transferred(strategy: str) -> tuple:
+    """(statements, rows) the SELECTs of one load return, replayed after recording them."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        load(strategy)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    with engine.connect() as conn:
+        rows = sum(len(conn.exec_driver_sql(statement, parameters).all()) for statement, parameters in statements)
+    return len(statements), rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--images", type=int, default=10)
+    parser.add_argument("--faqs", type=int, default=15)
+    parser.add_argument("--batches", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    seed(args)
+    print(f"trek with {args.days} days, {args.images} images, {args.faqs} FAQs, {args.batches} batches "
+          f"(+{FILLER_TREKS} filler treks)")
+
+    reference = None
+    print(f"  {'strategy':<10}{'queries':>9}{'rows':>9}{'mean ms':>10}")
+    for strategy in LOADERS:
+        detail = load(strategy)  # warm-up
+        if reference is None:
+            reference = detail
+        assert detail == reference, f"{strategy} loaded a different trek detail"
+        queries, rows = rows_transferred(strategy)
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            load(strategy)
+        elapsed = (time.perf_counter() - started) / args.rounds * 1000
+        print(f"  {strategy:<10}{queries:>9}{rows:>9}{elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Shared pytest fixtures.
+
+Tests run against ``TEST_DATABASE_URL`` (default: a throwaway SQLite file) with
+the schema created from the models, so they see the same tables and indexes
+as a fresh ``create_all()`` deployment.
+
+Endpoint tests use ``client``: the app runs on its own throwaway SQLite
+database, and data is written with ``app_db`` whose commits are real, so the
+commit listeners (cache invalidation, search index updates) fire as in production.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+# N+1 detection on for the app under test (read when settings load)
+os.environ.setdefault("QUERY_N_PLUS_ONE_DETECTION", "true")
+# The app under test never touches a configured database
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='app-tests-')}/app.db"
+
+import app.db.models  # noqa: E402,F401 - registers every table on Base.metadata
+from app.core import query_stats  # noqa: E402
+from app.db.base import Base  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def engine(tmp_path_factory):
+    url = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}"
+    engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        # pysqlite defers BEGIN and mishandles SAVEPOINT; let SQLAlchemy emit both
+        @event.listens_for(engine, "connect")
+        def _autocommit_driver(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine) -> Session:
+    """
+    A session whose work is rolled back after the test, including anything the
+    code under test commits (commits only release a savepoint).
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")()
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def max_queries():
+    """
+    ``with max_queries(3) as stats:`` fails the test if the block runs more than
+    3 SQL statements, listing what ran; ``stats.repeated()`` shows N+1 patterns.
+    """
+    @contextmanager
+    def check(limit: int):
+        with query_stats.capture() as stats:
+            yield stats
+        assert stats.count <= limit, f"expected at most {limit} queries, got {stats.summary()}"
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def app_engine():
+    """The app's own engine, with the schema and the blog search index created."""
+    import app.main  # noqa: F401 - registers the tables only the routes import
+    from app.crud import blog_search
+    from app.db.session import engine
+
+    Base.metadata.create_all(engine)
+    blog_search.ensure_index(engine)
+    return engine
+
+
+@pytest.fixture
+def app_db(app_engine) -> Session:
+    """
+    A session on the app's database. Commits are real and notify the commit
+    listeners; rows persist across tests, so give them unique slugs.
+    """
+    from app.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(app_engine) -> TestClient:
+    """A client for the app (startup hooks not run), with every cache emptied."""
+    from app.core import cache
+    from app.main import app
+
+    for registered in cache._registry.values():
+        registered.clear()
+    return TestClient(app)
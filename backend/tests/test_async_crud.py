@@ -0,0 +1,117 @@
+"""
+The async CRUD variants return what their sync counterparts return.
+
+Runs on its own SQLite file: an AsyncSession cannot join the rolled-back
+connection of the ``db`` fixture.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.crud.blog import blog_async_crud, blog_crud
+from app.crud.expedition import expedition_async_crud
+from app.crud.trek import trek_async_crud, trek_crud
+from app.db.base import Base
+from app.db.models import BlogAuthor, BlogPost, BlogTag, Expedition, ExpeditionDay, ItineraryDay, Trek, TrekFAQ
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        for i in range(5):
+            trek = Trek(
+                name=f"Trek {i}", slug=f"trek-{i}", description="", duration=i + 1, price=100 * (i + 1),
+                status="published", featured=i % 2 == 0, best_season=["May"] if i < 3 else ["October"],
+            )
+            trek.itinerary = [ItineraryDay(day=d, title=f"Day {d}", description="") for d in (1, 2)]
+            trek.faqs = [TrekFAQ(question="Q", answer="A")]
+            db.add(trek)
+        expedition = Expedition(
+            name="Peak", slug="peak", difficulty="expert", duration=20, summit_altitude=1, base_altitude=1,
+            location="", region="", description="", short_description="", highlights=[], requirements=[],
+            equipment=[], price=5000, group_size_min=1, group_size_max=1, season=[], image="", status="published",
+            itinerary=[ExpeditionDay(day=1, title="Base camp", description="", altitude=1, activities=[])],
+        )
+        db.add(expedition)
+        author = BlogAuthor(name="Author")
+        tags = [BlogTag(name="Snow", slug="snow"), BlogTag(name="Gear", slug="gear")]
+        for i in range(3):
+            db.add(BlogPost(
+                title=f"Post {i}", slug=f"post-{i}", content="", status="published",
+                author=author, tags_rel=tags[: i + 1] if i < 2 else [],
+            ))
+        db.commit()
+    engine.dispose()
+
+    sync_engine = create_engine(f"sqlite:///{path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    yield sync_engine, async_sessionmaker(async_engine, expire_on_commit=False)
+    sync_engine.dispose()
+    asyncio.run(async_engine.dispose())
+
+
+def run(sessions, fn):
+    async def main():
+        async with sessions() as db:
+            return await fn(db)
+
+    return asyncio.run(main())
+
+
+def test_trek_reads_match_sync(database):
+    engine, sessions = database
+    with Session(engine) as db:
+        treks, total = trek_crud.get_page_with_filters(db, limit=2, sort="price_desc", season="May")
+        expected_page = ([t.id for t in treks], total)
+        expected_validators = trek_crud.get_detail_validators(db, "trek-1")
+
+    async def reads(db):
+        treks, total = await trek_async_crud.get_page_with_filters(db, limit=2, sort="price_desc", season="May")
+        detail = await trek_async_crud.get_by_slug_with_details(db, "trek-1")
+        # Eagerly loaded collections are readable without a lazy load
+        return (
+            ([t.id for t in treks], total),
+            await trek_async_crud.get_detail_validators(db, "trek-1"),
+            [day.day for day in detail.itinerary],
+            len(detail.faqs),
+            await trek_async_crud.get_by_slug_with_details(db, "missing"),
+        )
+
+    page, validators, days, faqs, missing = run(sessions, reads)
+    assert page == expected_page == ([3, 2], 3)
+    assert validators == expected_validators
+    assert days == [1, 2]
+    assert faqs == 1
+    assert missing is None
+
+
+@pytest.mark.parametrize("strategy", ["selectin", "joined", "subquery"])
+def test_detail_loaders_under_every_strategy(database, strategy):
+    _, sessions = database
+
+    async def reads(db):
+        trek = await trek_async_crud.get_with_details(db, 1, strategy=strategy)
+        expedition = await expedition_async_crud.get_by_slug_with_details(db, "peak", strategy=strategy)
+        post = await blog_async_crud.get_by_slug_with_author(db, "post-1", strategy=strategy)
+        return len(trek.itinerary), len(expedition.itinerary), post.author.name, sorted(t.slug for t in post.tags_rel)
+
+    assert run(sessions, reads) == (2, 1, "Author", ["gear", "snow"])
+
+
+def test_blog_list_matches_sync(database):
+    engine, sessions = database
+    with Session(engine) as db:
+        posts, total = blog_crud.get_page_with_author(db, limit=2)
+        expected = ([p.id for p in posts], total, [[t.slug for t in p.tags_rel] for p in posts])
+
+    async def reads(db):
+        posts, total = await blog_async_crud.get_page_with_author(db, limit=2)
+        return [p.id for p in posts], total, [[t.slug for t in p.tags_rel] for p in posts]
+
+    assert run(sessions, reads) == expected
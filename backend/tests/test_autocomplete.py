@@ -0,0 +1,52 @@
+"""
+Typeahead: any word of a name or location matches as a prefix, most popular
+first, and published changes show up after the commit.
+"""
+from sqlalchemy.orm import Session
+
+from app.db.models import Trek
+from app.services.autocomplete import PrefixTrie, Suggestion
+
+
+def suggestion(id: int, label: str, reviews: int) -> Suggestion:
+    return Suggestion("trek", id, f"trek-{id}", label, "", (reviews, 0.0, False, id))
+
+
+def test_trie_matches_word_prefixes_by_popularity():
+    hampta = suggestion(1, "Hampta Pass", 10)
+    kuari = suggestion(2, "Kuari Pass", 50)
+    hamlet = suggestion(3, "Hamlet Walk", 5)
+    trie = PrefixTrie([(hampta, ("Hampta Pass",)), (kuari, ("Kuari Pass",)), (hamlet, ("Hamlet Walk", "Hémis"))])
+
+    assert trie.lookup("pas") == [kuari, hampta]
+    assert trie.lookup("ham") == [hampta, hamlet]
+    assert trie.lookup("hampta p") == [hampta]
+    assert trie.lookup("hemis") == [hamlet]  # accents are folded (queries are normalized by the caller)
+    assert trie.lookup("xyz") == []
+    assert trie.lookup("") == [kuari, hampta, hamlet]
+
+
+def test_suggestions_follow_published_changes(client, app_db: Session):
+    def labels(q: str) -> list:
+        response = client.get("/api/v1/autocomplete", params={"q": q, "types": "trek"})
+        assert response.status_code == 200
+        return [item["label"] for item in response.json()["items"]]
+
+    assert labels("Wuxiling") == []
+    trek = Trek(
+        name="Wuxiling Ridge", slug="typeahead-ridge", description="", duration=1, price=1, status="published",
+        location="Sikkim",
+    )
+    app_db.add(trek)
+    app_db.add(Trek(
+        name="Wuxiling Lakes", slug="typeahead-lakes", description="", duration=1, price=1, status="published",
+        review_count=40,
+    ))
+    app_db.commit()
+    assert labels("wuxi") == ["Wuxiling Lakes", "Wuxiling Ridge"]
+    assert labels("ridge") == ["Wuxiling Ridge"]
+
+    trek.status = "draft"
+    app_db.commit()
+    assert labels("wuxi") == ["Wuxiling Lakes"]
+    assert client.get("/api/v1/autocomplete", params={"q": "w", "types": "nope"}).status_code == 400
@@ -0,0 +1,73 @@
+"""
+Materialized blog category and tag post counts follow post writes.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud import blog_counts
+from app.crud.blog import blog_category_crud
+from app.db.models import BlogAuthor, BlogCategory, BlogPost, BlogTag
+
+
+def setup_blog(db: Session):
+    author = BlogAuthor(name="Count Author")
+    news, guides = BlogCategory(name="News", slug="count-news"), BlogCategory(name="Guides", slug="count-guides")
+    snow, gear = BlogTag(name="Snow", slug="count-snow"), BlogTag(name="Gear", slug="count-gear")
+    db.add_all([author, news, guides, snow, gear])
+    db.flush()
+    return author, news, guides, snow, gear
+
+
+def add_post(db: Session, author, slug: str, category=None, tags=()) -> BlogPost:
+    post = BlogPost(title=slug, slug=slug, content="", author_id=author.id, category_rel=category, tags_rel=list(tags))
+    db.add(post)
+    db.flush()
+    return post
+
+
+def counts(*rows) -> list:
+    return [row.post_count for row in rows]
+
+
+def test_counts_follow_post_writes(db: Session):
+    author, news, guides, snow, gear = setup_blog(db)
+    first = add_post(db, author, "count-1", news, [snow, gear])
+    add_post(db, author, "count-2", news, [snow])
+    assert counts(news, guides, snow, gear) == [2, 0, 2, 1]
+
+    first.category_rel = guides
+    first.tags_rel = [gear]
+    db.flush()
+    assert counts(news, guides, snow, gear) == [1, 1, 1, 1]
+
+    first.category_id = None
+    db.flush()
+    assert counts(news, guides) == [1, 0]
+
+    db.delete(first)
+    db.flush()
+    assert counts(news, guides, snow, gear) == [1, 0, 1, 0]
+    assert blog_counts.drift(db) == {"categories": 0, "tags": 0}
+
+
+def test_reconcile_corrects_drift(db: Session):
+    author, news, _, snow, _ = setup_blog(db)
+    add_post(db, author, "count-drift", news, [snow])
+    db.query(BlogCategory).filter(BlogCategory.id == news.id).update({"post_count": 7})
+    db.query(BlogTag).filter(BlogTag.id == snow.id).update({"post_count": 0})
+    assert blog_counts.drift(db) == {"categories": 1, "tags": 1}
+
+    assert blog_counts.reconcile(db) == {"categories": 1, "tags": 1}
+    db.expire_all()
+    assert counts(news, snow) == [1, 1]
+
+
+def test_count_tree_nests_children_in_display_order(db: Session):
+    author, news, guides, _, _ = setup_blog(db)
+    guides.parent_id = news.id
+    db.add(BlogCategory(name="Alpine", slug="count-alpine", parent_id=news.id, display_order=-1))
+    db.flush()
+    add_post(db, author, "count-tree", guides)
+
+    tree = {node.slug: node for node in blog_category_crud.get_count_tree(db)}
+    assert [child.slug for child in tree["count-news"].children] == ["count-alpine", "count-guides"]
+    assert tree["count-news"].children[1].post_count == 1
@@ -0,0 +1,55 @@
+"""
+Blog full-text search: the index follows post writes, title matches rank
+first and hits carry highlights.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud import blog_search
+from app.db.models import BlogAuthor, BlogPost
+
+
+def search(client, q: str) -> list:
+    response = client.get("/api/v1/blog/posts/search", params={"q": q})
+    assert response.status_code == 200
+    return response.json()["items"]
+
+
+def test_index_follows_writes_and_ranks_title_matches_first(client, app_db: Session):
+    author = BlogAuthor(name="Searcher")
+    in_body = BlogPost(
+        title="Packing list", slug="fts-body", status="published", author=author,
+        content="<p>Crossing the <b>Zanskarite</b> pass in winter.</p>",
+    )
+    in_title = BlogPost(
+        title="Zanskarite diaries", slug="fts-title", status="published", author=author, content="<p>Notes.</p>",
+    )
+    app_db.add_all([in_body, in_title])
+    app_db.commit()
+
+    hits = search(client, "zanskarite")
+    assert [hit["slug"] for hit in hits] == ["fts-title", "fts-body"]
+    assert hits[0]["highlightedTitle"] == "<mark>Zanskarite</mark> diaries"
+    assert "<mark>Zanskarite</mark> pass" in hits[1]["snippet"]
+    # Last term matches as a prefix
+    assert [hit["slug"] for hit in search(client, "zanska")] == ["fts-title", "fts-body"]
+
+    in_body.content = "<p>Nothing to see.</p>"
+    app_db.delete(in_title)
+    app_db.commit()
+    assert search(client, "zanskarite") == []
+
+
+def test_rebuild_repopulates_the_index(app_engine, app_db: Session):
+    app_db.add(BlogPost(
+        title="Rebuilt yakherder", slug="fts-rebuild", content="", status="published", author=BlogAuthor(name="Rebuilder"),
+    ))
+    app_db.commit()
+    with app_engine.begin() as conn:
+        conn.exec_driver_sql(f"DELETE FROM {blog_search.FTS_TABLE}")
+    assert blog_search.is_stale(app_db)
+
+    assert blog_search.rebuild(app_db) == app_db.query(BlogPost).count()
+    assert not blog_search.is_stale(app_db)
+    assert app_db.scalars(blog_search.matching_ids(app_db, "yakherder")).all() == [
+        app_db.query(BlogPost.id).filter(BlogPost.slug == "fts-rebuild").scalar()
+    ]
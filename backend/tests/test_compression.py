@@ -0,0 +1,77 @@
+"""
+Response compression: negotiated from Accept-Encoding, applied above the size
+threshold (streamed bodies included), and precompressed once for cached bodies.
+"""
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, EncodedBody, encoded_response, negotiate
+
+ROWS = [{"id": i, "name": f"Trek number {i}"} for i in range(100)]
+
+
+def make_client() -> TestClient:
+    api = FastAPI()
+
+    @api.get("/big")
+    def big():
+        return ROWS
+
+    @api.get("/small")
+    def small():
+        return {"ok": True}
+
+    @api.get("/stream")
+    def stream():
+        return StreamingResponse((f"line {i}\n".encode() for i in range(500)), media_type="text/plain")
+
+    cached = EncodedBody(b"[" + b",".join(b'{"id":%d}' % i for i in range(300)) + b"]")
+
+    @api.get("/cached")
+    def from_cache():
+        return encoded_response(cached)
+
+    return TestClient(CompressionMiddleware(api))
+
+
+def test_negotiate_honours_q_values():
+    assert negotiate(None) is None
+    assert negotiate("gzip, deflate") == "gzip"
+    assert negotiate("gzip;q=0, identity") is None
+    assert negotiate("*") in ("br", "gzip")
+
+
+def test_large_bodies_are_compressed_and_small_ones_are_not():
+    client = make_client()
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == ROWS
+
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streamed_bodies_are_compressed_incrementally():
+    response = make_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "".join(f"line {i}\n" for i in range(500))
+
+
+def test_cached_bodies_are_compressed_once():
+    client = make_client()
+    for _ in range(2):
+        response = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 300
+
+    body = EncodedBody(b"x" * 2048)
+    assert body.variant("gzip") is body.variant("gzip")
+    assert gzip.decompress(body.variant("gzip")) == body.raw
+    assert body.variant(None) is None
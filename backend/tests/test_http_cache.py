@@ -0,0 +1,63 @@
+"""
+Conditional GETs: a current ETag gets a 304, and the validators change with
+every row rendered into the response.
+"""
+from sqlalchemy.orm import Session
+
+from app.db.models import BlogAuthor, BlogPost, Trek, TrekImage
+
+
+def test_current_etag_gets_not_modified(client, app_db: Session):
+    app_db.add(Trek(name="Etag", slug="etag-trek", description="", duration=3, price=100, status="published"))
+    app_db.commit()
+    url = "/api/v1/treks/etag-trek"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"') and response.headers["last-modified"]
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    assert client.get(url, headers={"If-None-Match": 'W/"other"'}).status_code == 200
+    assert client.get("/api/v1/treks/etag-missing", headers={"If-None-Match": "*"}).status_code == 404
+
+
+def test_trek_etag_changes_with_its_images(client, app_db: Session):
+    trek = Trek(name="Images", slug="etag-images", description="", duration=3, price=100, status="published")
+    app_db.add(trek)
+    app_db.commit()
+    url = "/api/v1/treks/etag-images"
+    etag = client.get(url).headers["etag"]
+
+    image = TrekImage(trek_id=trek.id, url="/one.jpg")
+    app_db.add(image)
+    app_db.commit()
+    added = client.get(url, headers={"If-None-Match": etag})
+    assert added.status_code == 200
+    assert [i["url"] for i in added.json()["images"]] == ["/one.jpg"]
+
+    # Same count, new row
+    app_db.delete(image)
+    app_db.add(TrekImage(trek_id=trek.id, url="/two.jpg"))
+    app_db.commit()
+    replaced = client.get(url, headers={"If-None-Match": added.headers["etag"]})
+    assert replaced.status_code == 200
+    assert [i["url"] for i in replaced.json()["images"]] == ["/two.jpg"]
+
+
+def test_blog_etags_change_when_the_author_is_renamed(client, app_db: Session):
+    author = BlogAuthor(name="Before")
+    app_db.add(BlogPost(title="Etag post", slug="etag-post", content="", status="published", author=author))
+    app_db.commit()
+    urls = ("/api/v1/blog/posts", "/api/v1/blog/posts/etag-post")
+    etags = {url: client.get(url).headers["etag"] for url in urls}
+    for url in urls:
+        assert client.get(url, headers={"If-None-Match": etags[url]}).status_code == 304
+
+    author.name = "After"
+    app_db.commit()
+    for url in urls:
+        assert client.get(url, headers={"If-None-Match": etags[url]}).status_code == 200
@@ -0,0 +1,76 @@
+"""
+media_tags mirrors Media.tags and backs the tag filter, counts and tag operations.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud import media_tags
+from app.crud.media import media as media_crud
+from app.db.models import Media
+
+
+def add_media(db: Session, name: str, tags) -> Media:
+    media = Media(
+        hash=name.ljust(64, "0"), filename=name, original_filename=name, url=f"/{name}", size=1,
+        mime_type="image/jpeg", storage_path=name, tags=tags,
+    )
+    db.add(media)
+    db.flush()
+    return media
+
+
+def test_orm_writes_are_mirrored(db: Session):
+    media = add_media(db, "mirror", ["trek", "summit", "trek"])
+    assert media_tags.current(db.connection(), media.id) == ["summit", "trek"]
+
+    media.tags = ["lake"]
+    db.flush()
+    assert media_tags.current(db.connection(), media.id) == ["lake"]
+
+
+def test_tag_filter_and_counts(db: Session):
+    a = add_media(db, "a", ["trek", "summit"])
+    b = add_media(db, "b", ["trek"])
+    add_media(db, "c", ["lake"])
+
+    found, total = media_crud.search(db, tags=["summit", "trek"])
+    assert {m.id for m in found} == {a.id, b.id}
+    assert total == 2
+    assert {m.id for m in media_crud.get_by_tags(db, tags=["summit"])} == {a.id}
+    assert media_crud.get_all_tags(db) == [
+        {"tag": "trek", "count": 2}, {"tag": "lake", "count": 1}, {"tag": "summit", "count": 1},
+    ]
+
+
+def test_tag_operations_are_set_operations(db: Session):
+    media = add_media(db, "ops", ["trek"])
+
+    media = media_crud.add_tags(db, media_id=media.id, tags=["summit", "trek"])
+    assert media.tags == ["summit", "trek"]
+
+    media = media_crud.remove_tag(db, media_id=media.id, tag="trek")
+    assert media.tags == ["summit"]
+    assert media_crud.remove_tag(db, media_id=media.id, tag="missing").tags == ["summit"]
+
+    media = media_crud.update_tags(db, media_id=media.id, tags=["lake", "snow", "lake"])
+    assert media.tags == ["lake", "snow"]
+    assert media_tags.current(db.connection(), media.id) == ["lake", "snow"]
+
+
+def test_rebuild_backfills_from_json(db: Session):
+    media = add_media(db, "rebuild", ["forest"])
+    db.execute(media_tags.media_tags.delete())
+    assert media_tags.is_stale(db)
+
+    media_tags.rebuild(db)
+    assert media_tags.current(db.connection(), media.id) == ["forest"]
+    assert not media_tags.is_stale(db)
+
+
+def test_tags_differing_in_case_or_spacing(db: Session):
+    media = add_media(db, "case", ["Nepal", "nepal", " Nepal "])
+    assert media_tags.current(db.connection(), media.id) == ["Nepal", "nepal"]
+
+    db.execute(media_tags.media_tags.delete())
+    media_tags.rebuild(db)
+    assert media_tags.current(db.connection(), media.id) == ["Nepal", "nepal"]
+    assert {m.id for m in media_crud.get_by_tags(db, tags=["Nepal "])} == {media.id}
@@ -0,0 +1,58 @@
+"""
+List pages: rows and the filtered total come back in one query, and the
+total stays right on keyset pages and past the end.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud.base import approx_counts
+from app.crud.lead import lead_crud
+from app.crud.trek import TREK_SORTS, trek_crud
+from app.db.models import Lead, Trek
+
+
+def seed(db: Session) -> None:
+    db.add_all(
+        Trek(
+            name=f"Total {i}", slug=f"total-{i}", description="", duration=1, price=100 * i,
+            status="published" if i % 3 else "draft", location="Totals",
+        )
+        for i in range(10)
+    )
+    db.commit()
+
+
+def test_page_and_total_in_one_query(db: Session, max_queries):
+    seed(db)
+    filters = dict(location="Totals", status="published")
+    with max_queries(1):
+        first, total = trek_crud.get_page_with_filters(db, limit=4, sort="price_asc", **filters)
+    assert total == 6 and len(first) == 4
+
+    # Keyset pages carry the full total too
+    cursor = trek_crud.next_cursor(first, 4, TREK_SORTS["price_asc"], "price_asc")
+    with max_queries(1):
+        rest, total = trek_crud.get_page_with_filters(db, limit=4, sort="price_asc", cursor=cursor, **filters)
+    assert total == 6
+    assert [t.price for t in first + rest] == sorted(100 * i for i in range(10) if i % 3)
+
+
+def test_past_the_end_still_counts(db: Session, max_queries):
+    seed(db)
+    with max_queries(2):
+        treks, total = trek_crud.get_page_with_filters(db, skip=50, limit=4, location="Totals")
+    assert treks == [] and total == 10
+
+
+def test_approx_total_is_served_from_the_cached_count(db: Session, max_queries):
+    approx_counts.clear()
+    db.add_all(Lead(name=f"Lead {i}", whatsapp="1", trek_slug="approx-trek") for i in range(3))
+    db.commit()
+    filters = {"trek_slug": "approx-trek"}
+    assert lead_crud.get_page(db, limit=2, filters=filters, approx_total=True)[1] == 3
+
+    db.add(Lead(name="Late", whatsapp="1", trek_slug="approx-trek"))
+    db.commit()
+    with max_queries(1):
+        rows, total = lead_crud.get_page(db, limit=2, filters=filters, approx_total=True)
+    assert len(rows) == 2 and total == 3  # trails the write until the cached count expires
+    assert lead_crud.get_page(db, limit=2, filters=filters)[1] == 4
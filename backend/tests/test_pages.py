@@ -0,0 +1,50 @@
+"""
+Page bundles: one response carries everything a frontend page renders.
+"""
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Trek, TrekBatch
+
+
+def add_trek(db: Session, slug: str, **values) -> Trek:
+    trek = Trek(name=slug, slug=slug, description="", duration=3, price=100, status="published", **values)
+    db.add(trek)
+    db.commit()
+    return trek
+
+
+def test_trek_page_bundles_detail_related_treks_and_upcoming_batches(client, app_db: Session):
+    trek = add_trek(app_db, "page-trek", location="Page Valley")
+    add_trek(app_db, "page-neighbour", location="Page Valley")
+    today = date.today()
+    app_db.add_all([
+        TrekBatch(trek_id=trek.id, start_date=today - timedelta(days=20), end_date=today - timedelta(days=15)),
+        TrekBatch(trek_id=trek.id, start_date=today + timedelta(days=10), end_date=today + timedelta(days=15)),
+    ])
+    app_db.commit()
+
+    response = client.get("/api/v1/pages/trek/page-trek")
+    assert response.status_code == 200
+    page = response.json()
+    assert page["trek"]["slug"] == "page-trek"
+    assert len(page["trek"]["batches"]) == 2
+    assert [b["start_date"] for b in page["batches"]] == [(today + timedelta(days=10)).isoformat()]
+    assert [t["slug"] for t in page["related_treks"]] == ["page-neighbour"]
+    assert page["reviews"]["reviews"] == []
+    assert "site_settings" in page
+
+    assert client.get("/api/v1/pages/trek/page-missing").status_code == 404
+
+
+def test_home_snapshot_is_rebuilt_after_a_commit(client, app_db: Session):
+    first = client.get("/api/v1/pages/home").json()
+    assert "home-featured" not in [t["slug"] for t in first["featured_treks"]]
+    # Served from the snapshot until a source table changes
+    assert client.get("/api/v1/pages/home").json()["generated_at"] == first["generated_at"]
+
+    add_trek(app_db, "home-featured", featured=True)
+    home = client.get("/api/v1/pages/home").json()
+    assert home["featured_treks"][0]["slug"] == "home-featured"
+    assert home["generated_at"] != first["generated_at"]
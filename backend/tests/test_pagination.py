@@ -0,0 +1,57 @@
+"""
+Keyset pagination: following next_cursor walks every row once in the list
+order, and cursors that do not belong to the listing are a 400.
+"""
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.models import Trek
+
+
+def test_cursor_round_trip():
+    values = [datetime(2026, 5, 1, 12, 30), date(2026, 6, 1), 99.5, None, 42]
+    assert decode_cursor(encode_cursor("newest", values), "newest", 5) == values
+
+
+@pytest.mark.parametrize("cursor, sort, size", [
+    ("not-a-cursor!", "newest", 2),
+    (encode_cursor("price_asc", [100, 1]), "newest", 2),
+    (encode_cursor("newest", [1]), "newest", 2),
+])
+def test_invalid_cursors_are_rejected(cursor, sort, size):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, sort, size)
+    assert error.value.status_code == 400
+
+
+def test_walking_a_list_with_cursors(client, app_db: Session):
+    prices = [300, 100, 200, 100, 300]
+    treks = [
+        Trek(
+            name=f"Keyset {i}", slug=f"keyset-{i}", description="", duration=1, price=price,
+            status="published", location="Keyset Valley",
+        )
+        for i, price in enumerate(prices)
+    ]
+    app_db.add_all(treks)
+    app_db.commit()
+    expected = [t.slug for t in sorted(treks, key=lambda t: (t.price, t.id))]
+
+    url = "/api/v1/treks?location=keyset%20valley&sort=price_asc&limit=2"
+    seen, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = client.get(url, params={"cursor": cursor})
+        assert response.status_code == 200
+        page = response.json()
+        seen += [item["slug"] for item in page["items"]]
+        cursor, pages = page["next_cursor"], pages + 1
+        assert page["total"] == len(prices)
+    assert seen == expected and pages == 3
+
+    assert client.get(url, params={"cursor": "garbage"}).status_code == 400
+    newest_cursor = client.get("/api/v1/treks?location=keyset%20valley&limit=2&cursor=").json()["next_cursor"]
+    assert client.get(url, params={"cursor": newest_cursor}).status_code == 400
@@ -0,0 +1,199 @@
+"""
+Query-plan regression tests for the CRUD list and detail queries.
+
+Each case runs a list method with a statement recorder attached to the engine,
+then asks the database how it would execute every SELECT the method issued:
+``EXPLAIN QUERY PLAN`` on SQLite, ``EXPLAIN`` on MySQL. A step that reads a
+whole table fails the test:
+
+- SQLite: ``SCAN <table>`` without an index, or an ``AUTOMATIC`` index (a
+  throwaway index built by scanning the table on every execution);
+- MySQL: access type ``ALL`` with no usable key.
+
+Dropping or reshaping an index a hot path relies on - or a query change that
+stops it from being usable - then shows up here rather than as latency on a
+large table. Substring (ILIKE) filters cannot use a b-tree index and are not
+covered, nor are lists that return a whole small table by design
+(guides, offices, categories).
+"""
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.pagination import encode_cursor
+from app.crud.blog import blog_crud
+from app.crud.booking import booking_crud
+from app.crud.contact import contact_crud
+from app.crud.email_log import email_log_crud
+from app.crud.expedition import expedition_crud
+from app.crud.lead import lead_crud
+from app.crud.media import media as media_crud
+from app.crud.trek import TREK_SORTS, trek_crud
+from app.db.models import (
+    BlogAuthor, BlogPost, BlogTag, Expedition, ExpeditionDay, ItineraryDay, Trek, TrekBatch, TrekFAQ, TrekImage,
+)
+
+CURSOR_AT = datetime(2026, 1, 1)
+
+
+def with_trek(load: Callable[[Session, Trek], object]) -> Callable[[Session], object]:
+    """Run ``load`` against a trek with one row in every collection (collection loaders skip empty parents)."""
+    def run(db: Session):
+        trek = Trek(
+            name="Plan Trek", slug="plan-trek", description="", duration=1, price=1, best_season=[],
+            itinerary=[ItineraryDay(day=1, title="", description="")],
+            images=[TrekImage(url="")],
+            faqs=[TrekFAQ(question="", answer="")],
+            batches=[TrekBatch(start_date=CURSOR_AT.date(), end_date=CURSOR_AT.date())],
+        )
+        db.add(trek)
+        db.flush()
+        db.expunge_all()
+        return load(db, trek)
+    return run
+
+
+def with_expedition(db: Session) -> Expedition:
+    expedition = Expedition(
+        name="Plan Expedition", slug="plan-expedition", difficulty="expert", duration=1, summit_altitude=1,
+        base_altitude=1, location="", region="", description="", short_description="", highlights=[],
+        requirements=[], equipment=[], price=1, group_size_min=1, group_size_max=1, season=[], image="",
+        itinerary=[ExpeditionDay(day=1, title="", description="", altitude=1, activities=[])],
+    )
+    db.add(expedition)
+    db.flush()
+    db.expunge_all()
+    return expedition
+
+
+def with_post(db: Session) -> BlogPost:
+    post = BlogPost(
+        title="Plan Post", slug="plan-post", content="", author=BlogAuthor(name="Plan Author"),
+        tags_rel=[BlogTag(name="plan", slug="plan")],
+    )
+    db.add(post)
+    db.flush()
+    db.expunge_all()
+    return post
+
+LIST_QUERIES: Dict[str, Callable[[Session], object]] = {
+    # Treks: admin list, public list in every sort, homepage featured, keyset page
+    "treks": lambda db: trek_crud.get_page_with_filters(db),
+    "treks status": lambda db: trek_crud.get_page_with_filters(db, status="published"),
+    **{
+        f"treks status sort={sort}": (lambda sort: lambda db: trek_crud.get_page_with_filters(
+            db, status="published", sort=sort
+        ))(sort)
+        for sort in TREK_SORTS
+    },
+    "treks status season": lambda db: trek_crud.get_page_with_filters(db, status="published", season="May"),
+    "treks featured": lambda db: trek_crud.get_multi_with_filters(
+        db, limit=6, featured=True, status="published"
+    ),
+    "treks cursor": lambda db: trek_crud.get_page_with_filters(
+        db, status="published", cursor=encode_cursor("newest", [CURSOR_AT, 1])
+    ),
+    "trek batches": lambda db: db.query(TrekBatch).filter(TrekBatch.trek_id == 1).order_by(TrekBatch.start_date).all(),
+    # Detail pages: the parent plus one IN query per collection
+    **{
+        f"trek detail strategy={strategy}": (lambda strategy: with_trek(
+            lambda db, trek: trek_crud.get_by_slug_with_details(db, trek.slug, strategy=strategy)
+        ))(strategy)
+        for strategy in ("selectin", "subquery")
+    },
+    "trek detail by id": with_trek(lambda db, trek: trek_crud.get_with_details(db, trek.id)),
+    "trek batches public": with_trek(
+        lambda db, trek: trek_crud.get_by_slug_with_details(db, trek.slug, relations=("batches",))
+    ),
+    "expedition detail": lambda db: expedition_crud.get_by_slug_with_details(db, with_expedition(db).slug),
+    "blog post detail": lambda db: blog_crud.get_by_slug_with_author(db, with_post(db).slug),
+    # Expeditions
+    "expeditions": lambda db: expedition_crud.get_page_with_filters(db),
+    "expeditions status": lambda db: expedition_crud.get_page_with_filters(db, status="published"),
+    "expeditions featured": lambda db: expedition_crud.get_featured(db),
+    # Blog
+    "blog posts": lambda db: blog_crud.get_page_with_author(db),
+    "blog posts status": lambda db: blog_crud.get_page_with_author(db, status="published"),
+    "blog posts category": lambda db: blog_crud.get_page_with_author(db, status="published", category="news"),
+    "blog posts category_id": lambda db: blog_crud.get_page_with_author(db, status="published", category_id=1),
+    "blog posts cursor": lambda db: blog_crud.get_page_with_author(
+        db, status="published", cursor=encode_cursor("default", [CURSOR_AT, 1])
+    ),
+    "blog recent": lambda db: blog_crud.get_recent(db),
+    "blog by category": lambda db: blog_crud.get_by_category(db, "news"),
+    "blog by tag": lambda db: blog_crud.get_by_tag(db, 1),
+    # Admin lists
+    "leads": lambda db: lead_crud.get_page(db),
+    "leads status": lambda db: lead_crud.get_page(db, filters={"status": "new"}),
+    "leads new": lambda db: lead_crud.get_new_leads(db),
+    "bookings": lambda db: booking_crud.get_page(db),
+    "bookings status": lambda db: booking_crud.get_page(db, filters={"status": "pending"}),
+    "contacts status": lambda db: contact_crud.get_page(db, filters={"status": "unread"}),
+    "contacts unread": lambda db: contact_crud.get_unread(db),
+    "email logs": lambda db: email_log_crud.get_page(db),
+    "email logs type": lambda db: email_log_crud.get_page(db, filters={"email_type": "itinerary"}),
+    "email logs status": lambda db: email_log_crud.get_page(db, filters={"status": "bounced"}),
+    "media": lambda db: media_crud.search(db),
+    "media folder": lambda db: media_crud.search(db, folder="treks"),
+    "media tags": lambda db: media_crud.search(db, tags=["trek", "summit"]),
+    "media by tags": lambda db: media_crud.get_by_tags(db, tags=["trek"]),
+}
+
+
+def record_selects(db: Session, run: Callable[[Session], object]) -> List[Tuple[str, object]]:
+    """The SELECT statements (with parameters) that ``run(db)`` sends to the database."""
+    statements: List[Tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+_SQLITE_TABLE_SCAN = re.compile(r"^SCAN (?!\(|anon_|CONSTANT)(\S+)(?: LEFT-JOIN)?$")
+
+
+def sqlite_full_scans(db: Session, statement: str, parameters) -> List[str]:
+    plan = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [
+        row[3] for row in plan
+        if _SQLITE_TABLE_SCAN.match(row[3]) or "AUTOMATIC" in row[3]
+    ]
+
+
+def mysql_full_scans(db: Session, statement: str, parameters) -> List[str]:
+    plan = db.connection().exec_driver_sql("EXPLAIN " + statement, parameters).mappings().all()
+    return [
+        f"{row['table']}: type=ALL rows={row['rows']}" for row in plan
+        if row["type"] == "ALL" and not row["possible_keys"] and not str(row["table"]).startswith("<")
+    ]
+
+
+FULL_SCAN_CHECKS = {"sqlite": sqlite_full_scans, "mysql": mysql_full_scans}
+
+
+@pytest.mark.parametrize("name", list(LIST_QUERIES))
+def test_list_query_uses_indexes(db: Session, name: str):
+    dialect = db.get_bind().dialect.name
+    if dialect not in FULL_SCAN_CHECKS:
+        pytest.skip(f"no plan check for {dialect}")
+    statements = record_selects(db, LIST_QUERIES[name])
+    assert statements, "the query was not executed"
+
+    failures = []
+    for statement, parameters in statements:
+        scans = FULL_SCAN_CHECKS[dialect](db, statement, parameters)
+        if scans:
+            failures.append(f"{'; '.join(scans)}\n  in: {' '.join(statement.split())[:300]}")
+    assert not failures, "full table scan:\n" + "\n".join(failures)
@@ -0,0 +1,119 @@
+"""
+Query counting: the public read paths stay within their query budgets, N+1
+patterns are detected, and the middleware reports Server-Timing.
+"""
+import logging
+from datetime import date, timedelta
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.responses import serialize_rows
+from app.crud.blog import blog_crud
+from app.crud.trek import trek_crud
+from app.db.models import BlogAuthor, BlogCategory, BlogPost, BlogTag, Trek, TrekBatch
+from app.models.batch import TrekBatchResponse
+from app.models.blog import BlogPostListResponse
+from app.models.trek import TrekListResponse
+
+
+def seed(db: Session) -> None:
+    tags = [BlogTag(name=f"Tag {i}", slug=f"qs-tag-{i}") for i in range(3)]
+    category = BlogCategory(name="Stories", slug="qs-stories")
+    for i in range(6):
+        trek = Trek(
+            name=f"Trek {i}", slug=f"qs-trek-{i}", description="", duration=3, price=100,
+            status="published", featured=True,
+        )
+        trek.batches = [
+            TrekBatch(start_date=date.today() + timedelta(days=10 * n), end_date=date.today() + timedelta(days=10 * n + 5))
+            for n in range(1, 4)
+        ]
+        db.add(trek)
+        db.add(BlogPost(
+            title=f"Post {i}", slug=f"qs-post-{i}", content="", status="published",
+            author=BlogAuthor(name=f"Author {i}"), category_rel=category, tags_rel=tags[: i % 3],
+        ))
+    db.commit()
+    db.expire_all()
+
+
+def test_public_reads_stay_within_budget(db: Session, max_queries):
+    seed(db)
+
+    # Featured treks: list columns only, no detail graph
+    with max_queries(1):
+        serialize_rows(trek_crud.get_multi_with_filters(db, limit=6, featured=True, status="published"), TrekListResponse)
+
+    # Public batches: the trek and its batches
+    with max_queries(2):
+        trek = trek_crud.get_by_slug_with_details(db, "qs-trek-1", relations=("batches",))
+        assert len([TrekBatchResponse.from_orm_model(b) for b in trek.batches]) == 3
+
+    # Blog list pages read author and category without a query per post
+    for read in (
+        lambda: blog_crud.get_page_with_author(db, limit=10)[0],
+        lambda: blog_crud.get_recent(db, limit=3),
+        lambda: blog_crud.get_by_category(db, "qs-stories"),
+    ):
+        db.expire_all()
+        with max_queries(2) as stats:
+            posts = read()
+            serialize_rows(posts, BlogPostListResponse.from_orm_model)
+        assert posts and stats.repeated() == []
+
+
+def test_lazy_loads_are_flagged_as_n_plus_one(db: Session, max_queries):
+    seed(db)
+    with max_queries(20) as stats:
+        posts = db.query(BlogPost).filter(BlogPost.slug.like("qs-post-%")).all()
+        serialize_rows(posts, BlogPostListResponse.from_orm_model)
+
+    # One author lookup per post; the shared category loads once
+    [(statement, runs)] = stats.repeated()
+    assert "FROM blog_authors" in statement and runs == 6
+    assert stats.count == 1 + 6 + 1
+    assert "6x SELECT blog_authors" in stats.summary()
+
+
+def test_middleware_reports_server_timing_and_logs_n_plus_one(tmp_path, caplog):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO item (id) VALUES (1), (2), (3), (4)"))
+    sessions = sessionmaker(bind=engine)
+
+    def get_session():
+        db = sessions()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    api = FastAPI()
+
+    @api.get("/items")
+    def items(db: Session = Depends(get_session)):
+        ids = db.execute(text("SELECT id FROM item")).scalars().all()
+        return [db.execute(text("SELECT id FROM item WHERE id = :id"), {"id": i}).scalar() for i in ids]
+
+    @api.get("/plain")
+    async def plain():
+        return {}
+
+    client = TestClient(QueryStatsMiddleware(api, detect=True, threshold=3))
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            response = client.get("/items")
+        assert response.json() == [1, 2, 3, 4]
+        timing = response.headers["server-timing"]
+        assert timing.startswith("db;dur=") and timing.endswith('desc="5 queries"')
+        [record] = caplog.records
+        assert "Possible N+1 in GET /items: 4 runs of SELECT id FROM item WHERE id = ?" in record.getMessage()
+
+        assert client.get("/plain").headers["server-timing"].endswith('desc="0 queries"')
+    finally:
+        engine.dispose()
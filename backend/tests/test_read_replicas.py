@@ -0,0 +1,169 @@
+"""
+Read-replica routing, on a primary and two replicas that are separate SQLite
+files each holding a marker row naming the database.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.db.replicas import PRIMARY_COOKIE, ReadYourWritesMiddleware, Replica, ReplicaPool
+
+
+def make_db(path, name):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        conn.execute(text("INSERT INTO marker VALUES (:name)"), {"name": name})
+    engine.dispose()
+
+
+def request(method="GET", cookie=None):
+    headers = [(b"cookie", f"{PRIMARY_COOKIE}={cookie}".encode())] if cookie is not None else []
+    return Request({"type": "http", "method": method, "path": "/", "headers": headers})
+
+
+def which(db):
+    return db.execute(text("SELECT name FROM marker")).scalar()
+
+
+@pytest.fixture
+def databases(tmp_path):
+    for name in ("primary", "replica1", "replica2"):
+        make_db(tmp_path / f"{name}.db", name)
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replicas = [
+        Replica(
+            f"sqlite:///{tmp_path / name}.db",
+            create_engine(f"sqlite:///{tmp_path / name}.db"),
+            create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db"),
+        )
+        for name in ("replica1", "replica2")
+    ]
+    yield primary, replicas
+    primary.dispose()
+    for replica in replicas:
+        replica.engine.dispose()
+        asyncio.run(replica.async_engine.dispose())
+
+
+def read(pool, factory, req):
+    db = pool.session(req, factory)
+    try:
+        return which(db)
+    finally:
+        db.close()
+
+
+def test_round_robin_reads_and_primary_writes(databases):
+    primary, replicas = databases
+    pool = ReplicaPool(replicas)
+    factory = sessionmaker(bind=primary)
+
+    assert [read(pool, factory, request()) for _ in range(4)] == ["replica1", "replica2"] * 2
+    assert read(pool, factory, request("POST")) == "primary"
+    assert read(pool, factory, None) == "primary"
+    assert pool.reads == {"replica": 4, "primary": 0, "fallback": 0}
+
+
+def test_least_connections_prefers_idle_replica(databases):
+    primary, replicas = databases
+    pool = ReplicaPool(replicas, strategy="least_connections")
+    factory = sessionmaker(bind=primary)
+
+    busy = pool.session(request(), factory)
+    assert which(busy) == "replica1"
+    # replica1 holds a checked-out connection, so every read goes to replica2
+    assert [read(pool, factory, request()) for _ in range(3)] == ["replica2"] * 3
+    busy.close()
+
+    with pytest.raises(ValueError):
+        ReplicaPool(replicas, strategy="random")
+
+
+def test_read_your_writes_sticks_to_primary(databases):
+    primary, replicas = databases
+    pool = ReplicaPool(replicas, read_your_writes=60)
+    factory = sessionmaker(bind=primary)
+
+    # A write committed by this process
+    pool.mark_write()
+    assert read(pool, factory, request()) == "primary"
+    pool.primary_until = 0
+    assert read(pool, factory, request()) == "replica1"
+
+    # A write by this client on another worker
+    assert read(pool, factory, request(cookie="9999999999")) == "primary"
+    assert read(pool, factory, request(cookie="1")) == "replica2"
+    assert read(pool, factory, request(cookie="junk")) == "replica1"
+
+
+def test_unavailable_replica_falls_back_to_primary(databases, tmp_path):
+    primary, replicas = databases
+    missing = tmp_path / "missing.db"
+    url = f"sqlite:///file:{missing}?mode=ro&uri=true"
+    down = Replica(url, create_engine(url))
+    pool = ReplicaPool([down, replicas[0]])
+    factory = sessionmaker(bind=primary)
+
+    # The failing checkout is served by the primary and takes the replica out
+    assert read(pool, factory, request()) == "primary"
+    assert not down.healthy and down.failures == 1 and down.last_error
+    assert pool.reads["fallback"] == 1
+    assert [read(pool, factory, request()) for _ in range(3)] == ["replica1"] * 3
+
+    # With every replica down, reads stay on the primary
+    replicas[0].healthy = False
+    assert read(pool, factory, request()) == "primary"
+
+    # Health checks put recovered replicas back
+    make_db(missing, "recovered")
+    pool.check()
+    assert down.healthy and replicas[0].healthy
+    assert sorted(read(pool, factory, request()) for _ in range(2)) == ["recovered", "replica1"]
+    assert [r["healthy"] for r in pool.stats()["replicas"]] == [True, True]
+    down.engine.dispose()
+
+
+def test_async_sessions_are_routed(databases, tmp_path):
+    primary_engine, replicas = databases
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    factory = async_sessionmaker(primary)
+    pool = ReplicaPool(replicas)
+
+    async def reads():
+        names = []
+        for req in (request(), request(), request("DELETE")):
+            db = await pool.async_session(req, factory)
+            try:
+                names.append((await db.execute(text("SELECT name FROM marker"))).scalar())
+            finally:
+                await db.close()
+        await primary.dispose()
+        return names
+
+    assert asyncio.run(reads()) == ["replica1", "replica2", "primary"]
+
+
+def test_middleware_sets_cookie_on_successful_writes():
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    async def bad(request):
+        return PlainTextResponse("bad", status_code=422)
+
+    app = Starlette(routes=[Route("/ok", ok, methods=["GET", "POST"]), Route("/bad", bad, methods=["POST"])])
+    client = TestClient(ReadYourWritesMiddleware(app, seconds=5))
+
+    assert PRIMARY_COOKIE not in client.get("/ok").cookies
+    assert PRIMARY_COOKIE not in client.post("/bad").cookies
+    response = client.post("/ok")
+    assert "Max-Age=6" in response.headers["set-cookie"]
+    assert float(response.cookies[PRIMARY_COOKIE]) > 0
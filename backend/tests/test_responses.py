@@ -0,0 +1,50 @@
+"""
+Fast JSON responses encode models the way FastAPI would, with orjson and
+with the pydantic-core fallback.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from app.core import responses
+from app.core.responses import FastJSONResponse, dumps
+
+
+class Item(BaseModel):
+    item_name: str = Field(alias="itemName")
+    price: Decimal
+    starts: date
+    updated_at: datetime
+
+    class Config:
+        populate_by_name = True
+
+
+@pytest.fixture(params=["orjson", "pydantic-core"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_fastapi_encoding(encoder):
+    item = Item(
+        item_name="Trek", price=Decimal("1499.50"), starts=date(2026, 5, 1), updated_at=datetime(2026, 1, 2, 3, 4, 5)
+    )
+    payload = {"items": [item], "total": 1, "next_cursor": None}
+
+    assert json.loads(dumps(payload)) == jsonable_encoder(payload)
+    assert json.loads(dumps(payload))["items"][0]["itemName"] == "Trek"
+
+
+def test_fast_response_sends_encoded_bodies_untouched(encoder):
+    assert FastJSONResponse(b'{"cached":true}').body == b'{"cached":true}'
+    response = FastJSONResponse([{"id": 1}])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [{"id": 1}]
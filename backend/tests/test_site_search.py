@@ -0,0 +1,45 @@
+"""
+Site search: committed writes reach the in-memory index, and BM25 ranks
+title matches above body matches.
+"""
+from sqlalchemy.orm import Session
+
+from app.db.models import Trek
+
+
+def search(client, q: str, **params) -> list:
+    response = client.get("/api/v1/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return [(hit["type"], hit["slug"]) for hit in response.json()["items"]]
+
+
+def test_new_and_changed_rows_reach_the_index(client, app_db: Session):
+    # Build the index first, so the trek can only arrive through a commit
+    assert search(client, "quetzalpass") == []
+
+    trek = Trek(
+        name="Quetzalpass Circuit", slug="search-new", description="", duration=5, price=100, status="published",
+    )
+    app_db.add(trek)
+    app_db.commit()
+    assert search(client, "quetzalpass") == [("trek", "search-new")]
+
+    trek.status = "draft"
+    app_db.commit()
+    assert search(client, "quetzalpass") == []
+
+
+def test_title_matches_rank_above_body_matches(client, app_db: Session):
+    app_db.add_all([
+        Trek(
+            name="Valley walk", slug="search-body", description="<p>Past the Ombrakh lakes.</p>",
+            duration=1, price=1, status="published",
+        ),
+        Trek(name="Ombrakh lakes", slug="search-title", description="", duration=1, price=1, status="published"),
+    ])
+    app_db.commit()
+
+    assert search(client, "ombrakh") == [("trek", "search-title"), ("trek", "search-body")]
+    # The last term also matches as a prefix
+    assert search(client, "ombr", types="trek") == [("trek", "search-title"), ("trek", "search-body")]
+    assert client.get("/api/v1/search", params={"q": "ombrakh", "types": "nope"}).status_code == 400
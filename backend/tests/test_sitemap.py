@@ -0,0 +1,32 @@
+"""
+Sitemap index: every published trek and post, and only recent ones with ``since``.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.db.models import BlogAuthor, BlogPost, Trek
+
+
+def entries(client, **params) -> set:
+    response = client.get("/api/v1/sitemap", params=params)
+    assert response.status_code == 200
+    return {(item["type"], item["slug"]) for item in response.json()}
+
+
+def test_sitemap_lists_published_items_and_filters_by_since(client, app_db: Session):
+    old = datetime.utcnow() - timedelta(days=30)
+    app_db.add_all([
+        Trek(name="Old", slug="map-old", description="", duration=1, price=1, status="published", updated_at=old),
+        Trek(name="New", slug="map-new", description="", duration=1, price=1, status="published"),
+        Trek(name="Draft", slug="map-draft", description="", duration=1, price=1, status="draft"),
+        BlogPost(title="Post", slug="map-post", content="", status="published", author=BlogAuthor(name="Mapper")),
+    ])
+    app_db.commit()
+
+    listed = entries(client)
+    assert {("trek", "map-old"), ("trek", "map-new"), ("blog", "map-post")} <= listed
+    assert ("trek", "map-draft") not in listed
+
+    recent = entries(client, since=(datetime.utcnow() - timedelta(days=1)).isoformat())
+    assert ("trek", "map-new") in recent and ("trek", "map-old") not in recent
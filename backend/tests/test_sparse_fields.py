@@ -0,0 +1,31 @@
+"""
+Sparse fieldsets: ``?fields=`` returns only the requested keys, camelCase
+names included, and rejects unknown ones.
+"""
+from sqlalchemy.orm import Session
+
+from app.db.models import Expedition
+
+
+def test_expedition_list_selects_camel_case_fields(client, app_db: Session):
+    app_db.add(Expedition(
+        name="Sparse Peak", slug="sparse-peak", difficulty="expert", duration=20, summit_altitude=8091,
+        base_altitude=4200, location="", region="", description="", short_description="Eight thousander",
+        highlights=[], requirements={"experience": "", "fitnessLevel": "", "technicalSkills": []},
+        equipment={"provided": [], "personal": []}, price=5000, group_size_min=1, group_size_max=8,
+        season=["May"], image="", status="published", success_rate=70,
+    ))
+    app_db.commit()
+
+    response = client.get("/api/v1/expeditions?fields=slug,shortDescription,summitAltitude,successRate&search=Sparse")
+    assert response.status_code == 200
+    assert response.json()["items"] == [
+        {"slug": "sparse-peak", "shortDescription": "Eight thousander", "summitAltitude": 8091, "successRate": 70},
+    ]
+
+
+def test_unknown_fields_are_rejected(client):
+    for url in ("/api/v1/expeditions?fields=slug,groupSize", "/api/v1/treks?fields=slug,nope"):
+        response = client.get(url)
+        assert response.status_code == 400
+        assert "Allowed: " in response.json()["detail"]
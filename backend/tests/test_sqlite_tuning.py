@@ -0,0 +1,76 @@
+"""
+SQLite connections come up with the configured PRAGMAs and pool.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, SingletonThreadPool
+
+from app.core.config import settings
+from app.db import sqlite
+from app.db.session import make_async_engine, make_engine
+
+TUNED = {
+    "journal_mode": "wal",
+    "synchronous": 1,  # NORMAL
+    "busy_timeout": 5000,
+    "cache_size": -16384,
+    "mmap_size": 268435456,
+    "temp_store": 2,  # MEMORY
+}
+
+
+def test_every_connection_is_tuned(tmp_path):
+    engine = make_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == settings.SQLITE_POOL_SIZE
+        with engine.connect() as first, engine.connect() as second:
+            assert sqlite.current(first) == sqlite.current(second) == TUNED
+    finally:
+        engine.dispose()
+
+
+def test_async_connections_are_tuned(tmp_path):
+    engine = make_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}")
+
+    async def read():
+        async with engine.connect() as conn:
+            return await conn.run_sync(sqlite.current)
+
+    try:
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+        assert asyncio.run(read()) == TUNED
+    finally:
+        asyncio.run(engine.dispose())
+
+
+def test_settings_change_the_profile(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_SYNCHRONOUS", "FULL")
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 250)
+    monkeypatch.setattr(settings, "SQLITE_POOL_CLASS", "null")
+    engine = make_engine(f"sqlite:///{tmp_path / 'custom.db'}")
+    try:
+        assert isinstance(engine.pool, NullPool)
+        with engine.connect() as conn:
+            values = sqlite.current(conn)
+        assert (values["synchronous"], values["busy_timeout"]) == (2, 250)
+    finally:
+        engine.dispose()
+
+    monkeypatch.setattr(settings, "SQLITE_TUNING_ENABLED", False)
+    assert sqlite.pragmas() == []
+    monkeypatch.setattr(settings, "SQLITE_POOL_CLASS", "static")
+    with pytest.raises(ValueError):
+        sqlite.pool_options(f"sqlite:///{tmp_path / 'other.db'}")
+
+
+def test_memory_database_keeps_default_pool():
+    engine = make_engine("sqlite:///:memory:")
+    try:
+        # One connection per thread, so the data is shared within it
+        assert isinstance(engine.pool, SingletonThreadPool)
+        with engine.connect() as conn:
+            assert sqlite.current(conn)["journal_mode"] == "memory"
+    finally:
+        engine.dispose()
@@ -0,0 +1,65 @@
+"""
+Stale-while-revalidate cache: cold misses load once however many callers
+wait, and stale values are served while one background refresh runs.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.cache import SWRCache
+
+
+def test_concurrent_cold_misses_share_one_load():
+    cache = SWRCache("test_swr_single_flight", ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get, "key", load) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        assert [f.result() for f in futures] == ["value"] * 8
+
+    assert len(calls) == 1
+    assert cache.misses == 1 and cache.coalesced == 7
+    assert cache.get("key", load) == "value" and cache.hits == 1
+
+
+def test_stale_value_is_served_while_refreshing():
+    cache = SWRCache("test_swr_stale", ttl=0.05)
+    cache.get("key", lambda: "old")
+    time.sleep(0.1)
+
+    release = threading.Event()
+
+    def refresh():
+        release.wait(5)
+        return "new"
+
+    # Both reads get the stale value at once; only one refresh starts
+    assert cache.get("key", lambda: "unused", refresh) == "old"
+    assert cache.get("key", lambda: "unused", refresh) == "old"
+    assert cache.stale_hits == 2
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while cache.refreshes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.refreshes == 1
+    assert cache.get("key", lambda: "unused") == "new"
+
+
+def test_clear_during_load_discards_the_result():
+    cache = SWRCache("test_swr_clear", ttl=60)
+
+    def load():
+        cache.clear()  # a commit lands while the value is being loaded
+        return "maybe stale"
+
+    assert cache.get("key", load) == "maybe stale"
+    assert cache.get("key", lambda: "fresh") == "fresh"
@@ -0,0 +1,51 @@
+"""
+Trek response cache: repeat reads are served from memory until a commit
+touches a trek or something rendered with it.
+"""
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Trek, TrekBatch
+
+
+def add_trek(db: Session, slug: str) -> Trek:
+    trek = Trek(name=slug, slug=slug, description="", duration=3, price=100, status="published")
+    db.add(trek)
+    db.commit()
+    return trek
+
+
+def test_detail_is_served_from_cache_until_the_trek_changes(client, app_db: Session):
+    trek = add_trek(app_db, "cache-detail")
+    url = "/api/v1/treks/cache-detail"
+
+    assert client.get(url).headers["x-cache"] == "MISS"
+    assert client.get(url).headers["x-cache"] == "HIT"
+
+    trek.name = "Renamed"
+    app_db.commit()
+    response = client.get(url)
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["name"] == "Renamed"
+
+
+def test_related_writes_invalidate_and_rollbacks_do_not(client, app_db: Session):
+    trek = add_trek(app_db, "cache-batches")
+    url = "/api/v1/treks/cache-batches/batches/public"
+
+    assert client.get(url).json() == []
+    assert client.get(url).headers["x-cache"] == "HIT"
+
+    # Nothing committed: the cached response stays
+    trek.name = "Discarded"
+    app_db.flush()
+    app_db.rollback()
+    assert client.get(url).headers["x-cache"] == "HIT"
+
+    start = date.today() + timedelta(days=30)
+    app_db.add(TrekBatch(trek_id=trek.id, start_date=start, end_date=start + timedelta(days=3)))
+    app_db.commit()
+    response = client.get(url)
+    assert response.headers["x-cache"] == "MISS"
+    assert [batch["start_date"] for batch in response.json()] == [start.isoformat()]
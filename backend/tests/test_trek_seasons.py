@@ -0,0 +1,60 @@
+"""
+trek_seasons stays in step with Trek.best_season and serves the season filter.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud import trek_seasons
+from app.crud.trek import trek_crud
+from app.db.models import Trek, TrekSeason
+
+
+def add_trek(db: Session, slug: str, best_season) -> Trek:
+    trek = Trek(
+        name=slug, slug=slug, description="", duration=1, price=1, status="published", best_season=best_season,
+    )
+    db.add(trek)
+    db.flush()
+    return trek
+
+
+def stored(db: Session, trek: Trek) -> set:
+    return {month for (month,) in db.query(TrekSeason.month).filter(TrekSeason.trek_id == trek.id)}
+
+
+def test_seasons_follow_best_season_writes(db: Session):
+    trek = add_trek(db, "season-sync", ["May", "June", "May"])
+    assert stored(db, trek) == {"May", "June"}
+
+    trek.best_season = ["October"]
+    db.flush()
+    assert stored(db, trek) == {"October"}
+
+    trek.name = "renamed"
+    db.flush()
+    assert stored(db, trek) == {"October"}
+
+    trek_id = trek.id
+    db.delete(trek)
+    db.flush()
+    assert db.query(TrekSeason).filter(TrekSeason.trek_id == trek_id).count() == 0
+
+
+def test_season_filter_matches_whole_entries(db: Session):
+    may = add_trek(db, "season-may", ["May", "June"])
+    add_trek(db, "season-mayday", ["Mayday"])
+    add_trek(db, "season-none", [])
+
+    treks, total = trek_crud.get_page_with_filters(db, season="May")
+    assert [t.id for t in treks] == [may.id]
+    assert total == 1
+    assert trek_crud.get_count_with_filters(db, season="May") == 1
+
+
+def test_rebuild_backfills_unsynced_treks(db: Session):
+    trek = add_trek(db, "season-rebuild", ["April"])
+    db.query(TrekSeason).delete()
+    assert trek_seasons.is_stale(db)
+
+    trek_seasons.rebuild(db)
+    assert stored(db, trek) == {"April"}
+    assert not trek_seasons.is_stale(db)
@@ -0,0 +1,29 @@
+"""
+Startup warm-up: hot paths and published detail pages are in the response
+caches before the first request, within the time budget.
+"""
+import asyncio
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Trek
+from app.services.warmup import HOT_PATHS, warm_up
+
+
+def test_warm_up_fills_the_response_caches(client, app_db: Session):
+    app_db.add(Trek(name="Warm", slug="warm-trek", description="", duration=1, price=1, status="published"))
+    app_db.commit()
+
+    report = asyncio.run(warm_up(client.app, budget=30))
+    assert report["skipped"] == report["failed"] == 0
+    # Hot paths plus the detail pages of published content
+    assert report["warmed"] >= len(HOT_PATHS) + 2
+
+    assert client.get("/api/v1/treks/warm-trek").headers["x-cache"] == "HIT"
+    assert client.get("/api/v1/pages/trek/warm-trek").headers["x-cache"] == "HIT"
+
+
+def test_warm_up_stops_at_the_budget(client):
+    report = asyncio.run(warm_up(client.app, budget=0))
+    assert report["warmed"] == report["failed"] == 0
+    assert report["skipped"] >= len(HOT_PATHS)
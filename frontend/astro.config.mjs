@@ -6,22 +6,23 @@ import node from '@astrojs/node';
 
 const API_BASE = process.env.PUBLIC_API_BASE_URL || 'http://localhost:8000';
 
-async function fetchSlugs(path) {
+// Single streamed request for every published slug (no pagination cap)
+async function fetchSitemapSlugs() {
+  const slugs = { blog: [], trek: [], expedition: [] };
   try {
-    const res = await fetch(`${API_BASE}/api/v1${path}`);
-    if (!res.ok) return [];
-    const data = await res.json();
-    return (data.items || data || []).map((item) => item.slug).filter(Boolean);
+    const res = await fetch(`${API_BASE}/api/v1/sitemap`);
+    if (!res.ok) return slugs;
+    const entries = await res.json();
+    for (const { type, slug } of entries) {
+      if (slug && slugs[type]) slugs[type].push(slug);
+    }
   } catch {
-    return [];
+    // API unavailable at build time; sitemap falls back to static pages
   }
+  return slugs;
 }
 
-const [blogSlugs, trekSlugs, expeditionSlugs] = await Promise.all([
-  fetchSlugs('/blog/posts?limit=500&status=published'),
-  fetchSlugs('/treks?limit=500&status=published'),
-  fetchSlugs('/expeditions?limit=500&status=published'),
-]);
+const { blog: blogSlugs, trek: trekSlugs, expedition: expeditionSlugs } = await fetchSitemapSlugs();
 
 const dynamicPages = [
   ...blogSlugs.map((s) => `https://globaleventstravels.com/blog/${s}/`),
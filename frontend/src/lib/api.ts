@@ -477,6 +477,35 @@ export async function getGoogleReviews(): Promise<GoogleReviewsResponse> {
   return api.get<GoogleReviewsResponse>('/google-reviews');
 }
 
+// ============================================
+// Autocomplete API
+// ============================================
+
+export type AutocompleteType = 'trek' | 'expedition' | 'blog';
+
+export interface AutocompleteSuggestion {
+  type: AutocompleteType;
+  id: number;
+  slug: string;
+  label: string;
+  detail: string;
+}
+
+export const autocompleteApi = {
+  /**
+   * Typeahead suggestions, most popular first (served from memory, cheap per keystroke).
+   * An empty query lists every item by popularity.
+   */
+  async suggest(q: string, types?: AutocompleteType[], limit = 10): Promise<AutocompleteSuggestion[]> {
+    const params = new URLSearchParams({ q, limit: limit.toString() });
+    if (types?.length) params.append('types', types.join(','));
+    const { items } = await api.get<{ query: string; items: AutocompleteSuggestion[] }>(
+      `/autocomplete?${params.toString()}`
+    );
+    return items;
+  },
+};
+
 // ============================================
 // Health Check API
 // ============================================
@@ -702,3 +731,62 @@ export const authApi = new AuthApi();
 // Export the base api object for custom requests
 export { api };
 
+// ============================================
+// Page Bundles API
+// ============================================
+
+export interface TrekPageBundle {
+  trek: Trek;
+  related_treks: Trek[];
+  batches: TrekBatch[];
+  reviews: GoogleReviewsResponse;
+  site_settings: SiteSettingsApiResponse;
+}
+
+/**
+ * Everything the trek detail page renders, in a single round-trip.
+ * Returns null when the trek does not exist.
+ */
+export async function getTrekPage(slug: string): Promise<
+  (Omit<TrekPageBundle, 'site_settings'> & { siteConfig: SiteConfig; socialLinks: SocialLinks }) | null
+> {
+  const response = await fetch(`${API_BASE_URL}/api/v1/pages/trek/${encodeURIComponent(slug)}`);
+  if (response.status === 404) return null;
+  if (!response.ok) throw new Error(`API Error: ${response.status}`);
+  const { site_settings, ...bundle }: TrekPageBundle = await response.json();
+  return { ...bundle, ...siteSettingsToConfig(site_settings) };
+}
+
+export interface HomePageSection {
+  id: number;
+  page: string;
+  key: string;
+  title?: string | null;
+  subtitle?: string | null;
+  body_html?: string | null;
+  badge_text?: string | null;
+  image_url?: string | null;
+  cta_label?: string | null;
+  cta_url?: string | null;
+  display_order: number;
+  is_active: boolean;
+}
+
+export interface HomePageBundle {
+  featured_treks: Trek[];
+  budget_treks: Trek[];
+  expeditions: Expedition[];
+  featured_testimonials: Testimonial[];
+  recent_posts: BlogPost[];
+  sections: HomePageSection[];
+  reviews: GoogleReviewsResponse;
+  site_settings: SiteSettingsApiResponse;
+  generated_at: string;
+}
+
+/**
+ * Everything the homepage renders, served from a precomputed snapshot.
+ */
+export async function getHomePage(): Promise<HomePageBundle> {
+  return api.get<HomePageBundle>('/pages/home');
+}
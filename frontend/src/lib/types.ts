@@ -217,6 +217,8 @@ export interface PaginatedResponse<T> {
   total: number;
   skip: number;
   limit: number;
+  /** Pass as `cursor` to fetch the next page (keyset pagination); null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface ApiError {
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { treksApi } from './api';
+import { autocompleteApi } from './api';
 
 export interface TrekOption {
   value: string;
@@ -23,11 +23,12 @@ export function useTrekOptions(): { trekOptions: TrekOption[]; loading: boolean
     let cancelled = false;
     async function fetchTreks() {
       try {
-        const { items } = await treksApi.list({ status: 'published', limit: 100 });
+        // Names only, from the in-memory autocomplete index (no full trek payloads)
+        const items = await autocompleteApi.suggest('', ['trek'], 100);
         if (cancelled) return;
         const options: TrekOption[] = [
           { value: '', label: 'Select a Trek' },
-          ...items.map((t) => ({ value: t.slug, label: t.name })),
+          ...items.map((t) => ({ value: t.slug, label: t.label })),
           { value: 'custom', label: 'Custom Trek / Not Sure' },
         ];
         setTrekOptions(options);